@@ -56,3 +56,6 @@ git clean -f ${SDK_OUTPUT_PATH}/tox.ini
 
 # Revert the README since it is manually created.
 git checkout ${SDK_OUTPUT_PATH}/README.md
+
+echo "Running post-generation script ..."
+hack/python-sdk/post_gen.py --sdk-v2
@@ -18,6 +18,7 @@
 This script is used for updating generated SDK files.
 """
 
+import argparse
 import fileinput
 import os
 import re
@@ -30,11 +31,27 @@ __replacements = [
 ]
 
 sdk_dir = os.path.abspath(os.path.join(__file__, "../../..", "sdk/python"))
+sdk_v2_dir = os.path.abspath(os.path.join(__file__, "../../..", "sdk_v2"))
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Update generated SDK files.")
+    parser.add_argument(
+        "--sdk-v2",
+        action="store_true",
+        help="Update generated files of the Training V2 SDK.",
+    )
+    args = parser.parse_args()
+
+    if args.sdk_v2:
+        add_slots(os.path.join(sdk_v2_dir, "kubeflow/training/models"))
+        return
+
     fix_test_files()
     add_imports()
+    add_lazy_imports(os.path.join(sdk_dir, "kubeflow/training/__init__.py"))
+    add_lazy_imports(os.path.join(sdk_dir, "kubeflow/training/models/__init__.py"))
+    add_slots(os.path.join(sdk_dir, "kubeflow/training/models"))
 
 
 def fix_test_files() -> None:
@@ -56,6 +73,9 @@ def fix_test_files() -> None:
 def add_imports() -> None:
     with open(os.path.join(sdk_dir, "kubeflow/training/__init__.py"), "a") as f:
         f.write("from kubeflow.training.api.training_client import TrainingClient\n")
+        f.write(
+            "from kubeflow.training.api.async_training_client import AsyncTrainingClient\n"
+        )
         f.write("from kubeflow.training.constants import constants\n")
     with open(os.path.join(sdk_dir, "kubeflow/__init__.py"), "a") as f:
         f.write("__path__ = __import__('pkgutil').extend_path(__path__, __name__)\n")
@@ -73,6 +93,90 @@ def add_imports() -> None:
         f.writelines(new_lines)
 
 
+def add_lazy_imports(init_path: str) -> None:
+    """
+    Replace the model imports in the package __init__ with the module __getattr__,
+    so model modules are imported on the first access instead of the package import.
+    """
+    with open(init_path, "r") as f:
+        content = f.read()
+    if "_MODEL_MODULES" in content:
+        return
+
+    model_import = r"^from (kubeflow\.training\.models\.\w+) import (\w+)\n"
+    modules = re.findall(model_import, content, re.MULTILINE)
+    content = re.sub(model_import, "", content, flags=re.MULTILINE)
+    content = content.replace("# import models into sdk package\n", "")
+    content = content.replace("# import models into model package\n", "")
+
+    modules = "".join(f"    '{name}': '{module}',\n" for module, name in modules)
+    content += f"""
+from importlib import import_module as _import_module
+
+# Models are imported on the first access, so the package import doesn't load
+# every model module.
+_MODEL_MODULES = {{
+{modules}}}
+
+# Training models replace the Kubernetes models with the same name.
+for _name in _MODEL_MODULES:
+    globals().pop(_name, None)
+
+__all__ = [name for name in globals() if not name.startswith('_')] + list(_MODEL_MODULES)
+
+
+def __getattr__(name):
+    if name not in _MODEL_MODULES:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    model = getattr(_import_module(_MODEL_MODULES[name]), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODEL_MODULES))
+"""
+    with open(init_path, "w") as f:
+        f.write(content)
+
+
+def add_slots(models_dir: str) -> None:
+    """
+    Add __slots__ to the generated models, so model objects don't have __dict__.
+    Slots are the private attributes which are set in the model constructor.
+    """
+    for model_file in sorted(os.listdir(models_dir)):
+        if not model_file.endswith(".py") or model_file == "__init__.py":
+            continue
+        print(f"Processing file {model_file}")
+        model_path = os.path.join(models_dir, model_file)
+        with open(model_path, "r") as f:
+            content = f.read()
+        if "__slots__" in content:
+            continue
+
+        init = re.search(
+            r"    def __init__\(.*?(?=\n    (?:@|def ))", content, re.DOTALL
+        )
+        slots = re.findall(
+            r"^        self\.(local_vars_configuration|discriminator|_\w+) = ",
+            init.group(0),
+            re.MULTILINE,
+        )
+        slots = "".join(f"        '{slot}',\n" for slot in dict.fromkeys(slots))
+
+        # Add __slots__ after the attribute_map of the model.
+        content = re.sub(
+            r"(\n    attribute_map = \{.*?\n    \}\n)",
+            lambda match: f"{match.group(1)}\n    __slots__ = (\n{slots}    )\n",
+            content,
+            count=1,
+            flags=re.DOTALL,
+        )
+        with open(model_path, "w") as f:
+            f.write(content)
+
+
 def _apply_regex(input_str: str) -> str:
     for pattern, replacement in __replacements:
         input_str = re.sub(pattern, replacement, input_str)
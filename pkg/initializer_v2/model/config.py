@@ -7,3 +7,6 @@ from typing import Optional
 class HuggingFaceModelInputConfig:
     storage_uri: str
     access_token: Optional[str] = None
+    # Directory of the model cache which is shared across jobs, and its maximum size.
+    cache_dir: Optional[str] = None
+    cache_max_bytes: Optional[str] = None
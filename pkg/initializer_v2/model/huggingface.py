@@ -8,6 +8,7 @@ import pkg.initializer_v2.utils.utils as utils
 # TODO (andreyvelich): This should be moved to SDK V2 constants.
 import sdk.python.kubeflow.storage_initializer.constants as constants
 from pkg.initializer_v2.model.config import HuggingFaceModelInputConfig
+from sdk.python.kubeflow.storage_initializer.model_cache import ModelCache
 
 logging.basicConfig(
     format="%(asctime)s %(levelname)-8s [%(filename)s:%(lineno)d] %(message)s",
@@ -33,15 +34,44 @@ class HuggingFace(utils.ModelProvider):
         if self.config.access_token:
             huggingface_hub.login(self.config.access_token)
 
+        # Model revision is restored from the cache if it is downloaded by other job.
+        revision = None
+        if self.config.cache_dir:
+            cache = ModelCache(
+                self.config.cache_dir,
+                (
+                    int(self.config.cache_max_bytes)
+                    if self.config.cache_max_bytes
+                    else None
+                ),
+            )
+            try:
+                revision = huggingface_hub.HfApi().model_info(model_uri).sha
+            except Exception as e:
+                logging.warning(f"Failed to get revision of {model_uri}: {e}")
+            if revision is not None and cache.get(
+                model_uri, revision, constants.VOLUME_PATH_MODEL
+            ):
+                logging.info(f"Model {model_uri}@{revision} is restored from cache")
+                return
+
         # TODO (andreyvelich): We should consider to follow vLLM approach with allow patterns.
         # Ref: https://github.com/kubeflow/training-operator/pull/2303#discussion_r1815913663
         # TODO (andreyvelich): We should update patterns for Mistral model
         # Ref: https://github.com/kubeflow/training-operator/pull/2303#discussion_r1815914270
         huggingface_hub.snapshot_download(
             repo_id=model_uri,
+            revision=revision,
             local_dir=constants.VOLUME_PATH_MODEL,
             allow_patterns=["*.json", "*.safetensors", "*.model"],
             ignore_patterns=["*.msgpack", "*.h5", "*.bin", ".pt", ".pth"],
         )
 
+        if revision is not None:
+            try:
+                cache.put(model_uri, revision, constants.VOLUME_PATH_MODEL)
+            except OSError as e:
+                # Cache volume can be read-only for the job.
+                logging.warning(f"Failed to add {model_uri} to cache: {e}")
+
         logging.info("Model has been downloaded")
@@ -0,0 +1,109 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare ApiClient, compiled and lazy deserialization of the PyTorchJob list.
+
+Usage: python benchmarks/deserialize_jobs.py --jobs 10000
+"""
+
+import argparse
+import time
+
+from kubeflow.training import ApiClient
+from kubeflow.training.utils import deserializer, utils
+
+
+def generate_job(index: int) -> dict:
+    container = {
+        "name": "pytorch",
+        "image": "docker.io/kubeflow/pytorch-mnist:latest",
+        "args": ["--epochs", "1"],
+        "resources": {"limits": {"cpu": "1", "memory": "1Gi"}},
+    }
+    replica_spec = {
+        "replicas": 1,
+        "restartPolicy": "OnFailure",
+        "template": {"spec": {"containers": [container]}},
+    }
+    return {
+        "apiVersion": "kubeflow.org/v1",
+        "kind": "PyTorchJob",
+        "metadata": {
+            "name": f"job-{index}",
+            "namespace": "default",
+            "labels": {"app": "benchmark"},
+            "creationTimestamp": "2024-01-05T22:58:20Z",
+            "resourceVersion": str(index),
+        },
+        "spec": {
+            "pytorchReplicaSpecs": {"Master": replica_spec, "Worker": replica_spec},
+            "runPolicy": {"cleanPodPolicy": "None"},
+        },
+        "status": {
+            "conditions": [
+                {
+                    "type": "Created",
+                    "status": "True",
+                    "lastTransitionTime": "2024-01-05T22:58:20Z",
+                    "lastUpdateTime": "2024-01-05T22:58:20Z",
+                },
+                {
+                    "type": "Running",
+                    "status": "True",
+                    "lastTransitionTime": "2024-01-05T22:58:30Z",
+                    "lastUpdateTime": "2024-01-05T22:58:30Z",
+                },
+            ],
+            "replicaStatuses": {"Master": {"active": 1}, "Worker": {"active": 1}},
+            "startTime": "2024-01-05T22:58:20Z",
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=10000)
+    args = parser.parse_args()
+
+    items = [generate_job(i) for i in range(args.jobs)]
+    model = "KubeflowOrgV1PyTorchJob"
+
+    api_client = ApiClient()
+    start = time.perf_counter()
+    expected = [
+        api_client.deserialize(utils.FakeResponse(item), model) for item in items
+    ]
+    api_client_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [deserializer.deserialize(item, model) for item in items]
+    compiled_time = time.perf_counter() - start
+
+    # Lazy Jobs are deserialized only for the attributes read by the caller.
+    start = time.perf_counter()
+    lazy = [deserializer.deserialize(item, model, lazy=True) for item in items]
+    [(job.metadata.name, job.status.conditions) for job in lazy]
+    lazy_time = time.perf_counter() - start
+
+    assert actual == expected
+    assert lazy[0] == expected[0]
+    print(f"ApiClient.deserialize: {api_client_time:.3f}s for {args.jobs} Jobs")
+    print(f"Compiled deserializer: {compiled_time:.3f}s for {args.jobs} Jobs")
+    print(f"Lazy deserializer: {lazy_time:.3f}s for {args.jobs} Jobs")
+    print(f"Speedup: {api_client_time / compiled_time:.1f}x")
+    print(f"Lazy speedup: {api_client_time / lazy_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
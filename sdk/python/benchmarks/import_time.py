@@ -0,0 +1,61 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the import time of the Training SDK in the new interpreter.
+
+Usage: python benchmarks/import_time.py --runs 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Kubernetes client is imported by the SDK, so its import time is measured
+# separately to show the time spent in the SDK itself.
+IMPORTS = {
+    "kubernetes.client": "import kubernetes.client",
+    "kubeflow.training": "import kubeflow.training",
+    "TrainingClient()": (
+        "import kubernetes.client; from kubeflow.training import TrainingClient; "
+        "TrainingClient(client_configuration=kubernetes.client.Configuration())"
+    ),
+    "all models": "from kubeflow.training.models import *",
+}
+
+
+def measure(statement: str, runs: int) -> float:
+    """Get the median time of the statement in seconds over the interpreter runs."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - start)"
+    )
+    times = [
+        float(subprocess.check_output([sys.executable, "-c", code]))
+        for _ in range(runs)
+    ]
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, statement in IMPORTS.items():
+        print(f"{name}: {measure(statement, args.runs) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
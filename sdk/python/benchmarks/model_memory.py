@@ -0,0 +1,88 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare memory of the models with __slots__ and with per-instance __dict__.
+
+Usage: python benchmarks/model_memory.py --objects 50000
+"""
+
+import argparse
+import tracemalloc
+from datetime import datetime, timezone
+
+from kubeflow.training import (
+    Configuration,
+    KubeflowOrgV1JobCondition,
+    KubeflowOrgV1ReplicaStatus,
+)
+
+
+def without_slots(model: type) -> type:
+    """Create the copy of the model class that stores attributes in __dict__."""
+    namespace = {
+        key: value
+        for key, value in vars(model).items()
+        if key != "__slots__" and key not in model.__slots__
+    }
+    return type(model.__name__, (object,), namespace)
+
+
+def measure(model: type, kwargs: dict, objects: int) -> int:
+    configuration = Configuration()
+    tracemalloc.start()
+    result = [
+        model(local_vars_configuration=configuration, **kwargs) for _ in range(objects)
+    ]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=50000)
+    args = parser.parse_args()
+
+    timestamp = datetime(2024, 1, 5, 22, 58, 20, tzinfo=timezone.utc)
+    models = [
+        (
+            KubeflowOrgV1JobCondition,
+            {
+                "type": "Running",
+                "status": "True",
+                "reason": "JobRunning",
+                "last_transition_time": timestamp,
+                "last_update_time": timestamp,
+            },
+        ),
+        (KubeflowOrgV1ReplicaStatus, {"active": 1, "succeeded": 0, "failed": 0}),
+    ]
+
+    for model, kwargs in models:
+        # Both representations must produce the same dict.
+        assert model(**kwargs).to_dict() == without_slots(model)(**kwargs).to_dict()
+
+        slots_memory = measure(model, kwargs, args.objects)
+        dict_memory = measure(without_slots(model), kwargs, args.objects)
+        print(
+            f"{model.__name__}: {args.objects} objects use "
+            f"{slots_memory / 2**20:.1f} MiB with __slots__ and "
+            f"{dict_memory / 2**20:.1f} MiB with __dict__ "
+            f"({dict_memory / slots_memory:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
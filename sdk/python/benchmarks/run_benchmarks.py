@@ -0,0 +1,255 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run the latency benchmarks of the Training SDK hot paths and save results as JSON.
+
+The results can be compared with the results of the previous release, and the
+script fails if any benchmark is slower than the baseline by the threshold.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --baseline results.json --threshold 1.25
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List
+
+from deserialize_jobs import generate_job
+from import_time import measure as measure_import
+from kubeflow.training import ApiClient, TrainingClient
+from kubeflow.training.constants import constants
+from kubeflow.training.utils import deserializer, serializer, utils
+from kubernetes import client
+
+JOB_MODEL = "KubeflowOrgV1PyTorchJob"
+JOB_COUNTS = [1, 100, 10000]
+LOG_PODS = 32
+LOG_LINES = 2000
+TEST_NAME = "benchmark"
+TEST_NAMESPACE = "default"
+
+
+def train_func(parameters):
+    """Training function which is converted to the container command."""
+    import torch
+
+    model = torch.nn.Linear(parameters["input"], parameters["output"])
+    optimizer = torch.optim.SGD(model.parameters(), lr=parameters["lr"])
+    for epoch in range(parameters["epochs"]):
+        optimizer.zero_grad()
+        loss = model(torch.randn(8, parameters["input"])).sum()
+        loss.backward()
+        optimizer.step()
+        print(f"epoch={epoch} loss={loss.item()}")
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    """Kubernetes API server with the Job pods, which stream the logs."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        path = self.path.split("?")[0].split("/")
+        # Path: /api/v1/namespaces/<namespace>/pods/<pod>/log
+        if len(path) == 8 and path[-1] == "log":
+            self.send_logs(path[6])
+        # Path: /api/v1/namespaces/<namespace>/pods
+        elif len(path) == 6 and path[-1] == "pods":
+            self.send_pods()
+        else:
+            self.send_error(404)
+
+    def send_pods(self):
+        pods = [
+            {
+                "metadata": {
+                    "name": f"{TEST_NAME}-worker-{i}",
+                    "namespace": TEST_NAMESPACE,
+                },
+                "status": {"phase": "Running"},
+            }
+            for i in range(LOG_PODS)
+        ]
+        body = json.dumps({"items": pods}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_logs(self, pod_name: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        # Logs are sent in small chunks, so the pod streams are interleaved.
+        for start in range(0, LOG_LINES, 100):
+            data = "".join(
+                f"2024-01-05T22:58:20.{i:09d}Z {pod_name} step {i} loss=0.{i}\n"
+                for i in range(start, start + 100)
+            ).encode()
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def measure(func: Callable[[], Any], runs: int) -> List[float]:
+    """Get the time of every run in seconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def get_benchmarks(training_client: TrainingClient) -> Dict[str, Callable[[], Any]]:
+    """Get the benchmarks as functions which are measured."""
+    benchmarks = {}
+
+    api_client = ApiClient()
+    for count in JOB_COUNTS:
+        job_list = {"items": [generate_job(i) for i in range(count)]}
+        items = job_list["items"]
+        benchmarks[f"api_client_deserialize_{count}"] = (
+            lambda job_list=job_list: api_client.deserialize(
+                utils.FakeResponse(job_list), f"{JOB_MODEL}List"
+            )
+        )
+        benchmarks[f"deserializer_deserialize_{count}"] = (
+            lambda items=items: deserializer.deserialize(items, f"list[{JOB_MODEL}]")
+        )
+
+    jobs = deserializer.deserialize(
+        [generate_job(i) for i in range(100)], f"list[{JOB_MODEL}]"
+    )
+    kubernetes_api_client = client.ApiClient()
+    benchmarks["api_client_sanitize_for_serialization_100"] = lambda: [
+        kubernetes_api_client.sanitize_for_serialization(job) for job in jobs
+    ]
+    benchmarks["serializer_serialize_100"] = lambda: [
+        serializer.serialize(job) for job in jobs
+    ]
+
+    parameters = {"input": 16, "output": 4, "lr": 0.01, "epochs": 10}
+    benchmarks["get_command_using_train_func"] = (
+        lambda: utils.get_command_using_train_func(
+            train_func,
+            constants.ENTRYPOINT_TORCH,
+            train_func_parameters=parameters,
+            packages_to_install=["torch", "numpy"],
+        )
+    )
+
+    # Logs of all pods are read from the fake API server.
+    benchmarks[f"get_job_logs_{LOG_PODS}x{LOG_LINES}"] = (
+        lambda: training_client.get_job_logs(TEST_NAME, is_master=False)
+    )
+    benchmarks[f"stream_job_logs_follow_{LOG_PODS}x{LOG_LINES}"] = lambda: sum(
+        1
+        for _ in training_client.stream_job_logs(
+            TEST_NAME, is_master=False, follow=True
+        )
+    )
+    return benchmarks
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> bool:
+    """Print the difference with the baseline and check the regressions."""
+    passed = True
+    for name, result in results["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        ratio = result["median"] / baseline["benchmarks"][name]["median"]
+        regression = ratio > threshold
+        passed = passed and not regression
+        print(f"{name}: {ratio:.2f}x baseline{' REGRESSION' if regression else ''}")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-runs", type=int, default=10)
+    parser.add_argument(
+        "--filter", default="", help="Run benchmarks with the substring"
+    )
+    parser.add_argument("--output", help="Path to the JSON file with results")
+    parser.add_argument(
+        "--baseline", help="Path to the JSON file with baseline results"
+    )
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeApiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    training_client = TrainingClient(
+        client_configuration=client.Configuration(
+            host=f"http://127.0.0.1:{server.server_address[1]}"
+        ),
+        namespace=TEST_NAMESPACE,
+    )
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": {},
+    }
+    timings = {}
+    if args.filter in "import_kubeflow_training":
+        # Import is measured in the new interpreter for every run.
+        timings["import_kubeflow_training"] = [
+            measure_import("import kubeflow.training", 1)
+            for _ in range(args.import_runs)
+        ]
+    for name, func in get_benchmarks(training_client).items():
+        if args.filter in name:
+            # The first run warms up the caches, e.g. compiled deserializers.
+            func()
+            timings[name] = measure(func, args.runs)
+    server.shutdown()
+    server.server_close()
+
+    for name, times in timings.items():
+        results["benchmarks"][name] = {
+            "median": statistics.median(times),
+            "min": min(times),
+            "max": max(times),
+            "runs": len(times),
+        }
+        print(f"{name}: {statistics.median(times) * 1000:.2f}ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
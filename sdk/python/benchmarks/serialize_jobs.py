@@ -0,0 +1,74 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare serialization of the PyTorchJob request bodies.
+
+Usage: python benchmarks/serialize_jobs.py --jobs 10000
+"""
+
+import argparse
+import copy
+import json
+import time
+
+from deserialize_jobs import generate_job
+from kubeflow.training.utils import deserializer, serializer
+from kubernetes import client
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=10000)
+    args = parser.parse_args()
+
+    template = generate_job(0)
+    del template["status"]
+    jobs = [
+        deserializer.deserialize(generate_job(i), "KubeflowOrgV1PyTorchJob")
+        for i in range(args.jobs)
+    ]
+
+    # Request body is serialized by the API client and encoded by the REST client.
+    api_client = client.ApiClient()
+    start = time.perf_counter()
+    expected = [json.dumps(api_client.sanitize_for_serialization(j)) for j in jobs]
+    api_client_time = time.perf_counter() - start
+
+    kubernetes_api_client = serializer.KubernetesApiClient()
+    start = time.perf_counter()
+    actual = [
+        json.dumps(kubernetes_api_client.sanitize_for_serialization(j)) for j in jobs
+    ]
+    serializer_time = time.perf_counter() - start
+
+    # Jobs are created from the serialized template with the new names.
+    start = time.perf_counter()
+    for i in range(args.jobs):
+        body = copy.deepcopy(template)
+        body["metadata"]["name"] = f"job-{i}"
+        json.dumps(
+            kubernetes_api_client.sanitize_for_serialization(
+                serializer.SerializedObject(body)
+            )
+        )
+    template_time = time.perf_counter() - start
+
+    assert actual == expected
+    print(f"ApiClient.sanitize_for_serialization: {api_client_time:.3f}s")
+    print(f"Serializer: {serializer_time:.3f}s")
+    print(f"Serialized template: {template_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,9 @@
 INIT_CONTAINER_MOUNT_PATH = "/workspace"
 VOLUME_PATH_DATASET = INIT_CONTAINER_MOUNT_PATH + "/dataset"
 VOLUME_PATH_MODEL = INIT_CONTAINER_MOUNT_PATH + "/model"
+
+# Manifest of the downloaded files in the dataset or model directory.
+MANIFEST_FILE = ".manifest.json"
+
+# File with the RANK and WORLD_SIZE if the dataset directory has only the rank shard.
+SHARD_FILE = ".shard.json"
@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 from dataclasses import dataclass, field
 from typing import Optional, Union
 from urllib.parse import urlparse
@@ -9,7 +10,9 @@ from peft import LoraConfig
 
 from .abstract_dataset_provider import datasetProvider
 from .abstract_model_provider import modelProvider
-from .constants import VOLUME_PATH_DATASET, VOLUME_PATH_MODEL
+from .constants import MANIFEST_FILE, VOLUME_PATH_DATASET, VOLUME_PATH_MODEL
+from .manifest import Manifest, sha256sum
+from .model_cache import ModelCache
 
 TRANSFORMER_TYPES = Union[
     transformers.AutoModelForSequenceClassification,
@@ -38,6 +41,9 @@ class HuggingFaceModelParams:
     transformer_type: TRANSFORMER_TYPES
     access_token: str = None
     num_labels: Optional[int] = None
+    # Directory of the model cache which is shared across jobs, and its maximum size.
+    cache_dir: Optional[str] = None
+    cache_max_bytes: Optional[int] = None
 
     def __post_init__(self):
         # Custom checks or validations can be added here
@@ -65,16 +71,45 @@ class HuggingFace(modelProvider):
         transformer_type_class = getattr(transformers, self.config.transformer_type)
         parsed_uri = urlparse(self.config.model_uri)
         self.model = parsed_uri.netloc + parsed_uri.path
+
+        # Model revision is restored from the cache if it is downloaded by other job.
+        revision = None
+        if self.config.cache_dir:
+            import huggingface_hub
+
+            cache = ModelCache(self.config.cache_dir, self.config.cache_max_bytes)
+            try:
+                revision = (
+                    huggingface_hub.HfApi()
+                    .model_info(self.model, token=self.config.access_token)
+                    .sha
+                )
+            except Exception as e:
+                logger.warning(f"Failed to get revision of {self.model}: {e}")
+            if revision is not None and cache.get(
+                self.model, revision, VOLUME_PATH_MODEL
+            ):
+                logger.info(f"Model {self.model}@{revision} is restored from cache")
+                return
+
         transformer_type_class.from_pretrained(
             self.model,
             token=self.config.access_token,
             cache_dir=VOLUME_PATH_MODEL,
             trust_remote_code=True,
+            revision=revision,
         )
         transformers.AutoTokenizer.from_pretrained(
-            self.model, cache_dir=VOLUME_PATH_MODEL
+            self.model, cache_dir=VOLUME_PATH_MODEL, revision=revision
         )
 
+        if revision is not None:
+            try:
+                cache.put(self.model, revision, VOLUME_PATH_MODEL)
+            except OSError as e:
+                # Cache volume can be read-only for the job.
+                logger.warning(f"Failed to add {self.model} to cache: {e}")
+
 
 @dataclass
 class HuggingFaceDatasetParams:
@@ -102,6 +137,37 @@ class HuggingFaceDataset(datasetProvider):
         if self.config.access_token:
             huggingface_hub.login(self.config.access_token)
 
+        # Dataset is downloaded again only if the dataset revision is changed.
+        try:
+            revision = huggingface_hub.HfApi().dataset_info(self.config.repo_id).sha
+        except Exception as e:
+            logger.warning(f"Failed to get revision of {self.config.repo_id}: {e}")
+            revision = None
+        manifest = Manifest(
+            VOLUME_PATH_DATASET,
+            source={
+                "repo_id": self.config.repo_id,
+                "split": self.config.split,
+                "revision": revision,
+            },
+        )
+        if revision is not None and manifest.is_complete():
+            logger.info(f"Dataset {self.config.repo_id}@{revision} is up to date")
+            return
+
         # Load dataset and save to disk.
-        dataset = load_dataset(self.config.repo_id, split=self.config.split)
+        dataset = load_dataset(
+            self.config.repo_id, split=self.config.split, revision=revision
+        )
         dataset.save_to_disk(VOLUME_PATH_DATASET)
+
+        for root, _, files in os.walk(VOLUME_PATH_DATASET):
+            for file in files:
+                path = os.path.join(root, file)
+                if file != MANIFEST_FILE:
+                    manifest.update(
+                        os.path.relpath(path, VOLUME_PATH_DATASET),
+                        size=os.path.getsize(path),
+                        sha256=sha256sum(path),
+                    )
+        manifest.save()
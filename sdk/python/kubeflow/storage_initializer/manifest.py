@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from .constants import MANIFEST_FILE
+
+# Size of the blocks to compute file checksums.
+READ_SIZE = 1024 * 1024
+
+
+def sha256sum(path: str) -> str:
+    """Compute SHA256 checksum of the file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(READ_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Manifest:
+    """Manifest of the files which are downloaded to the directory.
+
+    Every file is recorded with its source ETag, size, and SHA256 checksum once it
+    is downloaded, so the download can skip files which are not changed. Files
+    which are partially downloaded have no checksum, but keep the indices of
+    the downloaded parts, so the download can be resumed.
+
+    Manifest is reset if the source (e.g. S3 bucket and prefix) is changed.
+    """
+
+    def __init__(self, directory: str, source: Dict[str, Any]):
+        self.directory = directory
+        self.path = os.path.join(directory, MANIFEST_FILE)
+        self.source = source
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        self.save_time = 0.0
+
+        if os.path.exists(self.path):
+            try:
+                with open(self.path) as f:
+                    manifest = json.load(f)
+                if manifest.get("source") == source:
+                    self.files = manifest.get("files", {})
+            except ValueError:
+                # Manifest is corrupted, so all files are downloaded again.
+                pass
+
+    def is_current(
+        self,
+        path: str,
+        etag: Optional[str] = None,
+        size: Optional[int] = None,
+        verify_checksum: bool = False,
+    ) -> bool:
+        """Check if the file is completely downloaded and not changed in the source.
+
+        Args:
+            path: File path relative to the manifest directory.
+            etag: Optional, ETag of the file in the source.
+            size: Optional, size of the file in the source.
+            verify_checksum: Whether to compare the SHA256 checksum of the local file.
+        """
+        entry = self.files.get(path)
+        if entry is None or entry.get("sha256") is None:
+            return False
+        if etag is not None and entry.get("etag") != etag:
+            return False
+        if size is not None and entry.get("size") != size:
+            return False
+
+        local_path = os.path.join(self.directory, path)
+        if (
+            not os.path.isfile(local_path)
+            or os.path.getsize(local_path) != entry["size"]
+        ):
+            return False
+        return not verify_checksum or sha256sum(local_path) == entry["sha256"]
+
+    def is_complete(self, verify_checksum: bool = False) -> bool:
+        """Check if all files in the manifest are downloaded and not changed."""
+        return bool(self.files) and all(
+            self.is_current(path, verify_checksum=verify_checksum)
+            for path in self.files
+        )
+
+    def update(self, path: str, **entry: Any):
+        """Set the file entry. Entry without checksum is partially downloaded."""
+        with self.lock:
+            self.files[path] = entry
+
+    def add_part(self, path: str, index: int):
+        """Record the downloaded part of the partially downloaded file."""
+        with self.lock:
+            self.files[path].setdefault("parts", []).append(index)
+
+    def save(self, interval: float = 0):
+        """Save the manifest. Manifest is written to the temporary file and renamed,
+        so it is not corrupted if the download is interrupted.
+
+        Args:
+            interval: Minimum time in seconds since the last save. It allows to save
+                the manifest after every file without the overhead for small files.
+        """
+        with self.lock:
+            now = time.monotonic()
+            if now - self.save_time < interval:
+                return
+            self.save_time = now
+            data = json.dumps({"source": self.source, "files": self.files})
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.path + ".tmp", "w") as f:
+                f.write(data)
+            os.replace(self.path + ".tmp", self.path)
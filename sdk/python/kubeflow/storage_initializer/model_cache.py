@@ -0,0 +1,203 @@
+import fcntl
+import json
+import logging
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from .manifest import sha256sum
+
+# Configure logger.
+log_formatter = logging.Formatter(
+    "%(asctime)s %(levelname)-8s %(message)s", "%Y-%m-%dT%H:%M:%SZ"
+)
+logger = logging.getLogger(__file__)
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(log_formatter)
+logger.addHandler(console_handler)
+logger.setLevel(logging.INFO)
+
+LOCK_FILE = ".lock"
+
+
+class ModelCache:
+    """Content-addressed cache of the model files which is shared across jobs.
+
+    The cache is stored in the directory on the shared volume (e.g. ReadWriteMany
+    or ReadOnlyMany PVC, or node-local hostPath) with the following layout:
+
+    - `blobs/<sha256>`: Model files by their SHA256 checksum, so the same files
+      are stored once for all models and revisions.
+    - `models/<repo_id>/<revision>.json`: Files of the model revision. Access time
+      of the model is the modification time of this file.
+
+    Files are hard-linked from the cache to the model directory if both are on the
+    same filesystem, and copied otherwise, so model files must not be modified in
+    place. Once the cache exceeds the maximum size, the least recently used models
+    are evicted. Evicted blobs are not removed from the model directories which
+    hard-link them.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: Optional[int] = None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.blobs_dir = os.path.join(cache_dir, "blobs")
+        self.models_dir = os.path.join(cache_dir, "models")
+
+    def get(self, repo_id: str, revision: str, target_dir: str) -> bool:
+        """Restore the model revision from the cache to the target directory.
+
+        Args:
+            repo_id: Model repository, e.g. "google-bert/bert-base-cased".
+            revision: Commit SHA of the model revision.
+            target_dir: Directory where the model files are restored.
+
+        Returns:
+            bool: Whether the model revision is restored from the cache.
+        """
+        entry_path = self._get_entry_path(repo_id, revision)
+        with self._lock(exclusive=False):
+            try:
+                with open(entry_path) as f:
+                    files = json.load(f)["files"]
+            except (OSError, ValueError, KeyError):
+                return False
+            blobs = [f["sha256"] for f in files.values() if "sha256" in f]
+            if not all(os.path.isfile(self._get_blob_path(b)) for b in blobs):
+                return False
+
+            for path, file in files.items():
+                target_path = os.path.join(target_dir, path)
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                if os.path.lexists(target_path):
+                    os.remove(target_path)
+                if "symlink" in file:
+                    os.symlink(file["symlink"], target_path)
+                else:
+                    link_or_copy(self._get_blob_path(file["sha256"]), target_path)
+
+        try:
+            # Access time is updated for the LRU eviction.
+            os.utime(entry_path)
+        except OSError:
+            # Cache volume is read-only.
+            pass
+        return True
+
+    def put(self, repo_id: str, revision: str, source_dir: str):
+        """Add files of the model revision from the source directory to the cache,
+        and evict the least recently used models if the cache exceeds the size.
+
+        Args:
+            repo_id: Model repository, e.g. "google-bert/bert-base-cased".
+            revision: Commit SHA of the model revision.
+            source_dir: Directory with the downloaded model files.
+        """
+        # Checksums are computed before the cache is locked.
+        files: Dict[str, Dict[str, Any]] = {}
+        for root, _, file_names in os.walk(source_dir):
+            for file_name in file_names:
+                source_path = os.path.join(root, file_name)
+                path = os.path.relpath(source_path, source_dir)
+                if os.path.islink(source_path):
+                    files[path] = {"symlink": os.readlink(source_path)}
+                elif os.path.isfile(source_path):
+                    files[path] = {
+                        "sha256": sha256sum(source_path),
+                        "size": os.path.getsize(source_path),
+                    }
+
+        with self._lock(exclusive=True):
+            os.makedirs(self.blobs_dir, exist_ok=True)
+            for path, file in files.items():
+                if "sha256" not in file:
+                    continue
+                blob_path = self._get_blob_path(file["sha256"])
+                if not os.path.exists(blob_path):
+                    # Blob is renamed, so other jobs never read the partial blob.
+                    tmp_path = f"{blob_path}.{uuid.uuid4().hex}.tmp"
+                    link_or_copy(os.path.join(source_dir, path), tmp_path)
+                    os.replace(tmp_path, blob_path)
+
+            entry_path = self._get_entry_path(repo_id, revision)
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            with open(entry_path + ".tmp", "w") as f:
+                json.dump({"repo_id": repo_id, "revision": revision, "files": files}, f)
+            os.replace(entry_path + ".tmp", entry_path)
+            self._evict(keep=entry_path)
+
+    def _evict(self, keep: str):
+        """Remove the least recently used models and their blobs which are not used
+        by other models until the cache fits the maximum size. The cache must be
+        locked.
+        """
+        if self.max_bytes is None:
+            return
+        entries = {}
+        for root, _, file_names in os.walk(self.models_dir):
+            for file_name in file_names:
+                if file_name.endswith(".json"):
+                    entry_path = os.path.join(root, file_name)
+                    with open(entry_path) as f:
+                        entries[entry_path] = json.load(f)["files"]
+
+        blob_sizes = {}
+        for files in entries.values():
+            for file in files.values():
+                if "sha256" in file:
+                    blob_sizes[file["sha256"]] = file["size"]
+        total_bytes = sum(blob_sizes.values())
+
+        # The most recently added model is kept even if it exceeds the size.
+        lru_entries = sorted((p for p in entries if p != keep), key=os.path.getmtime)
+        for entry_path in lru_entries:
+            if total_bytes <= self.max_bytes:
+                break
+            logger.info(f"Evicting {os.path.relpath(entry_path, self.models_dir)}")
+            os.remove(entry_path)
+            files = entries.pop(entry_path)
+            used_blobs = {
+                file["sha256"]
+                for other_files in entries.values()
+                for file in other_files.values()
+                if "sha256" in file
+            }
+            for file in files.values():
+                blob = file.get("sha256")
+                if blob is not None and blob not in used_blobs and blob in blob_sizes:
+                    os.remove(self._get_blob_path(blob))
+                    total_bytes -= blob_sizes.pop(blob)
+
+    def _get_entry_path(self, repo_id: str, revision: str) -> str:
+        return os.path.join(self.models_dir, repo_id, f"{revision}.json")
+
+    def _get_blob_path(self, blob: str) -> str:
+        return os.path.join(self.blobs_dir, blob)
+
+    @contextmanager
+    def _lock(self, exclusive: bool):
+        """Lock the cache for all jobs which share the cache volume."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd = os.open(
+                os.path.join(self.cache_dir, LOCK_FILE), os.O_RDONLY | os.O_CREAT
+            )
+        except OSError:
+            # Read-only cache without the lock file is not modified by other jobs.
+            yield
+            return
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)
+
+
+def link_or_copy(source_path: str, target_path: str):
+    """Hard-link the file, or copy it if the paths are on different filesystems."""
+    try:
+        os.link(source_path, target_path)
+    except OSError:
+        shutil.copyfile(source_path, target_path)
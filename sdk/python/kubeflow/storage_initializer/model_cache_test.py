@@ -0,0 +1,64 @@
+import os
+
+from kubeflow.storage_initializer.model_cache import ModelCache
+
+TEST_REPO = "google-bert/bert-base-cased"
+
+
+def create_model(model_dir, files):
+    for path, data in files.items():
+        os.makedirs(os.path.dirname(model_dir / path), exist_ok=True)
+        (model_dir / path).write_bytes(data)
+
+
+def test_model_cache(tmp_path):
+    """
+    test model files are restored from cache with the hard links
+    """
+    cache = ModelCache(str(tmp_path / "cache"))
+    create_model(
+        tmp_path / "model",
+        {"config.json": b"{}", "blobs/abc": b"weights", "blobs/def": b"weights"},
+    )
+    os.symlink("blobs/abc", tmp_path / "model" / "model.safetensors")
+
+    assert not cache.get(TEST_REPO, "rev1", str(tmp_path / "job"))
+    cache.put(TEST_REPO, "rev1", str(tmp_path / "model"))
+    # Files with the same content are stored once.
+    assert len(os.listdir(tmp_path / "cache" / "blobs")) == 2
+
+    assert cache.get(TEST_REPO, "rev1", str(tmp_path / "job"))
+    assert (tmp_path / "job" / "config.json").read_bytes() == b"{}"
+    assert (tmp_path / "job" / "blobs" / "def").read_bytes() == b"weights"
+    assert os.readlink(tmp_path / "job" / "model.safetensors") == "blobs/abc"
+    assert (tmp_path / "job" / "model.safetensors").read_bytes() == b"weights"
+    assert os.stat(tmp_path / "job" / "config.json").st_nlink > 1
+
+    assert not cache.get(TEST_REPO, "rev2", str(tmp_path / "job"))
+
+
+def test_model_cache_eviction(tmp_path):
+    """
+    test least recently used models are evicted once cache exceeds the size
+    """
+    cache = ModelCache(str(tmp_path / "cache"), max_bytes=25)
+    for revision, data in [("rev1", b"a" * 10), ("rev2", b"b" * 10)]:
+        create_model(
+            tmp_path / revision, {"model.safetensors": data, "config.json": b"{}"}
+        )
+        cache.put(TEST_REPO, revision, str(tmp_path / revision))
+    os.utime(tmp_path / "cache" / "models" / TEST_REPO / "rev2.json", (0, 0))
+    assert cache.get(TEST_REPO, "rev1", str(tmp_path / "job"))
+
+    create_model(
+        tmp_path / "rev3", {"model.safetensors": b"c" * 10, "config.json": b"{}"}
+    )
+    cache.put(TEST_REPO, "rev3", str(tmp_path / "rev3"))
+
+    # The least recently used rev2 is evicted, and the shared config is kept.
+    assert not cache.get(TEST_REPO, "rev2", str(tmp_path / "job"))
+    assert cache.get(TEST_REPO, "rev1", str(tmp_path / "job"))
+    assert cache.get(TEST_REPO, "rev3", str(tmp_path / "job"))
+    assert len(os.listdir(tmp_path / "cache" / "blobs")) == 3
+    # Evicted files are kept in the model directories.
+    assert (tmp_path / "rev2" / "model.safetensors").read_bytes() == b"b" * 10
@@ -1,10 +1,39 @@
+import fnmatch
 import json
+import logging
 import os
-from dataclasses import dataclass
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from .abstract_dataset_provider import datasetProvider
-from .constants import VOLUME_PATH_DATASET
+from .constants import SHARD_FILE, VOLUME_PATH_DATASET
+from .manifest import Manifest, sha256sum
+
+# Configure logger.
+log_formatter = logging.Formatter(
+    "%(asctime)s %(levelname)-8s %(message)s", "%Y-%m-%dT%H:%M:%SZ"
+)
+logger = logging.getLogger(__file__)
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(log_formatter)
+logger.addHandler(console_handler)
+logger.setLevel(logging.INFO)
+
+MB = 1024 * 1024
+
+# Size of the blocks which are read from the S3 response stream.
+READ_SIZE = 256 * 1024
+
+# Minimum time in seconds between the manifest saves.
+MANIFEST_SAVE_INTERVAL = 5
+
+# Suffix of the partially downloaded files.
+PARTIAL_SUFFIX = ".partial"
 
 
 @dataclass
@@ -15,6 +44,29 @@ class S3DatasetParams:
     region_name: str = None
     access_key: str = None
     secret_key: str = None
+    # Number of concurrent requests for all objects and object parts.
+    max_workers: int = 16
+    # Objects larger than the threshold are downloaded with the ranged GETs.
+    multipart_threshold: int = 64 * MB
+    multipart_chunksize: int = 16 * MB
+    # Maximum total download throughput in bytes per second.
+    max_bandwidth: Optional[int] = None
+    # Whether to compare checksums of the downloaded files with the manifest.
+    verify_checksums: bool = False
+    # Unix shell-style patterns of the file paths relative to the file_key prefix,
+    # e.g. "train/*.arrow". Files are downloaded if they match any include pattern
+    # and don't match exclude patterns.
+    include: List[str] = field(default_factory=list)
+    exclude: List[str] = field(default_factory=list)
+    # Maximum total size in bytes of the downloaded files.
+    max_bytes: Optional[int] = None
+    # Whether to download only the shard of the dataset for the RANK out of WORLD_SIZE.
+    # Files matching shard patterns in every split directory (e.g. "train") are split
+    # across ranks, and other files (e.g. dataset metadata) are downloaded by every
+    # rank. The dataset `state.json` files are updated for the downloaded files, and
+    # the trainer doesn't split the dataset again.
+    shard_by_rank: bool = False
+    shard_patterns: List[str] = field(default_factory=lambda: ["*.arrow", "*.parquet"])
 
     def is_valid_url(self, url):
         try:
@@ -33,6 +85,94 @@ class S3DatasetParams:
         ):
             raise ValueError("bucket_name or endpoint_url or file_key is None")
         self.is_valid_url(self.endpoint_url)
+        if self.max_workers < 1:
+            raise ValueError("max_workers must be greater than 0")
+        if self.multipart_threshold < 1 or self.multipart_chunksize < 1:
+            raise ValueError(
+                "multipart_threshold and multipart_chunksize must be greater than 0"
+            )
+        if self.max_bandwidth is not None and self.max_bandwidth < 1:
+            raise ValueError("max_bandwidth must be greater than 0")
+        if self.max_bytes is not None and self.max_bytes < 0:
+            raise ValueError("max_bytes must be greater than or equal to 0")
+
+
+def matches(path: str, patterns: List[str]) -> bool:
+    """Check if the path matches any of the Unix shell-style patterns."""
+    return any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)
+
+
+def get_shard(items: List[Any], rank: int, world_size: int) -> List[Any]:
+    """Get the contiguous shard of the items for the rank. Items are split in the
+    same way as `split_dataset_by_node` splits the dataset rows.
+    """
+    if not 0 <= rank < world_size:
+        raise ValueError(f"RANK: {rank} must be in range [0, WORLD_SIZE: {world_size})")
+    div, mod = divmod(len(items), world_size)
+    start = div * rank + min(rank, mod)
+    end = start + div + (1 if rank < mod else 0)
+    return items[start:end]
+
+
+class BandwidthLimiter:
+    """Token bucket which limits the total throughput of all download threads."""
+
+    def __init__(self, max_bandwidth: Optional[int]):
+        self.max_bandwidth = max_bandwidth
+        self.next_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, amount: int):
+        """Wait until the amount of bytes can be read within the bandwidth."""
+        if self.max_bandwidth is None:
+            return
+        with self.lock:
+            now = time.monotonic()
+            # Unused bandwidth is not accumulated for more than one second.
+            self.next_time = max(self.next_time, now - 1)
+            self.next_time += amount / self.max_bandwidth
+            delay = self.next_time - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class DownloadProgress:
+    """Progress of the S3 downloads which reports the total download throughput."""
+
+    def __init__(self, files: int, total_bytes: int, report_interval: float = 10):
+        self.files = files
+        self.total_bytes = total_bytes
+        self.report_interval = report_interval
+        self.downloaded_bytes = 0
+        self.downloaded_files = 0
+        self.start_time = time.monotonic()
+        self.report_time = self.start_time
+        self.lock = threading.Lock()
+
+    def add_bytes(self, amount: int):
+        with self.lock:
+            self.downloaded_bytes += amount
+            now = time.monotonic()
+            if now - self.report_time < self.report_interval:
+                return
+            self.report_time = now
+        self.report()
+
+    def add_file(self):
+        with self.lock:
+            self.downloaded_files += 1
+
+    def throughput(self) -> float:
+        """Get the average download throughput in MB/s."""
+        elapsed = max(time.monotonic() - self.start_time, 1e-9)
+        return self.downloaded_bytes / MB / elapsed
+
+    def report(self):
+        logger.info(
+            f"Downloaded {self.downloaded_files}/{self.files} files, "
+            f"{self.downloaded_bytes / MB:.1f}/{self.total_bytes / MB:.1f} MB "
+            f"at {self.throughput():.1f} MB/s"
+        )
 
 
 class S3(datasetProvider):
@@ -41,6 +181,7 @@ class S3(datasetProvider):
 
     def download_dataset(self):
         import boto3
+        from botocore.config import Config
 
         # Create an S3 client for Nutanix Object Store/S3
         s3_client = boto3.Session(
@@ -48,26 +189,298 @@ class S3(datasetProvider):
             aws_secret_access_key=self.config.secret_key,
             region_name=self.config.region_name,
         )
-        s3_resource = s3_client.resource("s3", endpoint_url=self.config.endpoint_url)
-        # Get the bucket object
-        bucket = s3_resource.Bucket(self.config.bucket_name)
-
-        # Filter objects with the specified prefix
-        objects = bucket.objects.filter(Prefix=self.config.file_key)
-        # Iterate over filtered objects
-        for obj in objects:
-            # Extract the object key (filename)
-            obj_key = obj.key
-            path_components = obj_key.split(os.path.sep)
-            path_excluded_first_last_parts = os.path.sep.join(path_components[1:-1])
+        # Connection pool must fit all concurrent requests.
+        self.client = s3_client.client(
+            "s3",
+            endpoint_url=self.config.endpoint_url,
+            config=Config(max_pool_connections=self.config.max_workers),
+        )
+        # Number of parts which are not downloaded yet for every file.
+        self.remaining_parts: Dict[str, int] = {}
+        # Files of the rank shard in every split directory.
+        self.shard_files: Dict[str, List[str]] = {}
+        self.lock = threading.Lock()
+
+        manifest = Manifest(
+            VOLUME_PATH_DATASET,
+            source={
+                "endpoint_url": self.config.endpoint_url,
+                "bucket_name": self.config.bucket_name,
+                "file_key": self.config.file_key,
+            },
+        )
+
+        # Get the parts of the objects which are changed or missing on disk.
+        objects = self._select_objects(self._list_objects())
+        parts = []
+        # Files which parts are all downloaded by the previous run are only renamed.
+        downloaded = []
+        for obj_key, path, etag, size in objects:
+            if not manifest.is_current(path, etag, size, self.config.verify_checksums):
+                file_parts = self._prepare_download(manifest, obj_key, path, etag, size)
+                if file_parts:
+                    parts += file_parts
+                else:
+                    downloaded.append((path, etag))
+
+        logger.info(
+            f"Downloading {len(self.remaining_parts)} files, "
+            f"{len(objects) - len(self.remaining_parts)} files are up to date"
+        )
+        progress = DownloadProgress(
+            len(self.remaining_parts), sum(end - start for *_, start, end in parts)
+        )
+        limiter = BandwidthLimiter(self.config.max_bandwidth)
+
+        # Running parts are stopped if the download fails or the process is terminated.
+        self.stopped = threading.Event()
+        sigterm_handler = None
+        if threading.current_thread() is threading.main_thread():
+            sigterm_handler = signal.signal(signal.SIGTERM, self._handle_sigterm)
+
+        # Parts of all objects are downloaded concurrently, and the first error
+        # cancels the remaining parts.
+        executor = ThreadPoolExecutor(max_workers=self.config.max_workers)
+        try:
+            for path, etag in downloaded:
+                self._finalize_download(manifest, progress, path, etag)
+            futures = [
+                executor.submit(self._download_part, manifest, progress, limiter, *part)
+                for part in parts
+            ]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception() is not None:
+                    raise future.exception()
+        finally:
+            self.stopped.set()
+            executor.shutdown(cancel_futures=True)
+            # Downloaded parts are recorded, so the next run resumes the download.
+            manifest.save()
+            if sigterm_handler is not None:
+                signal.signal(signal.SIGTERM, sigterm_handler)
+
+        self._write_shard_state()
+        progress.report()
+        print("Files downloaded")
+
+    def _list_objects(self) -> List[Tuple[str, str, int]]:
+        """List key, ETag, and size of the objects with the specified prefix."""
+        objects = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.config.bucket_name, Prefix=self.config.file_key
+        ):
+            for obj in page.get("Contents", []):
+                # Skip the directory markers.
+                if not obj["Key"].endswith("/"):
+                    objects.append((obj["Key"], obj["ETag"], obj["Size"]))
+        return objects
+
+    def _select_objects(
+        self, objects: List[Tuple[str, str, int]]
+    ) -> List[Tuple[str, str, str, int]]:
+        """Select the objects to download with the include and exclude patterns,
+        the rank shard, and the size budget.
+
+        Returns:
+            list[tuple]: Key, file path, ETag, and size of the selected objects.
+        """
+        selected = []
+        for obj_key, etag, size in objects:
+            # Object key without the first path component is the file path.
+            path = "/".join(obj_key.split("/")[1:]) or obj_key
+            if self.config.include and not matches(path, self.config.include):
+                continue
+            if matches(path, self.config.exclude):
+                continue
+            selected.append((obj_key, path, etag, size))
+
+        if self.config.shard_by_rank:
+            try:
+                rank = int(os.environ["RANK"])
+                world_size = int(os.environ["WORLD_SIZE"])
+            except (KeyError, ValueError) as e:
+                raise ValueError(
+                    "RANK and WORLD_SIZE environment variables must be set to shard "
+                    "the dataset by rank"
+                ) from e
+            self.rank, self.world_size = rank, world_size
+
+            # Files of every split directory are split separately, so every rank
+            # gets the shard of each split (e.g. "train" and "eval").
+            splits: Dict[str, List[Tuple[str, str, str, int]]] = {}
+            for obj in selected:
+                if matches(obj[1], self.config.shard_patterns):
+                    splits.setdefault(os.path.dirname(obj[1]), []).append(obj)
+            shard = set()
+            for split, split_objects in splits.items():
+                if len(split_objects) < world_size:
+                    raise ValueError(
+                        f"Split {split or '.'} has {len(split_objects)} files, which is "
+                        f"less than WORLD_SIZE: {world_size}. Save the dataset with "
+                        "more shards to split it by rank."
+                    )
+                split_shard = get_shard(split_objects, rank, world_size)
+                self.shard_files[split] = [os.path.basename(o[1]) for o in split_shard]
+                shard.update(split_shard)
+            selected = [
+                o
+                for o in selected
+                if o in shard or not matches(o[1], self.config.shard_patterns)
+            ]
+            logger.info(
+                f"Downloading {len(shard)}/{sum(map(len, splits.values()))} shards "
+                f"for RANK: {rank}, WORLD_SIZE: {world_size}"
+            )
 
+        if self.config.max_bytes is not None:
+            total_bytes = 0
+            for i, (*_, size) in enumerate(selected):
+                if total_bytes + size > self.config.max_bytes:
+                    logger.warning(
+                        f"Skipping {len(selected) - i} files, which exceed "
+                        f"max_bytes: {self.config.max_bytes}"
+                    )
+                    selected = selected[:i]
+                    break
+                total_bytes += size
+        return selected
+
+    def _write_shard_state(self):
+        """Update the dataset `state.json` files with the files of the rank shard,
+        so the shard is loaded with `load_from_disk`, and record the rank, so the
+        trainer doesn't split the shard again.
+        """
+        shard_path = os.path.join(VOLUME_PATH_DATASET, SHARD_FILE)
+        if not self.config.shard_by_rank:
+            if os.path.exists(shard_path):
+                os.remove(shard_path)
+            return
+
+        for split, files in self.shard_files.items():
+            state_path = os.path.join(VOLUME_PATH_DATASET, split, "state.json")
+            if not os.path.exists(state_path):
+                continue
+            with open(state_path) as f:
+                state = json.load(f)
+            # Files which are skipped by max_bytes are not loaded too.
+            state["_data_files"] = [
+                data_file
+                for data_file in state["_data_files"]
+                if data_file["filename"] in files
+                and os.path.exists(
+                    os.path.join(VOLUME_PATH_DATASET, split, data_file["filename"])
+                )
+            ]
+            # The state is downloaded again by the next run, since its size is changed.
+            with open(state_path, "w") as f:
+                json.dump(state, f, indent=2)
+
+        with open(shard_path, "w") as f:
+            json.dump({"rank": self.rank, "world_size": self.world_size}, f)
+
+    def _prepare_download(
+        self, manifest: Manifest, obj_key: str, path: str, etag: str, size: int
+    ) -> List[Tuple[Any, ...]]:
+        """Create the partial file for the object and get its parts to download.
+        Parts which are downloaded by the previous run are skipped if the object
+        is not changed.
+        """
+        partial_path = os.path.join(VOLUME_PATH_DATASET, path + PARTIAL_SUFFIX)
+        chunksize = (
+            self.config.multipart_chunksize
+            if size > self.config.multipart_threshold
+            else max(size, 1)
+        )
+        num_parts = max(-(-size // chunksize), 1)
+
+        entry = manifest.files.get(path, {})
+        if (
+            entry.get("sha256") is None
+            and entry.get("etag") == etag
+            and entry.get("size") == size
+            and entry.get("chunksize") == chunksize
+            and os.path.isfile(partial_path)
+        ):
+            downloaded_parts = set(entry.get("parts", []))
+            if downloaded_parts:
+                logger.info(
+                    f"Resuming {path} from {len(downloaded_parts)}/{num_parts} parts"
+                )
+        else:
+            downloaded_parts = set()
+            manifest.update(path, etag=etag, size=size, chunksize=chunksize, parts=[])
             # Create directories if they don't exist
-            os.makedirs(
-                os.path.join(VOLUME_PATH_DATASET, path_excluded_first_last_parts),
-                exist_ok=True,
+            os.makedirs(os.path.dirname(partial_path), exist_ok=True)
+            with open(partial_path, "wb") as f:
+                f.truncate(size)
+
+        remaining_parts = [i for i in range(num_parts) if i not in downloaded_parts]
+        self.remaining_parts[path] = len(remaining_parts)
+        return [
+            (obj_key, path, etag, i, i * chunksize, min((i + 1) * chunksize, size))
+            for i in remaining_parts
+        ]
+
+    def _download_part(
+        self,
+        manifest: Manifest,
+        progress: DownloadProgress,
+        limiter: BandwidthLimiter,
+        obj_key: str,
+        path: str,
+        etag: str,
+        index: int,
+        start: int,
+        end: int,
+    ):
+        """Download the byte range of the object into the partial file. The last
+        downloaded part moves the partial file to the file path.
+        """
+        partial_path = os.path.join(VOLUME_PATH_DATASET, path + PARTIAL_SUFFIX)
+        if end > start:
+            # ETag ensures that all parts are downloaded from the same object version.
+            response = self.client.get_object(
+                Bucket=self.config.bucket_name,
+                Key=obj_key,
+                Range=f"bytes={start}-{end - 1}",
+                IfMatch=etag,
             )
+            with open(partial_path, "r+b") as f:
+                f.seek(start)
+                for data in response["Body"].iter_chunks(READ_SIZE):
+                    if self.stopped.is_set():
+                        raise RuntimeError(f"Download of {path} is stopped")
+                    limiter.consume(len(data))
+                    f.write(data)
+                    progress.add_bytes(len(data))
+                # Part is recorded only once its data is on disk.
+                f.flush()
+                os.fsync(f.fileno())
+        manifest.add_part(path, index)
+        manifest.save(interval=MANIFEST_SAVE_INTERVAL)
 
-            # Download the file
-            file_path = os.path.sep.join(path_components[1:])
-            bucket.download_file(obj_key, os.path.join(VOLUME_PATH_DATASET, file_path))
-        print("Files downloaded")
+        with self.lock:
+            self.remaining_parts[path] -= 1
+            if self.remaining_parts[path] > 0:
+                return
+        self._finalize_download(manifest, progress, path, etag)
+
+    def _finalize_download(
+        self, manifest: Manifest, progress: DownloadProgress, path: str, etag: str
+    ):
+        """Move the partial file with all downloaded parts to the file path."""
+        partial_path = os.path.join(VOLUME_PATH_DATASET, path + PARTIAL_SUFFIX)
+        # Checksum is computed once all parts are written.
+        sha256 = sha256sum(partial_path)
+        os.replace(partial_path, os.path.join(VOLUME_PATH_DATASET, path))
+        size = manifest.files[path]["size"]
+        manifest.update(path, etag=etag, size=size, sha256=sha256)
+        progress.add_file()
+        manifest.save(interval=MANIFEST_SAVE_INTERVAL)
+
+    def _handle_sigterm(self, signum, frame):
+        """Stop the download, so the downloaded parts are saved to the manifest."""
+        self.stopped.set()
+        raise SystemExit(128 + signum)
@@ -0,0 +1,364 @@
+import json
+import os
+import signal
+import time
+from unittest.mock import patch
+
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+moto = pytest.importorskip("moto")
+
+from botocore.client import BaseClient  # noqa: E402
+from kubeflow.storage_initializer import s3  # noqa: E402
+from kubeflow.storage_initializer.constants import (  # noqa: E402
+    MANIFEST_FILE,
+    SHARD_FILE,
+)
+
+TEST_BUCKET = "test-bucket"
+TEST_ENDPOINT = "https://s3.amazonaws.com"
+TEST_OBJECTS = {
+    "dataset/train/part-0.json": b"train 0\n" * 10,
+    "dataset/train/part-1.json": b"train 1\n" * 10,
+    "dataset/test.json": b"test\n",
+    "dataset/large.bin": bytes(range(256)) * 64,
+    "other/ignored.json": b"ignored\n",
+}
+
+
+@pytest.fixture
+def dataset_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(s3, "VOLUME_PATH_DATASET", str(tmp_path))
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=TEST_BUCKET)
+        client.put_object(Bucket=TEST_BUCKET, Key="dataset/empty/", Body=b"")
+        for key, body in TEST_OBJECTS.items():
+            client.put_object(Bucket=TEST_BUCKET, Key=key, Body=body)
+        yield tmp_path
+
+
+def download_dataset(file_key="dataset", **kwargs):
+    provider = s3.S3()
+    provider.config = s3.S3DatasetParams(
+        endpoint_url=TEST_ENDPOINT,
+        bucket_name=TEST_BUCKET,
+        file_key=file_key,
+        region_name="us-east-1",
+        **kwargs,
+    )
+    provider.download_dataset()
+
+
+def read_files(dataset_dir):
+    return {
+        str(path.relative_to(dataset_dir)): path.read_bytes()
+        for path in dataset_dir.rglob("*")
+        if path.is_file() and path.name not in (MANIFEST_FILE, SHARD_FILE)
+    }
+
+
+def expected_files(objects):
+    return {
+        key.split("/", 1)[1]: body
+        for key, body in objects.items()
+        if key.startswith("dataset/")
+    }
+
+
+@pytest.fixture
+def api_calls():
+    """Record the S3 API calls with the requested ranges."""
+    calls = []
+    make_api_call = BaseClient._make_api_call
+
+    def record_api_call(client, operation_name, api_params):
+        calls.append((operation_name, api_params.get("Key"), api_params.get("Range")))
+        return make_api_call(client, operation_name, api_params)
+
+    with patch.object(BaseClient, "_make_api_call", record_api_call):
+        yield calls
+
+
+def get_object_calls(calls):
+    return [(key, range) for name, key, range in calls if name == "GetObject"]
+
+
+def test_download_dataset(dataset_dir, api_calls):
+    """
+    test S3 dataset is downloaded concurrently with the ranged GETs for large objects
+    """
+    download_dataset(max_workers=4, multipart_threshold=4096, multipart_chunksize=4096)
+
+    assert read_files(dataset_dir) == expected_files(TEST_OBJECTS)
+    # Object sizes are taken from the list, and the large object is split into parts.
+    assert not [c for c in api_calls if c[0] == "HeadObject"]
+    assert {
+        r for key, r in get_object_calls(api_calls) if key == "dataset/large.bin"
+    } == {f"bytes={i * 4096}-{i * 4096 + 4095}" for i in range(4)}
+    assert not list(dataset_dir.rglob("*.partial"))
+
+
+def test_download_dataset_incremental(dataset_dir, api_calls):
+    """
+    test S3 dataset download skips files which are not changed since the last run
+    """
+    download_dataset()
+    api_calls.clear()
+    download_dataset()
+    assert get_object_calls(api_calls) == []
+
+    # Only the changed object is downloaded.
+    boto3.client("s3").put_object(
+        Bucket=TEST_BUCKET, Key="dataset/test.json", Body=b"changed\n"
+    )
+    download_dataset()
+    assert [key for key, _ in get_object_calls(api_calls)] == ["dataset/test.json"]
+    assert read_files(dataset_dir)["test.json"] == b"changed\n"
+
+    # File which is corrupted on disk is downloaded with the checksum verification.
+    (dataset_dir / "train" / "part-0.json").write_bytes(b"x" * 80)
+    api_calls.clear()
+    download_dataset()
+    assert get_object_calls(api_calls) == []
+    download_dataset(verify_checksums=True)
+    assert [key for key, _ in get_object_calls(api_calls)] == [
+        "dataset/train/part-0.json"
+    ]
+    assert read_files(dataset_dir) == expected_files(
+        {**TEST_OBJECTS, "dataset/test.json": b"changed\n"}
+    )
+
+
+def test_download_dataset_resume(dataset_dir, api_calls):
+    """
+    test interrupted S3 dataset download is resumed from the downloaded parts
+    """
+    download_part = s3.S3._download_part
+
+    def fail_part(self, manifest, progress, limiter, obj_key, path, etag, index, *args):
+        if obj_key == "dataset/large.bin" and index == 2:
+            raise RuntimeError("Connection reset")
+        return download_part(
+            self, manifest, progress, limiter, obj_key, path, etag, index, *args
+        )
+
+    kwargs = {
+        "max_workers": 1,
+        "multipart_threshold": 4096,
+        "multipart_chunksize": 4096,
+    }
+    with patch.object(s3.S3, "_download_part", fail_part):
+        with pytest.raises(RuntimeError):
+            download_dataset(**kwargs)
+    assert (dataset_dir / "large.bin.partial").exists()
+
+    api_calls.clear()
+    download_dataset(**kwargs)
+    # The parts before the failed part are not downloaded again.
+    ranges = [r for key, r in get_object_calls(api_calls) if key == "dataset/large.bin"]
+    assert ranges[0] == "bytes=8192-12287"
+    assert "bytes=0-4095" not in ranges and "bytes=4096-8191" not in ranges
+    assert read_files(dataset_dir) == expected_files(TEST_OBJECTS)
+
+
+def test_download_dataset_resume_downloaded_parts(dataset_dir, api_calls):
+    """
+    test S3 file is finalized if all its parts are downloaded by the previous run
+    """
+    sha256sum = s3.sha256sum
+
+    def fail_sha256sum(path):
+        if path.endswith("large.bin.partial"):
+            raise OSError("Input/output error")
+        return sha256sum(path)
+
+    kwargs = {"multipart_threshold": 4096, "multipart_chunksize": 4096}
+    with patch.object(s3, "sha256sum", fail_sha256sum):
+        with pytest.raises(OSError):
+            download_dataset(**kwargs)
+    assert (dataset_dir / "large.bin.partial").exists()
+
+    api_calls.clear()
+    download_dataset(**kwargs)
+    assert "dataset/large.bin" not in [key for key, _ in get_object_calls(api_calls)]
+    assert not (dataset_dir / "large.bin.partial").exists()
+    assert read_files(dataset_dir) == expected_files(TEST_OBJECTS)
+
+
+def test_download_dataset_terminated(dataset_dir, api_calls, monkeypatch):
+    """
+    test downloaded parts are saved before the download is terminated
+    """
+    monkeypatch.setattr(s3, "MANIFEST_SAVE_INTERVAL", 0)
+    download_part = s3.S3._download_part
+    saved_parts = []
+
+    def terminate_part(
+        self, manifest, progress, limiter, obj_key, path, etag, index, *args
+    ):
+        if obj_key == "dataset/large.bin" and index == 2:
+            # Parts are saved even if the process is killed without the final save.
+            with open(dataset_dir / MANIFEST_FILE) as f:
+                saved_parts.extend(json.load(f)["files"]["large.bin"]["parts"])
+            os.kill(os.getpid(), signal.SIGTERM)
+            self.stopped.wait(5)
+            raise RuntimeError("Download is stopped")
+        return download_part(
+            self, manifest, progress, limiter, obj_key, path, etag, index, *args
+        )
+
+    kwargs = {
+        "max_workers": 1,
+        "multipart_threshold": 4096,
+        "multipart_chunksize": 4096,
+    }
+    with patch.object(s3.S3, "_download_part", terminate_part):
+        with pytest.raises(SystemExit):
+            download_dataset(**kwargs)
+    assert saved_parts == [0, 1]
+    assert signal.getsignal(signal.SIGTERM) == signal.SIG_DFL
+
+    api_calls.clear()
+    download_dataset(**kwargs)
+    ranges = [r for key, r in get_object_calls(api_calls) if key == "dataset/large.bin"]
+    assert ranges == ["bytes=8192-12287", "bytes=12288-16383"]
+    assert read_files(dataset_dir) == expected_files(TEST_OBJECTS)
+
+
+@pytest.mark.parametrize(
+    "kwargs,env,expected_paths",
+    [
+        ({"include": ["train/*"]}, {}, ["train/part-0.json", "train/part-1.json"]),
+        (
+            {"exclude": ["*.bin", "test.*"]},
+            {},
+            ["train/part-0.json", "train/part-1.json"],
+        ),
+        ({"max_bytes": 16384 + 80}, {}, ["large.bin", "test.json"]),
+        (
+            {"shard_by_rank": True, "shard_patterns": ["train/*"]},
+            {"RANK": "1", "WORLD_SIZE": "2"},
+            ["large.bin", "test.json", "train/part-1.json"],
+        ),
+        (
+            {"shard_by_rank": True, "shard_patterns": ["*.json"]},
+            {"RANK": "0", "WORLD_SIZE": "1"},
+            ["large.bin", "test.json", "train/part-0.json", "train/part-1.json"],
+        ),
+    ],
+)
+def test_download_dataset_selected_files(
+    dataset_dir, monkeypatch, kwargs, env, expected_paths
+):
+    """
+    test S3 dataset download with the file patterns, size budget, and rank shard
+    """
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    download_dataset(**kwargs)
+    assert sorted(read_files(dataset_dir)) == expected_paths
+
+
+@pytest.mark.parametrize(
+    "env",
+    [
+        {"WORLD_SIZE": "2"},
+        {"RANK": "2", "WORLD_SIZE": "2"},
+        # Split has less files than ranks.
+        {"RANK": "0", "WORLD_SIZE": "3"},
+    ],
+)
+def test_download_dataset_shard_invalid(dataset_dir, monkeypatch, env):
+    """
+    test S3 dataset download by rank fails with invalid RANK and WORLD_SIZE
+    """
+    monkeypatch.delenv("RANK", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    with pytest.raises(ValueError):
+        download_dataset(shard_by_rank=True, shard_patterns=["train/*"])
+
+
+def test_download_dataset_shard_load(dataset_dir, tmp_path_factory, monkeypatch):
+    """
+    test S3 dataset shards of all ranks are loaded with load_from_disk, and they
+    have all rows of every split
+    """
+    datasets = pytest.importorskip("datasets")
+
+    source_dir = tmp_path_factory.mktemp("source")
+    datasets.DatasetDict(
+        train=datasets.Dataset.from_dict({"id": list(range(100))}),
+        eval=datasets.Dataset.from_dict({"id": list(range(20))}),
+    ).save_to_disk(str(source_dir), num_shards={"train": 4, "eval": 2})
+    client = boto3.client("s3", region_name="us-east-1")
+    for path in source_dir.rglob("*"):
+        if path.is_file():
+            key = f"hf/{path.relative_to(source_dir)}"
+            client.put_object(Bucket=TEST_BUCKET, Key=key, Body=path.read_bytes())
+
+    rows = {"train": [], "eval": []}
+    for rank in range(2):
+        rank_dir = tmp_path_factory.mktemp(f"rank-{rank}")
+        monkeypatch.setattr(s3, "VOLUME_PATH_DATASET", str(rank_dir))
+        monkeypatch.setenv("RANK", str(rank))
+        monkeypatch.setenv("WORLD_SIZE", "2")
+        download_dataset(file_key="hf", shard_by_rank=True)
+
+        dataset = datasets.load_from_disk(str(rank_dir))
+        assert dataset["train"].num_rows == 50
+        assert dataset["eval"].num_rows == 10
+        for split in rows:
+            rows[split] += dataset[split]["id"]
+        with open(rank_dir / SHARD_FILE) as f:
+            assert json.load(f) == {"rank": rank, "world_size": 2}
+
+    assert sorted(rows["train"]) == list(range(100))
+    assert sorted(rows["eval"]) == list(range(20))
+
+
+@pytest.mark.parametrize("world_size", [1, 2, 3, 4, 7])
+def test_get_shard(world_size):
+    """
+    test shards of all ranks are contiguous and cover all items
+    """
+    items = list(range(10))
+    shards = [s3.get_shard(items, rank, world_size) for rank in range(world_size)]
+    assert sum(shards, []) == items
+    assert max(map(len, shards)) - min(map(len, shards)) <= 1
+
+
+def test_download_dataset_max_bandwidth(dataset_dir):
+    """
+    test S3 dataset download throughput is limited
+    """
+    start_time = time.monotonic()
+    download_dataset(max_bandwidth=8 * 1024)
+    # Dataset size is 16KB + 165 bytes, and the first 8KB are sent in the first second.
+    assert time.monotonic() - start_time > 0.8
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_workers": 0},
+        {"multipart_chunksize": 0},
+        {"max_bandwidth": 0},
+        {"max_bytes": -1},
+    ],
+)
+def test_s3_dataset_params_invalid(kwargs):
+    """
+    test S3 dataset parameters are validated
+    """
+    with pytest.raises(ValueError):
+        s3.S3DatasetParams(
+            endpoint_url=TEST_ENDPOINT,
+            bucket_name=TEST_BUCKET,
+            file_key="dataset",
+            **kwargs,
+        )
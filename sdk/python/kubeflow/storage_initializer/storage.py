@@ -1,12 +1,35 @@
 import argparse
+import logging
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+from typing import Callable, Dict, Tuple
 
-from .hugging_face import HuggingFace, HuggingFaceDataset
-from .s3 import S3
+from .constants import VOLUME_PATH_DATASET, VOLUME_PATH_MODEL
+
+# Configure logger.
+log_formatter = logging.Formatter(
+    "%(asctime)s %(levelname)-8s %(message)s", "%Y-%m-%dT%H:%M:%SZ"
+)
+logger = logging.getLogger(__file__)
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(log_formatter)
+logger.addHandler(console_handler)
+logger.setLevel(logging.INFO)
+
+MB = 1024 * 1024
+
+# Interval in seconds between the progress reports of the running downloads.
+REPORT_INTERVAL = 10
 
 
 def model_factory(model_provider, model_provider_parameters):
+    # Providers are imported in the process which downloads the model.
     match model_provider:
         case "hf":
+            from .hugging_face import HuggingFace
+
             hf = HuggingFace()
             hf.load_config(model_provider_parameters)
             hf.download_model_and_tokenizer()
@@ -17,10 +40,14 @@ def model_factory(model_provider, model_provider_parameters):
 def dataset_factory(dataset_provider, dataset_provider_parameters):
     match dataset_provider:
         case "s3":
+            from .s3 import S3
+
             s3 = S3()
             s3.load_config(dataset_provider_parameters)
             s3.download_dataset()
         case "hf":
+            from .hugging_face import HuggingFaceDataset
+
             hf = HuggingFaceDataset()
             hf.load_config(dataset_provider_parameters)
             hf.download_dataset()
@@ -28,6 +55,75 @@ def dataset_factory(dataset_provider, dataset_provider_parameters):
             return "This is the default case"
 
 
+def get_directory_size(directory: str) -> int:
+    """Get the total size of the disk blocks of the files in the directory. Blocks
+    are counted instead of the file sizes, since the downloads can create the files
+    with the full size before the data is written.
+    """
+    size = 0
+    for root, _, files in os.walk(directory):
+        for file in files:
+            try:
+                size += os.stat(os.path.join(root, file)).st_blocks * 512
+            except OSError:
+                # File is renamed or removed by the running download.
+                pass
+    return size
+
+
+def run_initializers(
+    initializers: Dict[str, Tuple[Callable, Tuple, str]],
+    report_interval: float = REPORT_INTERVAL,
+):
+    """Run the initializers concurrently in the separate processes. Progress of
+    all initializers is reported with the size of their directories, and the first
+    failed initializer terminates the others.
+
+    Args:
+        initializers: Initializers by name, e.g. "model", with the function, its
+            arguments, and the directory where files are downloaded.
+        report_interval: Interval in seconds between the progress reports.
+
+    Raises:
+        RuntimeError: One of the initializers failed.
+    """
+    start_time = time.monotonic()
+    running = {}
+    for name, (func, args, _) in initializers.items():
+        running[name] = multiprocessing.Process(target=func, args=args, name=name)
+        running[name].start()
+
+    try:
+        while running:
+            for sentinel in wait(
+                [p.sentinel for p in running.values()], report_interval
+            ):
+                name = next(n for n, p in running.items() if p.sentinel == sentinel)
+                process = running.pop(name)
+                process.join()
+                if process.exitcode != 0:
+                    raise RuntimeError(
+                        f"Failed to initialize {name}, exit code: {process.exitcode}"
+                    )
+                logger.info(
+                    f"Initialized {name} in {time.monotonic() - start_time:.1f}s"
+                )
+
+            elapsed = time.monotonic() - start_time
+            progress = [
+                f"{name} {get_directory_size(directory) / MB:.1f} MB"
+                + ("" if name in running else " (done)")
+                for name, (_, _, directory) in initializers.items()
+            ]
+            logger.info(f"Downloaded {', '.join(progress)} in {elapsed:.1f}s")
+    finally:
+        # Other downloads are cancelled if one of them fails.
+        for process in running.values():
+            process.terminate()
+        for process in running.values():
+            process.join()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="script for downloading model and datasets to PVC."
@@ -47,5 +143,18 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    model_factory(args.model_provider, args.model_provider_parameters)
-    dataset_factory(args.dataset_provider, args.dataset_provider_parameters)
+    # Model and dataset are downloaded concurrently.
+    run_initializers(
+        {
+            "model": (
+                model_factory,
+                (args.model_provider, args.model_provider_parameters),
+                VOLUME_PATH_MODEL,
+            ),
+            "dataset": (
+                dataset_factory,
+                (args.dataset_provider, args.dataset_provider_parameters),
+                VOLUME_PATH_DATASET,
+            ),
+        }
+    )
@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+
+import pytest
+from kubeflow.storage_initializer import storage
+
+MB = 1024 * 1024
+
+
+def write_file(directory, delay):
+    with open(os.path.join(directory, "start"), "w") as f:
+        f.write(str(time.time()))
+    time.sleep(delay)
+    with open(os.path.join(directory, "end"), "w") as f:
+        f.write(str(time.time()))
+
+
+def fail(delay):
+    time.sleep(delay)
+    sys.exit(1)
+
+
+def read_time(path):
+    with open(path) as f:
+        return float(f.read())
+
+
+def test_run_initializers(tmp_path):
+    """
+    test model and dataset initializers run concurrently
+    """
+    model_dir, dataset_dir = tmp_path / "model", tmp_path / "dataset"
+    model_dir.mkdir()
+    dataset_dir.mkdir()
+
+    storage.run_initializers(
+        {
+            "model": (write_file, (str(model_dir), 0.5), str(model_dir)),
+            "dataset": (write_file, (str(dataset_dir), 0.5), str(dataset_dir)),
+        },
+        report_interval=0.1,
+    )
+    # Both initializers are started before any of them is finished.
+    starts = [read_time(d / "start") for d in [model_dir, dataset_dir]]
+    ends = [read_time(d / "end") for d in [model_dir, dataset_dir]]
+    assert max(starts) < min(ends)
+
+
+def test_run_initializers_fail_fast(tmp_path):
+    """
+    test failed initializer cancels the other initializers
+    """
+    with pytest.raises(RuntimeError, match="dataset"):
+        storage.run_initializers(
+            {
+                "model": (write_file, (str(tmp_path), 30), str(tmp_path)),
+                "dataset": (fail, (0.1,), str(tmp_path)),
+            },
+            report_interval=0.1,
+        )
+    # Model initializer is terminated before it is finished.
+    assert not (tmp_path / "end").exists()
+
+
+def test_get_directory_size(tmp_path):
+    """
+    test directory size counts the written data of the preallocated files
+    """
+    with open(tmp_path / "partial", "wb") as f:
+        f.truncate(4 * MB)
+    assert storage.get_directory_size(str(tmp_path)) < MB
+
+    (tmp_path / "file").write_bytes(b"0" * MB)
+    assert storage.get_directory_size(str(tmp_path)) >= MB
@@ -27,6 +27,10 @@ console_handler.setFormatter(log_formatter)
 logger.addHandler(console_handler)
 logger.setLevel(logging.INFO)
 
+# File which the storage initializer creates if it downloads only the dataset shard
+# for the RANK and WORLD_SIZE. It must be equal to the storage initializer SHARD_FILE.
+SHARD_FILE = ".shard.json"
+
 
 def setup_model_and_tokenizer(model_uri, transformer_type, model_dir, num_labels):
     # Set up the model and tokenizer
@@ -96,6 +100,22 @@ def load_and_preprocess_data(dataset_dir, transformer_type, tokenizer):
     # Distribute dataset across PyTorchJob workers.
     RANK = int(os.environ["RANK"])
     WORLD_SIZE = int(os.environ["WORLD_SIZE"])
+
+    # Dataset is not split again if the storage initializer downloaded the shard.
+    shard_path = os.path.join(dataset_dir, SHARD_FILE)
+    if os.path.exists(shard_path):
+        with open(shard_path) as f:
+            shard = json.load(f)
+        if shard != {"rank": RANK, "world_size": WORLD_SIZE}:
+            raise ValueError(
+                f"Dataset shard for RANK: {shard['rank']}, WORLD_SIZE: {shard['world_size']} "
+                f"doesn't match WORLD_SIZE: {WORLD_SIZE}, RANK: {RANK}"
+            )
+        logger.info(
+            f"Dataset is already sharded for WORLD_SIZE: {WORLD_SIZE}, RANK: {RANK}"
+        )
+        return train_data, eval_data
+
     logger.info(
         f"Distributed dataset across PyTorchJob workers. WORLD_SIZE: {WORLD_SIZE}, RANK: {RANK}"
     )
@@ -0,0 +1,969 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import inspect
+import json
+import logging
+import ssl
+import time
+from datetime import datetime
+from http import HTTPStatus
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import certifi
+from kubeflow.training import models
+from kubeflow.training.constants import constants
+from kubeflow.training.utils import deserializer, serializer, utils
+from kubernetes import client, config
+
+logger = logging.getLogger(__name__)
+
+status_logger = utils.StatusLogger(
+    header="{:<30.30} {:<20.20} {}".format("NAME", "STATE", "TIME"),
+    column_format="{:<30.30} {:<20.20} {}",
+)
+
+# Maximum number of bytes to read from the response stream at once.
+READ_SIZE = 64 * 1024
+
+
+class AsyncTrainingClient(object):
+    """Training client with the native asyncio APIs. Requests are sent with aiohttp,
+    so many Jobs can be managed from one event loop without threads.
+
+    The APIs are coroutines with the same arguments and results as the
+    `TrainingClient` APIs, except:
+
+    - `create_job` creates Job only from the Job object. Jobs from the training
+      function or image can be configured with `utils.get_pytorchjob_template`.
+    - `get_job_logs` returns only the pod logs without the Job events, and it
+      doesn't follow or print the logs. Use `stream_job_logs` to follow the logs.
+
+    The client must be closed once it is not used, for example:
+
+    ```python
+    async with AsyncTrainingClient() as training_client:
+        await training_client.create_job(job)
+        await training_client.wait_for_job_conditions(name="train-mnist")
+    ```
+    """
+
+    def __init__(
+        self,
+        config_file: Optional[str] = None,
+        context: Optional[str] = None,
+        client_configuration: Optional[client.Configuration] = None,
+        namespace: Optional[str] = None,
+        job_kind: str = constants.PYTORCHJOB_KIND,
+        lazy: bool = False,
+        pool_size: int = constants.DEFAULT_CONNECTION_POOL_SIZE,
+    ):
+        """AsyncTrainingClient constructor.
+
+        Args:
+            config_file: Path to the kube-config file. Defaults to ~/.kube/config.
+            context: Set the active context. Defaults to current_context from the kube-config.
+            client_configuration: Client configuration for cluster authentication.
+                See `TrainingClient` for the details.
+            namespace: Target Kubernetes namespace. By default it takes namespace
+                from `/var/run/secrets/kubernetes.io/serviceaccount/namespace` location
+                or the current kube-config context, or set as `default`. Namespace is
+                resolved when the client is created, not on the module import.
+                Namespace can be overridden during method invocations.
+            job_kind: Target Training Job kind (e.g. `TFJob`, `PyTorchJob`, `MPIJob`).
+                Job kind can be overridden during method invocations.
+                The default Job kind is `PyTorchJob`.
+            lazy: Whether to return Jobs as lazy views of the Kubernetes API server
+                responses. See `TrainingClient` for the details.
+            pool_size: Maximum number of concurrent connections to the Kubernetes
+                API server. Streams (e.g. Job watch or followed pod logs) have
+                separate connections, so they don't block other requests.
+
+        Raises:
+            ImportError: aiohttp is not installed.
+            ValueError: Job kind is invalid.
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "AsyncTrainingClient dependencies not installed. "
+                + "Run: pip install -U 'kubeflow-training[async]' "
+            )
+        self._aiohttp = aiohttp
+
+        # If client configuration is not set, use kube-config to access Kubernetes APIs.
+        if client_configuration is None:
+            client_configuration = client.Configuration()
+            # Load kube-config or in-cluster config.
+            if config_file or not utils.is_running_in_k8s():
+                config.load_kube_config(
+                    config_file=config_file,
+                    context=context,
+                    client_configuration=client_configuration,
+                )
+            else:
+                config.load_incluster_config(client_configuration=client_configuration)
+        self.configuration = client_configuration
+
+        self.namespace = namespace or utils.get_default_target_namespace()
+        if job_kind not in constants.JOB_PARAMETERS:
+            raise ValueError(
+                f"Job kind must be one of these: {list(constants.JOB_PARAMETERS.keys())}"
+            )
+        self.job_kind = job_kind
+        self.lazy = lazy
+        self.pool_size = pool_size
+        self._session = None
+        self._stream_session = None
+
+    async def __aenter__(self) -> "AsyncTrainingClient":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Close the connections to the Kubernetes API server."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._stream_session is not None:
+            await self._stream_session.close()
+            self._stream_session = None
+
+    async def create_job(
+        self,
+        job: Union[constants.JOB_MODELS_TYPE, Dict[str, Any], bytes],
+        namespace: Optional[str] = None,
+    ):
+        """Create the Training Job.
+
+        Args:
+            job: Job object. Object must be one of these types: KubeflowOrgV1TFJob,
+                KubeflowOrgV1PyTorchJob, etc. Job can also be set as serialized dict
+                or JSON bytes, which are sent to the Kubernetes API server as is.
+                Jobs from the training function or image can be configured with
+                `utils.get_pytorchjob_template` or `utils.get_tfjob_template`.
+            namespace: Namespace for the Job. By default namespace is taken from
+                `AsyncTrainingClient` object.
+
+        Raises:
+            ValueError: Invalid input parameters.
+            TimeoutError: Timeout to create Job.
+            RuntimeError: Failed to create Job.
+        """
+
+        namespace = namespace or self.namespace
+
+        job = serializer.as_serialized(job)
+        if isinstance(job, serializer.SerializedObject):
+            job_kind = str(job.get("kind"))
+            name = job.get("metadata", {}).get("name")
+        elif job is not None:
+            job_kind = str(job.kind)
+            name = job.metadata.name
+        else:
+            raise ValueError("Job must be set")
+        if job_kind not in constants.JOB_PARAMETERS:
+            raise ValueError(
+                f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
+            )
+
+        try:
+            await self._request(
+                "POST",
+                self._get_job_path(namespace, job_kind),
+                body=job,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timeout to create {job_kind}: {namespace}/{name}")
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to create {job_kind}: {namespace}/{name}"
+            ) from e
+
+        logger.debug(f"{job_kind} {namespace}/{name} has been created")
+
+    async def get_job(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+    ) -> constants.JOB_MODELS_TYPE:
+        """Get the Training Job.
+
+        Args:
+            name: Name for the Job.
+            namespace: Namespace for the Job. By default namespace is taken from
+                `AsyncTrainingClient` object.
+            job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `AsyncTrainingClient` object.
+            timeout: Kubernetes API server timeout in seconds to execute the request.
+
+        Returns:
+            object: Job object. For example: KubeflowOrgV1PyTorchJob
+
+        Raises:
+            ValueError: Job kind is invalid.
+            TimeoutError: Timeout to get Job.
+            RuntimeError: Failed to get Job.
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = self._get_job_kind(job_kind)
+
+        try:
+            data = await self._request(
+                "GET",
+                self._get_job_path(namespace, job_kind, name),
+                timeout=timeout,
+            )
+            job = deserializer.deserialize(
+                json.loads(data),
+                constants.JOB_PARAMETERS[job_kind]["model"],
+                lazy=self.lazy,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timeout to get {job_kind}: {namespace}/{name}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to get {job_kind}: {namespace}/{name}") from e
+
+        return job
+
+    async def list_jobs(
+        self,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> List[constants.JOB_MODELS_TYPE]:
+        """List of all Training Jobs with specific kind in namespace.
+
+        Args:
+            namespace: Namespace to list the Jobs. By default namespace is taken from
+                `AsyncTrainingClient` object.
+            job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `AsyncTrainingClient` object.
+            timeout: Kubernetes API server timeout in seconds to execute the request.
+            label_selector: Optional, Kubernetes label selector to filter the Jobs.
+            field_selector: Optional, Kubernetes field selector to filter the Jobs.
+
+        Returns:
+            list[object]: List of Job objects.
+                For example: list of KubeflowOrgV1PyTorchJob objects.
+
+        Raises:
+            ValueError: Job kind is invalid.
+            TimeoutError: Timeout to list Jobs
+            RuntimeError: Failed to list Jobs
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = self._get_job_kind(job_kind)
+
+        try:
+            data = await self._request(
+                "GET",
+                self._get_job_path(namespace, job_kind),
+                params={
+                    "labelSelector": label_selector,
+                    "fieldSelector": field_selector,
+                },
+                timeout=timeout,
+            )
+            jobs = deserializer.deserialize(
+                json.loads(data).get("items") or [],
+                "list[{}]".format(constants.JOB_PARAMETERS[job_kind]["model"]),
+                lazy=self.lazy,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timeout to list {job_kind}s in namespace: {namespace}")
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to list {job_kind}s in namespace: {namespace}"
+            ) from e
+
+        return jobs
+
+    async def delete_job(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        delete_options: Optional[models.V1DeleteOptions] = None,
+    ):
+        """Delete the Training Job
+
+        Args:
+            name: Name for the Job.
+            namespace: Namespace for the Job. By default namespace is taken from
+                `AsyncTrainingClient` object.
+            job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `AsyncTrainingClient` object.
+            delete_options: Optional, V1DeleteOptions to set while deleting
+                the Job. For example, grace period seconds.
+
+        Raises:
+            ValueError: Job kind is invalid.
+            TimeoutError: Timeout to delete Job.
+            RuntimeError: Failed to delete Job.
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = self._get_job_kind(job_kind)
+
+        try:
+            await self._request(
+                "DELETE",
+                self._get_job_path(namespace, job_kind, name),
+                body=delete_options,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timeout to delete {job_kind}: {namespace}/{name}")
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to delete {job_kind}: {namespace}/{name}"
+            ) from e
+
+        logger.debug(f"{job_kind} {namespace}/{name} has been deleted")
+
+    async def get_job_conditions(
+        self,
+        name: Optional[str] = None,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        job: Optional[constants.JOB_MODELS_TYPE] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+    ) -> List[models.KubeflowOrgV1JobCondition]:
+        """Get the Training Job conditions. Training Job is in the condition when
+        `status=True` for the appropriate condition `type`. See
+        `TrainingClient.get_job_conditions` for the details.
+
+        Args:
+            name: Name for the Job.
+            namespace: Namespace for the Job. By default namespace is taken from
+                `AsyncTrainingClient` object.
+            job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `AsyncTrainingClient` object.
+            job: Optional, Job object. If it is set, conditions are taken from the object.
+            timeout: Kubernetes API server timeout in seconds to execute the request.
+
+        Returns:
+            list[KubeflowOrgV1JobCondition]: List of Job conditions with
+                last transition time, last update time, message, reason, type, and
+                status. It returns an empty list if Job does not have any
+                conditions yet.
+
+        Raises:
+            ValueError: Invalid input parameters.
+            TimeoutError: Timeout to get Job.
+            RuntimeError: Failed to get Job.
+        """
+
+        if job is None:
+            # Job name must be set when Job object is not set.
+            if name is None:
+                raise ValueError("Job name must be set when Job object is not set")
+            job = await self.get_job(
+                name=name, namespace=namespace, job_kind=job_kind, timeout=timeout
+            )
+
+        if job.status and job.status.conditions:
+            return job.status.conditions
+        return []
+
+    async def wait_for_job_conditions(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        expected_conditions: Set = {constants.JOB_CONDITION_SUCCEEDED},
+        wait_timeout: int = 600,
+        callback: Optional[Callable] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+    ) -> constants.JOB_MODELS_TYPE:
+        """Wait until Training Job reaches any of the specified conditions. The Job
+        is watched with the Kubernetes API, so no requests are sent until the Job
+        is updated. By default it waits for the Succeeded condition.
+
+        Args:
+            name: Name for the Job.
+            namespace: Namespace for the Job. By default namespace is taken from
+                `AsyncTrainingClient` object.
+            job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `AsyncTrainingClient` object.
+            expected_conditions: Set of expected conditions. It must be subset of this:
+                `{"Created", "Running", "Restarting", "Succeeded", "Failed"}`
+            wait_timeout: How many seconds to wait until Job reaches one of
+                the expected conditions.
+            callback: Optional callback function that is invoked after Job
+                status is updated. This function takes a single argument which
+                is current Job object. It can be a coroutine function.
+            timeout: Kubernetes API server timeout in seconds to execute the request.
+
+        Returns:
+            object: Job object. For example: KubeflowOrgV1PyTorchJob
+
+        Raises:
+            ValueError: Expected conditions are invalid or Job kind is invalid
+            TimeoutError: Timeout to get Job or timeout to wait until Job reaches
+                any of the expected conditions.
+            RuntimeError: Failed to get Job, Job is deleted, or Job reaches
+                unexpected Failed condition.
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = self._get_job_kind(job_kind)
+
+        if not expected_conditions.issubset(constants.JOB_CONDITIONS):
+            raise ValueError(
+                f"Expected conditions: {expected_conditions} must be subset of \
+                    {constants.JOB_CONDITIONS}"
+            )
+
+        deadline = time.monotonic() + wait_timeout
+        resource_version = None
+        while time.monotonic() < deadline:
+            # Get the Job to start the watch, and get it again once the watch
+            # resource version is expired.
+            if resource_version is None:
+                job = await self.get_job(name, namespace, job_kind, timeout)
+                if await self._is_job_in_conditions(
+                    job, namespace, job_kind, expected_conditions, callback
+                ):
+                    return job
+                resource_version = job.metadata.resource_version
+
+            try:
+                async for event in self._watch(
+                    self._get_job_path(namespace, job_kind),
+                    params={
+                        "fieldSelector": f"metadata.name={name}",
+                        "resourceVersion": resource_version,
+                    },
+                    timeout=max(int(deadline - time.monotonic()), 1),
+                ):
+                    resource_version = event["object"]["metadata"]["resourceVersion"]
+                    if event["type"] == "DELETED":
+                        raise RuntimeError(f"{job_kind} {namespace}/{name} is deleted")
+
+                    job = deserializer.deserialize(
+                        event["object"],
+                        constants.JOB_PARAMETERS[job_kind]["model"],
+                        lazy=self.lazy,
+                    )
+                    if await self._is_job_in_conditions(
+                        job, namespace, job_kind, expected_conditions, callback
+                    ):
+                        return job
+            except client.ApiException as e:
+                if e.status != HTTPStatus.GONE:
+                    raise RuntimeError(
+                        f"Failed to watch {job_kind}: {namespace}/{name}"
+                    ) from e
+                resource_version = None
+            except asyncio.TimeoutError:
+                continue
+            except self._aiohttp.ClientError as e:
+                raise RuntimeError(
+                    f"Failed to watch {job_kind}: {namespace}/{name}"
+                ) from e
+
+        raise TimeoutError(
+            f"Timeout waiting for {job_kind}: {namespace}/{name} to reach expected conditions: \
+                {expected_conditions}"
+        )
+
+    async def get_job_pods(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        is_master: bool = False,
+        replica_type: Optional[str] = None,
+        replica_index: Optional[int] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+    ) -> List[models.V1Pod]:
+        """Get pods for the Training Job. See `TrainingClient.get_job_pods` for the
+        arguments.
+
+        Returns:
+            list[V1Pod]: List of the Job pods.
+
+        Raises:
+            ValueError: Job replica type is invalid.
+            TimeoutError: Timeout to get Job pods.
+            RuntimeError: Failed to get Job pods.
+        """
+
+        namespace = namespace or self.namespace
+
+        label_selector = utils.get_job_pods_label_selector(
+            name=name,
+            is_master=is_master,
+            replica_type=replica_type,
+            replica_index=replica_index,
+        )
+
+        try:
+            data = await self._request(
+                "GET",
+                f"/api/v1/namespaces/{namespace}/pods",
+                params={"labelSelector": label_selector},
+                timeout=timeout,
+            )
+            return deserializer.deserialize(
+                json.loads(data).get("items") or [], "list[V1Pod]", lazy=self.lazy
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timeout to list pods for Job: {namespace}/{name}")
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to list pods for Job: {namespace}/{name}"
+            ) from e
+
+    async def get_job_logs(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        is_master: bool = True,
+        replica_type: Optional[str] = None,
+        replica_index: Optional[int] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+        limit_bytes: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Get the logs for every Training Job pod. Logs of all pods are read
+        concurrently. By default it returns logs from the `master` pod. See
+        `TrainingClient.get_job_logs` for the arguments.
+
+        Returns:
+            Dict[str, str]: A dictionary in which the keys are pod names and the
+            values are the corresponding logs.
+
+        Raises:
+            ValueError: Job replica type is invalid.
+            TimeoutError: Timeout to get Job pods or logs.
+            RuntimeError: Failed to get Job pods or logs.
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = self._get_job_kind(job_kind)
+
+        pod_names = await self._get_running_pod_names(
+            name, namespace, is_master, replica_type, replica_index, timeout
+        )
+
+        async def read_pod_log(pod_name: str) -> str:
+            data = await self._request_pod_log(
+                pod_name,
+                namespace,
+                job_kind,
+                params={"limitBytes": limit_bytes},
+                timeout=timeout,
+            )
+            return data.decode(errors="replace")
+
+        logs = await asyncio.gather(*[read_pod_log(p) for p in pod_names])
+        return dict(zip(pod_names, logs))
+
+    async def stream_job_logs(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        is_master: bool = True,
+        replica_type: Optional[str] = None,
+        replica_index: Optional[int] = None,
+        follow: bool = False,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        limit_bytes: Optional[int] = None,
+        timestamps: bool = True,
+    ) -> AsyncIterator[Tuple[str, Optional[datetime], str]]:
+        """Stream the logs of the Training Job pods line by line. See
+        `TrainingClient.stream_job_logs` for the arguments.
+
+        Returns:
+            AsyncIterator[Tuple[str, datetime, str]]: Iterator over pod name, timestamp,
+                and log line without newline. Timestamp is None if `timestamps` is False.
+
+        Raises:
+            ValueError: Job replica type is invalid.
+            TimeoutError: Timeout to get Job pods.
+            RuntimeError: Failed to get Job pods or to read logs.
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = self._get_job_kind(job_kind)
+
+        pod_names = await self._get_running_pod_names(
+            name, namespace, is_master, replica_type, replica_index, timeout
+        )
+        params = {
+            "follow": follow,
+            "sinceSeconds": since_seconds,
+            "tailLines": tail_lines,
+            "limitBytes": limit_bytes,
+            "timestamps": timestamps,
+        }
+
+        def parse(pod_name: str, logline: str) -> Tuple[str, Optional[datetime], str]:
+            if timestamps:
+                return (pod_name, *utils.split_log_timestamp(logline))
+            return pod_name, None, logline
+
+        if not follow:
+            for pod_name in pod_names:
+                async for logline in self._stream_pod_log(
+                    pod_name, namespace, job_kind, params
+                ):
+                    yield parse(pod_name, logline)
+            return
+
+        # Lines of all pods are sent to the queue as they are received.
+        # Every pod sends None once its logs are finished.
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def read_pod_log(pod_name: str):
+            try:
+                async for logline in self._stream_pod_log(
+                    pod_name, namespace, job_kind, params
+                ):
+                    await queue.put((pod_name, logline))
+            finally:
+                await queue.put(None)
+
+        tasks = [asyncio.ensure_future(read_pod_log(p)) for p in pod_names]
+        try:
+            finished = 0
+            while finished < len(tasks):
+                item = await queue.get()
+                if item is None:
+                    finished += 1
+                    continue
+                yield parse(*item)
+            # Raise the error if any pod failed.
+            for task in tasks:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _get_job_kind(self, job_kind: Optional[str]) -> str:
+        job_kind = job_kind or self.job_kind
+        if job_kind not in constants.JOB_PARAMETERS:
+            raise ValueError(
+                f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
+            )
+        return job_kind
+
+    def _get_job_path(
+        self, namespace: str, job_kind: str, name: Optional[str] = None
+    ) -> str:
+        path = (
+            f"/apis/{constants.GROUP}/{constants.VERSION}/namespaces/{namespace}/"
+            f"{constants.JOB_PARAMETERS[job_kind]['plural']}"
+        )
+        return f"{path}/{name}" if name else path
+
+    async def _is_job_in_conditions(
+        self,
+        job: constants.JOB_MODELS_TYPE,
+        namespace: str,
+        job_kind: str,
+        expected_conditions: Set,
+        callback: Optional[Callable] = None,
+    ) -> bool:
+        """Check if Training Job reaches any of the expected conditions.
+        It raises RuntimeError if Job is Failed and Failed is not the expected condition.
+        """
+
+        conditions = await self.get_job_conditions(job=job, job_kind=job_kind)
+        if len(conditions) > 0:
+            status_logger(
+                job.metadata.name,
+                conditions[-1].type,
+                conditions[-1].last_transition_time,
+            )
+
+        # Execute callback function is it is set.
+        if callback:
+            result = callback(job)
+            if inspect.isawaitable(result):
+                await result
+
+        # Raise an exception if Job is Failed and Failed is not the expected condition.
+        if (
+            constants.JOB_CONDITION_FAILED not in expected_conditions
+            and utils.has_condition(conditions, constants.JOB_CONDITION_FAILED)
+        ):
+            raise RuntimeError(
+                f"{job_kind} {namespace}/{job.metadata.name} is Failed. "
+                f"{job_kind} conditions: {job.status.conditions}"
+            )
+
+        for expected_condition in expected_conditions:
+            if utils.has_condition(conditions, expected_condition):
+                return True
+        return False
+
+    async def _get_running_pod_names(
+        self,
+        name: str,
+        namespace: str,
+        is_master: bool,
+        replica_type: Optional[str],
+        replica_index: Optional[int],
+        timeout: int,
+    ) -> List[str]:
+        """Get names of the Job pods which are not pending."""
+        pods = await self.get_job_pods(
+            name=name,
+            namespace=namespace,
+            is_master=is_master,
+            replica_type=replica_type,
+            replica_index=replica_index,
+            timeout=timeout,
+        )
+        return [
+            pod.metadata.name
+            for pod in pods
+            if pod.status is not None
+            and pod.status.phase != constants.POD_PHASE_PENDING
+        ]
+
+    async def _request_pod_log(
+        self,
+        pod_name: str,
+        namespace: str,
+        job_kind: str,
+        params: Dict[str, Any],
+        timeout: int,
+    ) -> bytes:
+        try:
+            return await self._request(
+                "GET",
+                f"/api/v1/namespaces/{namespace}/pods/{pod_name}/log",
+                params={
+                    "container": constants.JOB_PARAMETERS[job_kind]["container"],
+                    **params,
+                },
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timeout to read logs for pod {namespace}/{pod_name}")
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to read logs for pod {namespace}/{pod_name}"
+            ) from e
+
+    async def _stream_pod_log(
+        self,
+        pod_name: str,
+        namespace: str,
+        job_kind: str,
+        params: Dict[str, Any],
+    ) -> AsyncIterator[str]:
+        """Stream the log lines of the pod. The last line is returned even if it
+        doesn't end with newline.
+        """
+        try:
+            async with self._stream(
+                f"/api/v1/namespaces/{namespace}/pods/{pod_name}/log",
+                params={
+                    "container": constants.JOB_PARAMETERS[job_kind]["container"],
+                    **params,
+                },
+            ) as response:
+                async for line in _iter_lines(response):
+                    yield line.decode(errors="replace")
+        except (asyncio.CancelledError, GeneratorExit):
+            raise
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to read logs for pod {namespace}/{pod_name}"
+            ) from e
+
+    async def _watch(
+        self, path: str, params: Dict[str, Any], timeout: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Watch the Kubernetes objects until the server closes the watch.
+
+        Raises:
+            ApiException: Watch failed, e.g. resource version is expired.
+        """
+        async with self._stream(
+            path,
+            params={**params, "watch": True, "timeoutSeconds": timeout},
+        ) as response:
+            async for line in _iter_lines(response):
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if event["type"] == "ERROR":
+                    raise client.ApiException(
+                        status=event["object"].get("code"),
+                        reason=event["object"].get("message"),
+                    )
+                yield event
+
+    def _get_session(self) -> Any:
+        """Get the HTTP session. The session is created in the running event loop."""
+        if self._session is None:
+            self._session = self._aiohttp.ClientSession(
+                connector=self._aiohttp.TCPConnector(
+                    limit=self.pool_size, ssl=_get_ssl_context(self.configuration)
+                ),
+            )
+        return self._session
+
+    def _get_stream_session(self) -> Any:
+        """Get the HTTP session for the streams. Every stream holds its connection
+        until it is finished, so the number of connections is not limited.
+        """
+        if self._stream_session is None:
+            self._stream_session = self._aiohttp.ClientSession(
+                connector=self._aiohttp.TCPConnector(
+                    limit=0, ssl=_get_ssl_context(self.configuration)
+                ),
+            )
+        return self._stream_session
+
+    def _get_headers(self) -> Dict[str, str]:
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": "kubeflow-training-sdk",
+        }
+        # Auth settings refresh the token if it is expired.
+        for auth in self.configuration.auth_settings().values():
+            if auth["in"] == "header" and auth["value"]:
+                headers[auth["key"]] = auth["value"]
+        return headers
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Any = None,
+        timeout: Optional[int] = None,
+    ) -> bytes:
+        """Send the request to the Kubernetes API server and read the response.
+
+        Raises:
+            ApiException: Kubernetes API server returned the error.
+            asyncio.TimeoutError: Timeout to execute the request.
+        """
+        async with self._get_session().request(
+            method,
+            self.configuration.host + path,
+            params=_get_query_params(params),
+            data=(json.dumps(serializer.serialize(body)) if body is not None else None),
+            headers=self._get_headers(),
+            proxy=self.configuration.proxy,
+            timeout=self._aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            data = await response.read()
+            if response.status >= HTTPStatus.BAD_REQUEST:
+                e = client.ApiException(status=response.status, reason=response.reason)
+                e.body = data.decode(errors="replace")
+                raise e
+            return data
+
+    def _stream(self, path: str, params: Dict[str, Any]) -> Any:
+        """Send the streaming request (e.g. watch or follow logs), which doesn't
+        have the total timeout.
+        """
+        session = self._get_stream_session()
+        aiohttp = self._aiohttp
+        headers = self._get_headers()
+        configuration = self.configuration
+
+        class StreamContext:
+            async def __aenter__(self):
+                self.response = await session.get(
+                    configuration.host + path,
+                    params=_get_query_params(params),
+                    headers=headers,
+                    proxy=configuration.proxy,
+                    timeout=aiohttp.ClientTimeout(total=None),
+                )
+                if self.response.status >= HTTPStatus.BAD_REQUEST:
+                    data = await self.response.read()
+                    self.response.release()
+                    e = client.ApiException(
+                        status=self.response.status, reason=self.response.reason
+                    )
+                    e.body = data.decode(errors="replace")
+                    raise e
+                return self.response
+
+            async def __aexit__(self, *args):
+                self.response.release()
+
+        return StreamContext()
+
+
+def _get_query_params(params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Convert the query parameters to strings and skip parameters which are not set."""
+    result = {}
+    for key, value in (params or {}).items():
+        if value is None:
+            continue
+        result[key] = str(value).lower() if isinstance(value, bool) else str(value)
+    return result
+
+
+def _get_ssl_context(configuration: client.Configuration) -> Optional[ssl.SSLContext]:
+    """Get the SSL context with the same certificates as the Kubernetes API client."""
+    if not configuration.host.startswith("https"):
+        return None
+    context = ssl.create_default_context(
+        cafile=configuration.ssl_ca_cert or certifi.where()
+    )
+    if configuration.cert_file:
+        context.load_cert_chain(configuration.cert_file, configuration.key_file)
+    if not configuration.verify_ssl:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+async def _iter_lines(response: Any) -> AsyncIterator[bytes]:
+    """Iterate over the lines of the response without the line length limit."""
+    partial_line = b""
+    async for data in response.content.iter_chunked(READ_SIZE):
+        lines = (partial_line + data).split(b"\n")
+        partial_line = lines.pop()
+        for line in lines:
+            yield line
+    if partial_line:
+        yield partial_line
@@ -0,0 +1,321 @@
+import asyncio
+import json
+
+import pytest
+from kubeflow.training.constants import constants
+from kubernetes import client
+
+aiohttp = pytest.importorskip("aiohttp")
+web = pytest.importorskip("aiohttp.web")
+
+from kubeflow.training.api.async_training_client import (  # noqa: E402
+    AsyncTrainingClient,
+)
+
+TEST_NAME = "test"
+TEST_NAMESPACE = "test"
+PENDING_POD = "test-worker-1"
+JOBS_PATH = "/apis/kubeflow.org/v1/namespaces/{namespace}/pytorchjobs"
+
+
+def generate_job(name, condition=None, resource_version="1"):
+    job = {
+        "apiVersion": "kubeflow.org/v1",
+        "kind": constants.PYTORCHJOB_KIND,
+        "metadata": {
+            "name": name,
+            "namespace": TEST_NAMESPACE,
+            "resourceVersion": resource_version,
+        },
+        "spec": {"pytorchReplicaSpecs": {}, "runPolicy": {}},
+    }
+    if condition:
+        job["status"] = {
+            "conditions": [
+                {
+                    "type": condition,
+                    "status": "True",
+                    "lastTransitionTime": "2024-01-01T00:00:00Z",
+                }
+            ]
+        }
+    return job
+
+
+def generate_pod(name, phase):
+    return {
+        "metadata": {"name": name, "namespace": TEST_NAMESPACE},
+        "status": {"phase": phase},
+    }
+
+
+class FakeApiServer:
+    """Kubernetes API server with a single namespace and a PyTorchJob watch."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.requests = []
+        # Watches are held until the event is set if it is not None.
+        self.watch_event = None
+        self.watches = 0
+        self.app = web.Application()
+        jobs_path = JOBS_PATH.format(namespace="{namespace}")
+        self.app.router.add_get(jobs_path, self.list_jobs)
+        self.app.router.add_post(jobs_path, self.create_job)
+        self.app.router.add_get(jobs_path + "/{name}", self.get_job)
+        self.app.router.add_delete(jobs_path + "/{name}", self.delete_job)
+        self.app.router.add_get("/api/v1/namespaces/{namespace}/pods", self.list_pods)
+        self.app.router.add_get(
+            "/api/v1/namespaces/{namespace}/pods/{name}/log", self.read_pod_log
+        )
+
+    async def list_jobs(self, request):
+        self.requests.append(request.query_string)
+        if request.query.get("watch") == "true":
+            return await self.watch_jobs(request)
+        return web.json_response({"items": list(self.jobs.values())})
+
+    async def watch_jobs(self, request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        # The first watch is expired, so the Job must be get again.
+        if request.query["resourceVersion"] == "1":
+            event = {"type": "ERROR", "object": {"code": 410, "message": "expired"}}
+            await response.write(json.dumps(event).encode() + b"\n")
+            self.jobs[TEST_NAME] = generate_job(TEST_NAME, "Running", "2")
+            return response
+        if self.watch_event is not None:
+            self.watches += 1
+            await self.watch_event.wait()
+            name = request.query["fieldSelector"].split("=")[1]
+            event = {"type": "MODIFIED", "object": generate_job(name, "Succeeded", "3")}
+            await response.write(json.dumps(event).encode() + b"\n")
+            return response
+        for condition, resource_version in [("Running", "3"), ("Succeeded", "4")]:
+            await asyncio.sleep(0.01)
+            event = {
+                "type": "MODIFIED",
+                "object": generate_job(TEST_NAME, condition, resource_version),
+            }
+            # Events are split across chunks to check the line buffering.
+            data = json.dumps(event).encode() + b"\n"
+            await response.write(data[:10])
+            await response.write(data[10:])
+        return response
+
+    async def create_job(self, request):
+        job = await request.json()
+        if job["metadata"]["name"] in self.jobs:
+            return web.json_response({"reason": "AlreadyExists"}, status=409)
+        self.jobs[job["metadata"]["name"]] = job
+        return web.json_response(job, status=201)
+
+    async def get_job(self, request):
+        job = self.jobs.get(request.match_info["name"])
+        if job is None:
+            return web.json_response({"reason": "NotFound"}, status=404)
+        return web.json_response(job)
+
+    async def delete_job(self, request):
+        job = self.jobs.pop(request.match_info["name"], None)
+        if job is None:
+            return web.json_response({"reason": "NotFound"}, status=404)
+        return web.json_response({"status": "Success"})
+
+    async def list_pods(self, request):
+        self.requests.append(request.query_string)
+        return web.json_response(
+            {
+                "items": [
+                    generate_pod("test-master-0", "Running"),
+                    generate_pod("test-worker-0", "Running"),
+                    generate_pod(PENDING_POD, constants.POD_PHASE_PENDING),
+                ]
+            }
+        )
+
+    async def read_pod_log(self, request):
+        self.requests.append(request.query_string)
+        pod_name = request.match_info["name"]
+        lines = [f"2024-01-01T00:00:0{i}Z {pod_name} line {i}" for i in range(3)]
+        if request.query.get("timestamps") != "true":
+            lines = [line.split(" ", 1)[1] for line in lines]
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for line in lines:
+            await response.write(line.encode() + b"\n")
+            await asyncio.sleep(0.01)
+        return response
+
+
+def run(test, **kwargs):
+    """Run the test coroutine with the training client of the fake API server."""
+
+    async def main():
+        server = FakeApiServer()
+        runner = web.AppRunner(server.app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncTrainingClient(
+                client_configuration=client.Configuration(
+                    host=f"http://127.0.0.1:{port}"
+                ),
+                namespace=TEST_NAMESPACE,
+                **kwargs,
+            ) as training_client:
+                await test(training_client, server)
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def test_create_get_list_delete_job():
+    """
+    test create, get, list, and delete Job with AsyncTrainingClient
+    """
+
+    async def test(training_client, server):
+        await training_client.create_job(generate_job(TEST_NAME))
+        with pytest.raises(RuntimeError):
+            await training_client.create_job(json.dumps(generate_job(TEST_NAME)))
+
+        job = await training_client.get_job(TEST_NAME)
+        assert job.metadata.name == TEST_NAME
+        assert [j.metadata.name for j in await training_client.list_jobs()] == [
+            TEST_NAME
+        ]
+
+        await training_client.delete_job(TEST_NAME)
+        assert await training_client.list_jobs() == []
+        with pytest.raises(RuntimeError):
+            await training_client.get_job(TEST_NAME)
+
+    run(test)
+
+
+def test_create_job_invalid():
+    """
+    test create Job with invalid Job kind
+    """
+
+    async def test(training_client, server):
+        job = generate_job(TEST_NAME)
+        job["kind"] = "invalid"
+        with pytest.raises(ValueError):
+            await training_client.create_job(job)
+        with pytest.raises(ValueError):
+            await training_client.get_job(TEST_NAME, job_kind="invalid")
+
+    run(test)
+
+
+def test_wait_for_job_conditions():
+    """
+    test wait for Job conditions with the watch, which is restarted on expired
+    resource version
+    """
+
+    async def test(training_client, server):
+        server.jobs[TEST_NAME] = generate_job(TEST_NAME, "Created")
+
+        updates = []
+
+        async def callback(job):
+            updates.append(job.metadata.resource_version)
+
+        job = await training_client.wait_for_job_conditions(
+            TEST_NAME, callback=callback, wait_timeout=5
+        )
+        assert job.metadata.resource_version == "4"
+        assert updates == ["1", "2", "3", "4"]
+
+        with pytest.raises(ValueError):
+            await training_client.wait_for_job_conditions(
+                TEST_NAME, expected_conditions={"invalid"}
+            )
+
+    run(test)
+
+
+def test_wait_for_job_conditions_more_than_pool_size():
+    """
+    test concurrent waits for more Jobs than the connection pool size don't block
+    each other and other requests
+    """
+
+    async def test(training_client, server):
+        server.watch_event = asyncio.Event()
+        names = [f"{TEST_NAME}-{i}" for i in range(training_client.pool_size * 2)]
+        for name in names:
+            server.jobs[name] = generate_job(name, "Running", "2")
+
+        waiters = [
+            asyncio.ensure_future(
+                training_client.wait_for_job_conditions(name, wait_timeout=10)
+            )
+            for name in names
+        ]
+
+        async def wait_for_watches():
+            while server.watches < len(names):
+                await asyncio.sleep(0.01)
+
+        try:
+            await asyncio.wait_for(wait_for_watches(), 5)
+            job = await asyncio.wait_for(training_client.get_job(names[0]), 5)
+            assert job.metadata.name == names[0]
+        finally:
+            server.watch_event.set()
+        jobs = await asyncio.wait_for(asyncio.gather(*waiters), 5)
+        assert [j.metadata.name for j in jobs] == names
+
+    run(test, pool_size=2)
+
+
+def test_get_job_logs():
+    """
+    test get logs of all running Job pods concurrently
+    """
+
+    async def test(training_client, server):
+        logs = await training_client.get_job_logs(
+            TEST_NAME, is_master=False, limit_bytes=100
+        )
+        assert logs == {
+            pod_name: "\n".join(f"{pod_name} line {i}" for i in range(3)) + "\n"
+            for pod_name in ["test-master-0", "test-worker-0"]
+        }
+        assert "limitBytes=100" in server.requests[-1]
+
+        with pytest.raises(ValueError):
+            await training_client.get_job_logs(TEST_NAME, replica_type="invalid")
+
+    run(test)
+
+
+@pytest.mark.parametrize("follow", [False, True])
+def test_stream_job_logs(follow):
+    """
+    test stream logs of all running Job pods line by line
+    """
+
+    async def test(training_client, server):
+        lines = [
+            (pod_name, timestamp.second, line)
+            async for pod_name, timestamp, line in training_client.stream_job_logs(
+                TEST_NAME, is_master=False, follow=follow, tail_lines=3
+            )
+        ]
+        assert sorted(lines) == sorted(
+            (pod_name, i, f"{pod_name} line {i}")
+            for pod_name in ["test-master-0", "test-worker-0"]
+            for i in range(3)
+        )
+        assert f"follow={str(follow).lower()}" in server.requests[-1]
+        assert "tailLines=3" in server.requests[-1]
+
+    run(test)
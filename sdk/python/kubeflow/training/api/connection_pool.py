@@ -0,0 +1,117 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+from typing import Any, List, Optional, Tuple, Union
+
+from kubeflow.training.constants import constants
+from kubeflow.training.types import types
+from kubeflow.training.utils import serializer
+from kubernetes import client
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+# TCP keep-alive options to detect broken idle connections in the pool,
+# e.g. connections which are dropped by the load balancer.
+KEEP_ALIVE_SOCKET_OPTIONS = [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    *[
+        (socket.IPPROTO_TCP, getattr(socket, option), value)
+        for option, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10))
+        if hasattr(socket, option)
+    ],
+]
+
+
+class PooledApiClient(serializer.KubernetesApiClient):
+    """Kubernetes API client with the tunable connection pool.
+
+    The default Kubernetes API client sends `async_req` requests from a single
+    thread, so concurrent requests are sent one by one. This client uses the same
+    number of threads and connections, so up to `pool_size` requests are sent
+    concurrently over the reused connections.
+    """
+
+    def __init__(
+        self,
+        configuration: Optional[client.Configuration] = None,
+        pool_size: int = constants.DEFAULT_CONNECTION_POOL_SIZE,
+        keep_alive: bool = True,
+        request_timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        retries: Optional[int] = None,
+        backoff_factor: float = constants.DEFAULT_RETRY_BACKOFF_FACTOR,
+        **kwargs: Any,
+    ):
+        if pool_size < 1:
+            raise ValueError(
+                f"Pool size must be greater than 0, but pool size is {pool_size}"
+            )
+        super().__init__(configuration, pool_threads=pool_size, **kwargs)
+        self.request_timeout = request_timeout
+
+        # Connection pools to the hosts are created on the first request with
+        # these arguments.
+        pool_kwargs = self.rest_client.pool_manager.connection_pool_kw
+        pool_kwargs["maxsize"] = pool_size
+        if keep_alive:
+            pool_kwargs["socket_options"] = (
+                HTTPConnection.default_socket_options + KEEP_ALIVE_SOCKET_OPTIONS
+            )
+        if retries is not None:
+            # Only idempotent requests (e.g. GET or DELETE) are retried on the
+            # server errors, and the `Retry-After` header is respected.
+            pool_kwargs["retries"] = Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=constants.RETRY_STATUS_CODES,
+                raise_on_status=False,
+            )
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        # Streaming requests (e.g. watch or follow logs) might be idle for a long
+        # time, so the request timeout is not set for them.
+        if (
+            self.request_timeout is not None
+            and kwargs.get("_request_timeout") is None
+            and kwargs.get("_preload_content", True)
+        ):
+            timeout = self.request_timeout
+            kwargs["_request_timeout"] = (
+                timeout if isinstance(timeout, tuple) else (timeout, timeout)
+            )
+        return super().request(*args, **kwargs)
+
+    def get_pool_stats(self) -> List[types.ConnectionPoolStats]:
+        """Get the utilisation of the connection pools for every host."""
+
+        pools = self.rest_client.pool_manager.pools
+        stats = []
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            # Queue of the pool contains idle connections and empty slots
+            # for connections which are not created yet.
+            queue = list(pool.pool.queue)
+            stats.append(
+                types.ConnectionPoolStats(
+                    host=f"{pool.scheme}://{pool.host}:{pool.port}",
+                    maxsize=pool.pool.maxsize,
+                    in_use=pool.pool.maxsize - len(queue),
+                    idle=sum(conn is not None for conn in queue),
+                    connections=pool.num_connections,
+                    requests=pool.num_requests,
+                )
+            )
+        return stats
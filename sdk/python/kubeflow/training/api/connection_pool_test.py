@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import urllib3
+from kubeflow.training.api.connection_pool import PooledApiClient
+from kubernetes import client
+
+TEST_NAMESPACE = "test"
+SLOW_NAMESPACE = "slow"
+FLAKY_NAMESPACE = "flaky"
+
+
+class PodListHandler(BaseHTTPRequestHandler):
+    """Handler which returns the empty pod list."""
+
+    protocol_version = "HTTP/1.1"
+    failures = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        # Path: /api/v1/namespaces/<namespace>/pods
+        namespace = self.path.split("?")[0].split("/")[4]
+        if namespace == SLOW_NAMESPACE:
+            time.sleep(0.2)
+        if namespace == FLAKY_NAMESPACE:
+            with self.lock:
+                PodListHandler.failures += 1
+                fail = PodListHandler.failures <= 2
+            if fail:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+        body = json.dumps({"items": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def configuration():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PodListHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield client.Configuration(host=f"http://127.0.0.1:{server.server_address[1]}")
+    server.shutdown()
+    server.server_close()
+
+
+def test_pooled_api_client_concurrency(configuration):
+    """
+    test PooledApiClient sends async requests concurrently over reused connections
+    """
+    core_api = client.CoreV1Api(PooledApiClient(configuration, pool_size=8))
+
+    start_time = time.perf_counter()
+    threads = [
+        core_api.list_namespaced_pod(SLOW_NAMESPACE, async_req=True) for _ in range(16)
+    ]
+    for thread in threads:
+        assert thread.get(5).items == []
+    # 16 requests take 0.2 seconds each, so 2 batches of 8 requests are sent.
+    assert time.perf_counter() - start_time < 1.6
+
+    [stats] = core_api.api_client.get_pool_stats()
+    assert stats.maxsize == 8
+    assert stats.requests == 16
+    assert stats.connections <= 8
+    assert stats.in_use == 0
+    assert stats.idle == stats.connections
+
+
+def test_pooled_api_client_retries(configuration):
+    """
+    test PooledApiClient retries requests on server errors
+    """
+    PodListHandler.failures = 0
+    core_api = client.CoreV1Api(
+        PooledApiClient(configuration, retries=3, backoff_factor=0)
+    )
+    assert core_api.list_namespaced_pod(FLAKY_NAMESPACE).items == []
+
+    PodListHandler.failures = 0
+    core_api = client.CoreV1Api(PooledApiClient(configuration))
+    with pytest.raises(client.ApiException):
+        core_api.list_namespaced_pod(FLAKY_NAMESPACE)
+
+
+def test_pooled_api_client_request_timeout(configuration):
+    """
+    test PooledApiClient sets the default request timeout
+    """
+    core_api = client.CoreV1Api(
+        PooledApiClient(configuration, request_timeout=0.05, retries=0)
+    )
+    with pytest.raises(urllib3.exceptions.HTTPError):
+        core_api.list_namespaced_pod(SLOW_NAMESPACE)
+    assert core_api.list_namespaced_pod(TEST_NAMESPACE).items == []
+
+
+def test_pooled_api_client_invalid_pool_size():
+    """
+    test PooledApiClient raises error for invalid pool size
+    """
+    with pytest.raises(ValueError):
+        PooledApiClient(pool_size=0)
@@ -0,0 +1,176 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+from datetime import datetime, timezone
+from http import HTTPStatus
+from typing import Dict, List, Optional
+
+from kubeflow.training.api_client import ApiClient
+from kubeflow.training.constants import constants
+from kubeflow.training.utils import deserializer
+from kubernetes import client, watch
+
+logger = logging.getLogger(__name__)
+
+# How long to wait in seconds before the Job cache lists Jobs again after failure.
+RESYNC_BACKOFF = 1
+
+# How long in seconds the single watch request lasts before it is resumed.
+WATCH_TIMEOUT = 300
+
+
+class JobCache:
+    """Local cache of Training Jobs with specific kind in namespace.
+
+    The cache lists the Jobs once and then watches them in a background thread,
+    similar to the Kubernetes informers. Jobs are deserialized only once per change
+    and stored by name, so reads don't send requests to the Kubernetes API server.
+    Cached Job objects are shared between readers and must not be modified.
+    If `lazy` is set, Jobs are stored as lazy views of the Kubernetes API server
+    responses, see `kubeflow.training.utils.deserializer.LazyModel`.
+    """
+
+    def __init__(
+        self,
+        custom_api: client.CustomObjectsApi,
+        api_client: ApiClient,
+        namespace: str,
+        job_kind: str,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+        lazy: bool = False,
+    ):
+        self.custom_api = custom_api
+        self.api_client = api_client
+        self.namespace = namespace
+        self.job_kind = job_kind
+        self.timeout = timeout
+        self.lazy = lazy
+
+        # Last resource version and time when the cache observed the Jobs.
+        self.resource_version: Optional[str] = None
+        self.last_sync_time: Optional[datetime] = None
+
+        self._jobs: Dict[str, constants.JOB_MODELS_TYPE] = {}
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watch: Optional[watch.Watch] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """Start to list and watch the Jobs in the background thread."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop to watch the Jobs. The cache keeps the last observed Jobs."""
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the Jobs are listed for the first time.
+
+        Returns:
+            bool: True if the cache is synced, else False.
+        """
+        return self._synced.wait(timeout)
+
+    def has_synced(self) -> bool:
+        """Check if the Jobs are listed for the first time."""
+        return self._synced.is_set()
+
+    def get(self, name: str) -> Optional[constants.JOB_MODELS_TYPE]:
+        """Get the Job from the cache. It returns None if Job can't be found."""
+        with self._lock:
+            return self._jobs.get(name)
+
+    def list(self) -> List[constants.JOB_MODELS_TYPE]:
+        """List all Jobs from the cache."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self._list()
+                self._watch_jobs()
+            except client.ApiException as e:
+                if e.status == HTTPStatus.GONE:
+                    logger.debug(
+                        f"{self.job_kind}s cache in namespace {self.namespace} "
+                        "is expired, list Jobs again"
+                    )
+                    continue
+                logger.warning(
+                    f"Failed to sync {self.job_kind}s cache in namespace "
+                    f"{self.namespace}: {e}"
+                )
+                self._stopped.wait(RESYNC_BACKOFF)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to sync {self.job_kind}s cache in namespace "
+                    f"{self.namespace}: {e}"
+                )
+                self._stopped.wait(RESYNC_BACKOFF)
+
+    def _list(self):
+        thread = self.custom_api.list_namespaced_custom_object(
+            constants.GROUP,
+            constants.VERSION,
+            self.namespace,
+            constants.JOB_PARAMETERS[self.job_kind]["plural"],
+            async_req=True,
+        )
+        response = thread.get(self.timeout)
+
+        jobs = {}
+        for item in response.get("items"):
+            job = self._deserialize(item)
+            jobs[job.metadata.name] = job
+
+        with self._lock:
+            self._jobs = jobs
+            self.resource_version = response.get("metadata", {}).get("resourceVersion")
+            self.last_sync_time = datetime.now(timezone.utc)
+        self._synced.set()
+
+    def _watch_jobs(self):
+        self._watch = watch.Watch()
+        while not self._stopped.is_set():
+            for event in self._watch.stream(
+                self.custom_api.list_namespaced_custom_object,
+                group=constants.GROUP,
+                version=constants.VERSION,
+                namespace=self.namespace,
+                plural=constants.JOB_PARAMETERS[self.job_kind]["plural"],
+                resource_version=self.resource_version,
+                timeout_seconds=WATCH_TIMEOUT,
+            ):
+                job = self._deserialize(event["raw_object"])
+                with self._lock:
+                    if event["type"] == "DELETED":
+                        self._jobs.pop(job.metadata.name, None)
+                    else:
+                        self._jobs[job.metadata.name] = job
+                    self.resource_version = (
+                        job.metadata.resource_version or self.resource_version
+                    )
+                    self.last_sync_time = datetime.now(timezone.utc)
+
+    def _deserialize(self, obj) -> constants.JOB_MODELS_TYPE:
+        return deserializer.deserialize(
+            obj, constants.JOB_PARAMETERS[self.job_kind]["model"], lazy=self.lazy
+        )
@@ -0,0 +1,264 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import http.client
+import logging
+import selectors
+import socket
+import ssl
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from kubernetes import client
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of bytes to read from the log stream at once.
+READ_SIZE = 64 * 1024
+# Maximum number of reads from the log stream before other streams are read.
+MAX_READS = 16
+
+
+class PodLogStream:
+    """Log stream of the pod container which is read without blocking on idle pods.
+
+    The stream wraps the streaming response of the Kubernetes API client, so it
+    uses the same authentication, TLS, and proxy settings as other requests. The
+    socket is read without blocking and the chunked transfer encoding is decoded
+    by the stream, since the HTTP response of the standard library blocks until
+    the next chunk is received.
+    """
+
+    def __init__(self, pod_name: str, response: Any):
+        self.pod_name = pod_name
+        self.response = response
+        self.http_response: http.client.HTTPResponse = response._fp
+        self.socket: socket.socket = self.http_response.fp.raw._sock
+        self.timeout = self.socket.gettimeout()
+        self.partial_line = b""
+        self.finished = False
+        self.pending = False
+        self._fileno = self.socket.fileno()
+        # Remaining bytes of the body if it isn't chunked and has the length.
+        self.length: Optional[int] = self.http_response.length
+        # State of the chunked body: "size", "data", "crlf", or "trailer".
+        self.chunk_state = "size"
+        self.chunk_left = 0
+        self.buffer = b""
+
+        # Body might be already buffered with the response headers.
+        self.socket.settimeout(0)
+        try:
+            self.buffer = self.http_response.fp.peek()
+        except (ssl.SSLWantReadError, ssl.SSLWantWriteError):
+            pass
+        finally:
+            self.socket.settimeout(self.timeout)
+        self.http_response.fp.read(len(self.buffer))
+        self.pending = bool(self.buffer)
+
+    def fileno(self) -> int:
+        return self._fileno
+
+    def has_buffered_data(self) -> bool:
+        """Check if the stream has data which is already received, but not read yet.
+        Such data is buffered by the TLS layer when the stream is read partially, so
+        the selector doesn't report the socket as readable.
+        """
+        return self.pending
+
+    def read_lines(self) -> List[str]:
+        """Read the available data without blocking and split it into complete
+        lines. When the stream is finished, the last line is returned even if it
+        doesn't end with newline.
+        """
+        data = self.buffer
+        self.buffer = b""
+        eof = False
+        self.pending = False
+        self.socket.settimeout(0)
+        try:
+            for _ in range(MAX_READS):
+                try:
+                    received = self.socket.recv(READ_SIZE)
+                except (BlockingIOError, ssl.SSLWantReadError, ssl.SSLWantWriteError):
+                    break
+                if not received:
+                    eof = True
+                    break
+                data += received
+            else:
+                self.pending = True
+        finally:
+            self.socket.settimeout(self.timeout)
+
+        body = self._decode(data)
+        if eof and not self.finished:
+            if self.http_response.chunked or self.length:
+                raise http.client.IncompleteRead(body)
+            self.finished = True
+
+        lines = (self.partial_line + body).split(b"\n")
+        self.partial_line = lines.pop()
+        if self.finished and self.partial_line:
+            lines.append(self.partial_line)
+            self.partial_line = b""
+        return [line.decode(errors="replace") for line in lines]
+
+    def _decode(self, data: bytes) -> bytes:
+        """Decode the received data into the body of the response."""
+        if not self.http_response.chunked:
+            if self.length is not None:
+                data = data[: self.length]
+                self.length -= len(data)
+                self.finished = self.length == 0
+            return data
+
+        body = []
+        while not self.finished:
+            if self.chunk_state == "data":
+                if not data:
+                    break
+                size = self.chunk_left
+                chunk, data = data[:size], data[size:]
+                body.append(chunk)
+                self.chunk_left -= len(chunk)
+                if self.chunk_left == 0:
+                    self.chunk_state = "crlf"
+                continue
+
+            line_end = data.find(b"\r\n")
+            if line_end < 0:
+                break
+            line, data = data[:line_end], data[line_end:].removeprefix(b"\r\n")
+            if self.chunk_state == "size":
+                # Chunk extensions after the size are ignored.
+                self.chunk_left = int(line.split(b";")[0], 16)
+                self.chunk_state = "data" if self.chunk_left else "trailer"
+            elif self.chunk_state == "crlf":
+                if line:
+                    raise http.client.HTTPException(f"Invalid chunk end: {line!r}")
+                self.chunk_state = "size"
+            elif not line:
+                # Trailer headers are finished with the empty line.
+                self.finished = True
+        self.buffer = data
+        return b"".join(body)
+
+    def close(self):
+        # Connection can be reused only if the stream is read till the end.
+        if self.finished and not self.http_response.will_close:
+            self.http_response.close()
+            self.response.release_conn()
+        else:
+            self.response.close()
+
+
+class LogMultiplexer:
+    """Multiplexer of the log streams for multiple pods.
+
+    All streams are read in the calling thread with the selector, so following
+    the logs of hundreds of pods doesn't require a thread per pod, and every line
+    is returned as soon as it is received. Additional arguments (e.g. `tail_lines`)
+    are passed to `read_namespaced_pod_log`.
+    """
+
+    def __init__(
+        self,
+        core_api: client.CoreV1Api,
+        namespace: str,
+        container: str,
+        follow: bool = True,
+        **log_kwargs: Any,
+    ):
+        self.core_api = core_api
+        self.namespace = namespace
+        self.container = container
+        self.follow = follow
+        self.log_kwargs = log_kwargs
+        self.streams: Dict[int, PodLogStream] = {}
+        self.selector = selectors.DefaultSelector()
+
+    def __enter__(self) -> "LogMultiplexer":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add(self, pod_name: str):
+        """Start to read the log stream of the pod.
+
+        Raises:
+            RuntimeError: Failed to read logs for the pod.
+        """
+        try:
+            response = self.core_api.read_namespaced_pod_log(
+                name=pod_name,
+                namespace=self.namespace,
+                container=self.container,
+                follow=self.follow,
+                _preload_content=False,
+                **self.log_kwargs,
+            )
+            stream = PodLogStream(pod_name, response)
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to read logs for pod {self.namespace}/{pod_name}"
+            ) from e
+
+        self.streams[stream.fileno()] = stream
+        self.selector.register(stream, selectors.EVENT_READ)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over the log lines of all pods until every stream is finished.
+
+        Returns:
+            Iterator[Tuple[str, str]]: Iterator over pod name and log line.
+
+        Raises:
+            RuntimeError: Failed to read logs for the pod.
+        """
+        try:
+            while self.streams:
+                ready = [s for s in self.streams.values() if s.has_buffered_data()]
+                # Don't wait for the new data if some streams have buffered data.
+                for key, _ in self.selector.select(0 if ready else None):
+                    if key.fileobj not in ready:
+                        ready.append(key.fileobj)
+
+                for stream in ready:
+                    try:
+                        lines = stream.read_lines()
+                    except Exception as e:
+                        raise RuntimeError(
+                            f"Failed to read logs for pod {self.namespace}/{stream.pod_name}"
+                        ) from e
+
+                    for line in lines:
+                        yield stream.pod_name, line
+                    if stream.finished:
+                        logger.debug(f"Logs for pod {stream.pod_name} are finished")
+                        self._remove(stream)
+        finally:
+            self.close()
+
+    def close(self):
+        """Close all log streams."""
+        for stream in list(self.streams.values()):
+            self._remove(stream)
+        self.selector.close()
+
+    def _remove(self, stream: PodLogStream):
+        self.selector.unregister(stream)
+        del self.streams[stream.fileno()]
+        stream.close()
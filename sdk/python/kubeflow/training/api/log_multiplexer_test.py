@@ -0,0 +1,125 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from kubernetes import client
+
+from kubeflow.training.api.log_multiplexer import LogMultiplexer
+
+TEST_NAMESPACE = "test"
+TEST_CONTAINER = "pytorch"
+IDLE_POD = "idle-pod"
+QUIET_POD = "quiet-pod"
+BUSY_POD = "busy-pod"
+FAIL_POD = "fail-pod"
+
+
+class PodLogHandler(BaseHTTPRequestHandler):
+    """Handler which streams pod logs with chunked transfer encoding."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        # Path: /api/v1/namespaces/<namespace>/pods/<pod>/log
+        pod_name = self.path.split("?")[0].split("/")[6]
+        if pod_name == FAIL_POD:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        # Quiet pod sends the first line, and the rest after the busy pod.
+        if pod_name == QUIET_POD:
+            self.write_chunk(f"{pod_name} line 0\n".encode())
+            time.sleep(1)
+        # Busy pod sends the lines after the quiet pod's first line is read.
+        if pod_name == BUSY_POD:
+            time.sleep(0.2)
+            for i in range(5):
+                self.write_chunk(f"{pod_name} line {i}\n".encode())
+                time.sleep(0.05)
+            self.write_chunk(b"")
+            return
+        # Idle pod sends the last line after all other pods are finished.
+        if pod_name == IDLE_POD:
+            time.sleep(0.5)
+        for chunk in [f"{pod_name} line 1\n{pod_name} ", "line 2\n", "no newline"]:
+            self.write_chunk(chunk.encode())
+        self.write_chunk(b"")
+
+    def write_chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+
+@pytest.fixture
+def core_api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PodLogHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configuration = client.Configuration(
+        host=f"http://127.0.0.1:{server.server_address[1]}"
+    )
+    yield client.CoreV1Api(client.ApiClient(configuration))
+    server.shutdown()
+    server.server_close()
+
+
+def test_log_multiplexer(core_api):
+    """
+    test LogMultiplexer reads log lines of all pods as they arrive
+    """
+    pod_names = [IDLE_POD] + [f"pod-{i}" for i in range(20)]
+
+    lines = []
+    with LogMultiplexer(core_api, TEST_NAMESPACE, TEST_CONTAINER) as log_multiplexer:
+        for pod_name in pod_names:
+            log_multiplexer.add(pod_name)
+        for pod_name, line in log_multiplexer:
+            lines.append((pod_name, line))
+
+    for pod_name in pod_names:
+        assert [line for name, line in lines if name == pod_name] == [
+            f"{pod_name} line 1",
+            f"{pod_name} line 2",
+            "no newline",
+        ]
+    # Lines of the idle pod don't block lines of other pods.
+    assert lines[-1][0] == IDLE_POD
+    assert not log_multiplexer.streams
+
+
+def test_log_multiplexer_quiet_pod(core_api):
+    """
+    test LogMultiplexer doesn't wait for the next chunk of the quiet pod
+    """
+    lines = []
+    with LogMultiplexer(core_api, TEST_NAMESPACE, TEST_CONTAINER) as log_multiplexer:
+        for pod_name in [QUIET_POD, BUSY_POD]:
+            log_multiplexer.add(pod_name)
+        for pod_name, line in log_multiplexer:
+            lines.append((pod_name, line))
+
+    assert lines[0] == (QUIET_POD, f"{QUIET_POD} line 0")
+    # Lines of the busy pod are read while the quiet pod doesn't send the data.
+    assert lines[1:6] == [(BUSY_POD, f"{BUSY_POD} line {i}") for i in range(5)]
+    assert [line for name, line in lines[6:]] == [
+        f"{QUIET_POD} line 1",
+        f"{QUIET_POD} line 2",
+        "no newline",
+    ]
+
+
+def test_log_multiplexer_failed(core_api):
+    """
+    test LogMultiplexer raises error when pod logs can't be read
+    """
+    with LogMultiplexer(core_api, TEST_NAMESPACE, TEST_CONTAINER) as log_multiplexer:
+        with pytest.raises(RuntimeError):
+            log_multiplexer.add(FAIL_POD)
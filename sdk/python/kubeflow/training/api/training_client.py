@@ -16,17 +16,25 @@ import json
 import logging
 import multiprocessing
 import queue
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from kubeflow.storage_initializer.constants import (
     VOLUME_PATH_DATASET,
     VOLUME_PATH_MODEL,
 )
 from kubeflow.training import models
+from kubeflow.training.api.connection_pool import PooledApiClient
+from kubeflow.training.api.job_cache import JobCache
+from kubeflow.training.api.log_multiplexer import LogMultiplexer
 from kubeflow.training.api_client import ApiClient
 from kubeflow.training.constants import constants
-from kubeflow.training.utils import utils
+from kubeflow.training.types import types
+from kubeflow.training.utils import deserializer, serializer, utils
 from kubernetes import client, config, watch
 
 logger = logging.getLogger(__name__)
@@ -43,8 +51,15 @@ class TrainingClient(object):
         config_file: Optional[str] = None,
         context: Optional[str] = None,
         client_configuration: Optional[client.Configuration] = None,
-        namespace: str = utils.get_default_target_namespace(),
+        namespace: Optional[str] = None,
         job_kind: str = constants.PYTORCHJOB_KIND,
+        cache: bool = False,
+        lazy: bool = False,
+        pool_size: int = constants.DEFAULT_CONNECTION_POOL_SIZE,
+        keep_alive: bool = True,
+        request_timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        retries: Optional[int] = None,
+        backoff_factor: float = constants.DEFAULT_RETRY_BACKOFF_FACTOR,
     ):
         """TrainingClient constructor. Configure logging in your application
             as follows to see detailed information from the TrainingClient APIs:
@@ -63,13 +78,38 @@ class TrainingClient(object):
                 https://github.com/kubernetes-client/python/blob/67f9c7a97081b4526470cad53576bc3b71fa6fcc/examples/remote_cluster.py#L31
             namespace: Target Kubernetes namespace. By default it takes namespace
                 from `/var/run/secrets/kubernetes.io/serviceaccount/namespace` location
-                or set as `default`. Namespace can be overridden during method invocations.
+                or the current kube-config context, or set as `default`. Namespace is
+                resolved when the client is created, not on the module import.
+                Namespace can be overridden during method invocations.
             job_kind: Target Training Job kind (e.g. `TFJob`, `PyTorchJob`, `MPIJob`).
                 Job kind can be overridden during method invocations.
                 The default Job kind is `PyTorchJob`.
+            cache: Whether to serve `get_job`, `list_jobs`, and Job condition checks
+                from the local Job cache. The cache lists and watches Jobs with specific
+                kind in namespace in the background thread once they are requested
+                for the first time. Cached Jobs are eventually consistent with the
+                Kubernetes API server and must not be modified.
+            lazy: Whether to return Jobs as lazy views of the Kubernetes API server
+                responses. Nested objects of the lazy Jobs (e.g. `spec` or `status`)
+                are deserialized only on the first access, which reduces the time and
+                memory to get and list Jobs. Lazy Jobs have the same attributes and
+                methods as the Job models, but attribute values are not validated.
+            pool_size: Maximum number of concurrent requests and reused connections
+                to the Kubernetes API server. Increase it for high fan-out APIs, e.g.
+                `create_jobs` or `get_job_logs` with many pods.
+            keep_alive: Whether to enable TCP keep-alive for the connections, so
+                broken idle connections are detected before they are reused.
+            request_timeout: Optional, default timeout in seconds for the requests
+                to the Kubernetes API server, or tuple of connect and read timeouts.
+                It isn't applied to streaming requests, e.g. watch or follow logs.
+            retries: Optional, number of retries for the failed idempotent requests
+                (e.g. GET or DELETE), including responses with status 429 and 5xx.
+                By default the Kubernetes client settings are used.
+            backoff_factor: Backoff factor in seconds between the retries. The delay
+                before the retry `n` is `backoff_factor * 2 ** (n - 1)`.
 
         Raises:
-            ValueError: Job kind is invalid.
+            ValueError: Job kind or pool size is invalid.
         """
 
         # If client configuration is not set, use kube-config to access Kubernetes APIs.
@@ -80,18 +120,47 @@ class TrainingClient(object):
             else:
                 config.load_incluster_config()
 
-        k8s_client = client.ApiClient(client_configuration)
+        self._pool_kwargs = {
+            "pool_size": pool_size,
+            "keep_alive": keep_alive,
+            "request_timeout": request_timeout,
+            "retries": retries,
+            "backoff_factor": backoff_factor,
+        }
+        k8s_client = PooledApiClient(client_configuration, **self._pool_kwargs)
         self.custom_api = client.CustomObjectsApi(k8s_client)
         self.core_api = client.CoreV1Api(k8s_client)
+        self._k8s_clients = [k8s_client]
+        self._gzip_core_api: Optional[client.CoreV1Api] = None
         self.api_client = ApiClient()
 
-        self.namespace = namespace
+        self.namespace = namespace or utils.get_default_target_namespace()
         if job_kind not in constants.JOB_PARAMETERS:
             raise ValueError(
                 f"Job kind must be one of these: {list(constants.JOB_PARAMETERS.keys())}"
             )
         self.job_kind = job_kind
 
+        self.cache = cache
+        self.lazy = lazy
+        self.job_caches: Dict[Tuple[str, str], JobCache] = {}
+        self.job_caches_lock = threading.Lock()
+
+    def get_connection_pool_stats(self) -> List[types.ConnectionPoolStats]:
+        """Get the utilisation of the connection pools to the Kubernetes API server.
+        If the number of created connections keeps growing faster than the number of
+        requests, or all connections are in use, increase the `pool_size`.
+
+        Returns:
+            list[ConnectionPoolStats]: Connection pool stats for every host.
+        """
+
+        return [
+            stats
+            for k8s_client in self._k8s_clients
+            for stats in k8s_client.get_pool_stats()
+        ]
+
     def train(
         self,
         name: str,
@@ -315,7 +384,7 @@ class TrainingClient(object):
 
     def create_job(
         self,
-        job: Optional[constants.JOB_MODELS_TYPE] = None,
+        job: Union[constants.JOB_MODELS_TYPE, Dict[str, Any], bytes, None] = None,
         name: Optional[str] = None,
         namespace: Optional[str] = None,
         job_kind: Optional[str] = None,
@@ -339,7 +408,9 @@ class TrainingClient(object):
 
         Args:
             job: Job object. Object must be one of these types: KubeflowOrgV1TFJob,
-                KubeflowOrgV1PyTorchJob, etc.
+                KubeflowOrgV1PyTorchJob, etc. Job can also be set as serialized dict
+                or JSON bytes (e.g. from `kubeflow.training.utils.serializer.serialize`),
+                which are sent to the Kubernetes API server without serialization.
             name: Name for the Job. It must be set if `job` parameter is omitted.
             namespace: Namespace for the Job. By default namespace is taken from
                 `TrainingClient` object.
@@ -408,7 +479,10 @@ class TrainingClient(object):
 
         namespace = namespace or self.namespace
         job_kind = job_kind or self.job_kind
-        if job is not None:
+        job = self._get_serialized_job(job)
+        if isinstance(job, serializer.SerializedObject):
+            job_kind = str(job.get("kind"))
+        elif job is not None:
             job_kind = str(job.kind)
 
         if job_kind not in constants.JOB_PARAMETERS:
@@ -505,10 +579,14 @@ class TrainingClient(object):
                 )
 
         # Verify Job object type.
-        if not isinstance(
+        if isinstance(job, serializer.SerializedObject):
+            name = job.get("metadata", {}).get("name")
+        elif isinstance(
             job,
             getattr(models, constants.JOB_PARAMETERS[job_kind]["model"]),
         ):
+            name = job.metadata.name
+        else:
             raise ValueError(
                 f"Job must be one of these types: {constants.JOB_MODELS}, but Job is: {type(job)}"
             )
@@ -523,15 +601,94 @@ class TrainingClient(object):
                 job,
             )
         except multiprocessing.TimeoutError:
-            raise TimeoutError(
-                f"Timeout to create {job_kind}: {namespace}/{job.metadata.name}"
-            )
-        except Exception:
+            raise TimeoutError(f"Timeout to create {job_kind}: {namespace}/{name}")
+        except Exception as e:
             raise RuntimeError(
-                f"Failed to create {job_kind}: {namespace}/{job.metadata.name}"
+                f"Failed to create {job_kind}: {namespace}/{name}"
+            ) from e
+
+        logger.debug(f"{job_kind} {namespace}/{name} has been created")
+
+    def create_jobs(
+        self,
+        jobs: List[Union[constants.JOB_MODELS_TYPE, Dict[str, Any], bytes]],
+        namespace: Optional[str] = None,
+        max_concurrency: int = constants.DEFAULT_MAX_CONCURRENCY,
+        qps: Optional[float] = None,
+        burst: Optional[int] = None,
+    ) -> List[types.CreateJobResult]:
+        """Create the batch of Training Jobs. Jobs are created concurrently, and
+        failure to create one Job doesn't stop creation of other Jobs.
+
+        Args:
+            jobs: List of Job objects or serialized Jobs, see the `job` argument of
+                `create_job`. Jobs might have different kinds.
+            namespace: Namespace for the Jobs. By default namespace is taken from
+                `TrainingClient` object.
+            max_concurrency: Maximum number of concurrent requests to the Kubernetes
+                API server.
+            qps: Optional, maximum average number of requests per second to the
+                Kubernetes API server. By default requests are not rate limited.
+            burst: Optional, maximum number of requests to send at once when `qps` is
+                set. By default it is equal to `max_concurrency`.
+
+        Returns:
+            list[CreateJobResult]: Results of the Job creation in the same order as
+                `jobs`. Result status is `Created`, `AlreadyExists`, or `Failed`.
+
+        Raises:
+            ValueError: QPS is invalid.
+        """
+
+        namespace = namespace or self.namespace
+        rate_limiter = (
+            utils.RateLimiter(qps, burst or max_concurrency)
+            if qps is not None
+            else None
+        )
+
+        def create(job) -> types.CreateJobResult:
+            name = None
+            try:
+                job = self._get_serialized_job(job)
+                if isinstance(job, serializer.SerializedObject):
+                    name = job.get("metadata", {}).get("name")
+                elif job is not None and job.metadata is not None:
+                    name = job.metadata.name
+
+                if rate_limiter is not None:
+                    rate_limiter.acquire()
+                self.create_job(job=job, namespace=namespace)
+            except Exception as e:
+                status_code = getattr(e.__cause__, "status", None)
+                return types.CreateJobResult(
+                    name=name,
+                    namespace=namespace,
+                    status=(
+                        constants.JOB_CREATION_ALREADY_EXISTS
+                        if status_code == HTTPStatus.CONFLICT
+                        else constants.JOB_CREATION_FAILED
+                    ),
+                    status_code=status_code,
+                    error=e,
+                )
+            return types.CreateJobResult(
+                name=name,
+                namespace=namespace,
+                status=constants.JOB_CREATION_CREATED,
+                status_code=HTTPStatus.CREATED,
             )
 
-        logger.debug(f"{job_kind} {namespace}/{job.metadata.name} has been created")
+        if not jobs:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(jobs))
+        ) as executor:
+            results = list(executor.map(create, jobs))
+
+        created = sum(r.status == constants.JOB_CREATION_CREATED for r in results)
+        logger.debug(f"{created}/{len(results)} Jobs have been created in {namespace}")
+        return results
 
     def get_job(
         self,
@@ -566,6 +723,25 @@ class TrainingClient(object):
                 f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
             )
 
+        # Get Job from the local cache if it is enabled. If Job is not found in the
+        # cache, it might be just created, so get Job from the Kubernetes API server.
+        if self.cache:
+            job = self.get_job_cache(namespace, job_kind, timeout).get(name)
+            if job is not None:
+                return job
+
+        return self._get_job(name, namespace, job_kind, timeout, lazy=self.lazy)
+
+    def _get_job(
+        self,
+        name: str,
+        namespace: str,
+        job_kind: str,
+        timeout: int,
+        lazy: bool,
+    ) -> constants.JOB_MODELS_TYPE:
+        """Get the Training Job from the Kubernetes API server."""
+
         try:
             thread = self.custom_api.get_namespaced_custom_object(
                 constants.GROUP,
@@ -575,9 +751,10 @@ class TrainingClient(object):
                 name,
                 async_req=True,
             )
-            response = utils.FakeResponse(thread.get(timeout))
-            job = self.api_client.deserialize(
-                response, constants.JOB_PARAMETERS[job_kind]["model"]
+            job = deserializer.deserialize(
+                thread.get(timeout),
+                constants.JOB_PARAMETERS[job_kind]["model"],
+                lazy=lazy,
             )
 
         except multiprocessing.TimeoutError:
@@ -592,6 +769,9 @@ class TrainingClient(object):
         namespace: Optional[str] = None,
         job_kind: Optional[str] = None,
         timeout: int = constants.DEFAULT_TIMEOUT,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        limit: Optional[int] = None,
     ) -> List[constants.JOB_MODELS_TYPE]:
         """List of all Training Jobs with specific kind in namespace.
 
@@ -601,6 +781,13 @@ class TrainingClient(object):
             job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
                 is taken from `TrainingClient` object.
             timeout: Kubernetes API server timeout in seconds to execute the request.
+            label_selector: Optional, Kubernetes label selector to filter the Jobs
+                (e.g. `app=mnist,team!=research`).
+            field_selector: Optional, Kubernetes field selector to filter the Jobs
+                (e.g. `metadata.name=mnist`).
+            limit: Optional, maximum number of Jobs to get per request. If it is set,
+                Jobs are listed page by page with multiple requests. By default all Jobs
+                are listed with a single request.
 
         Returns:
             list[object]: List of Job objects.
@@ -620,30 +807,393 @@ class TrainingClient(object):
                 f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
             )
 
-        result = []
+        if self.cache and label_selector is None and field_selector is None:
+            return self.get_job_cache(namespace, job_kind, timeout).list()
+
+        return list(
+            self._list_job_pages(
+                namespace=namespace,
+                job_kind=job_kind,
+                timeout=timeout,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                limit=limit,
+            )
+        )
+
+    def iter_jobs(
+        self,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+        limit: int = constants.DEFAULT_PAGE_SIZE,
+    ) -> Iterator[constants.JOB_MODELS_TYPE]:
+        """Iterate over Training Jobs with specific kind in namespace. Jobs are listed
+        page by page using the `continue` token and deserialized lazily, so only
+        one page of Jobs is kept in memory.
+
+        Args:
+            namespace: Namespace to list the Jobs. By default namespace is taken from
+                `TrainingClient` object.
+            job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `TrainingClient` object.
+            timeout: Kubernetes API server timeout in seconds to execute the request.
+            label_selector: Optional, Kubernetes label selector to filter the Jobs
+                (e.g. `app=mnist,team!=research`).
+            field_selector: Optional, Kubernetes field selector to filter the Jobs
+                (e.g. `metadata.name=mnist`).
+            limit: Maximum number of Jobs to get per request.
+
+        Returns:
+            Iterator[object]: Iterator over Job objects.
+                For example: iterator over KubeflowOrgV1PyTorchJob objects.
+
+        Raises:
+            ValueError: Job kind is invalid.
+            TimeoutError: Timeout to list Jobs
+            RuntimeError: Failed to list Jobs
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = job_kind or self.job_kind
+
+        if job_kind not in constants.JOB_PARAMETERS:
+            raise ValueError(
+                f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
+            )
+
+        return self._list_job_pages(
+            namespace=namespace,
+            job_kind=job_kind,
+            timeout=timeout,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            limit=limit,
+        )
+
+    def list_all_jobs(
+        self,
+        namespaces: Optional[List[str]] = None,
+        job_kinds: Optional[List[str]] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+        max_concurrency: int = constants.DEFAULT_MAX_CONCURRENCY,
+    ) -> types.JobList:
+        """List Training Jobs across multiple kinds and namespaces. Jobs for every kind
+        and namespace are listed concurrently, so the total latency is close to the
+        latency of the slowest request.
+
+        Args:
+            namespaces: Namespaces to list the Jobs. By default Jobs are listed across
+                all namespaces with one request per Job kind.
+            job_kinds: Kinds for the Jobs (e.g. `TFJob` or `PyTorchJob`). By default
+                Jobs of all kinds are listed.
+            timeout: Kubernetes API server timeout in seconds to execute the request.
+            max_concurrency: Maximum number of concurrent requests to the Kubernetes
+                API server.
+
+        Returns:
+            JobList: Listed Jobs with the time of the slowest request to list Jobs for
+                every kind. If Jobs of some kind failed to be listed, the exception
+                is stored in `errors`.
+
+        Raises:
+            ValueError: Job kind is invalid.
+        """
+
+        job_kinds = job_kinds or list(constants.JOB_PARAMETERS.keys())
+        for job_kind in job_kinds:
+            if job_kind not in constants.JOB_PARAMETERS:
+                raise ValueError(
+                    f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
+                )
+
+        # When namespaces are not set, list Jobs across all namespaces.
+        requests = [
+            (job_kind, namespace)
+            for job_kind in job_kinds
+            for namespace in namespaces or [None]
+        ]
+
+        def list_jobs(job_kind: str, namespace: Optional[str]):
+            """List Jobs and get the time of the request, including failed requests."""
+            start_time = time.perf_counter()
+            try:
+                jobs = (self.list_jobs if namespace else self._list_cluster_jobs)(
+                    namespace=namespace, job_kind=job_kind, timeout=timeout
+                )
+                return jobs, None, time.perf_counter() - start_time
+            except (TimeoutError, RuntimeError) as e:
+                return [], e, time.perf_counter() - start_time
+
+        result = types.JobList()
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(requests))
+        ) as executor:
+            futures = {
+                executor.submit(list_jobs, job_kind, namespace): job_kind
+                for job_kind, namespace in requests
+            }
+            for future in as_completed(futures):
+                job_kind = futures[future]
+                jobs, error, duration = future.result()
+                result.jobs.extend(jobs)
+                if error is not None:
+                    result.errors.setdefault(job_kind, error)
+                # Duration of the kind is the duration of its slowest namespace.
+                result.durations[job_kind] = max(
+                    result.durations.get(job_kind, 0), duration
+                )
+
+        return result
+
+    def _list_cluster_jobs(
+        self,
+        namespace: Optional[str],
+        job_kind: str,
+        timeout: int,
+    ) -> List[constants.JOB_MODELS_TYPE]:
+        """List Training Jobs with specific kind across all namespaces.
+        Namespace argument is ignored, it is kept to have the same signature as list_jobs.
+        """
+
         try:
-            thread = self.custom_api.list_namespaced_custom_object(
+            thread = self.custom_api.list_cluster_custom_object(
                 constants.GROUP,
                 constants.VERSION,
-                namespace,
                 constants.JOB_PARAMETERS[job_kind]["plural"],
                 async_req=True,
             )
             response = thread.get(timeout)
             result = [
-                self.api_client.deserialize(
-                    utils.FakeResponse(item),
-                    constants.JOB_PARAMETERS[job_kind]["model"],
+                deserializer.deserialize(
+                    item, constants.JOB_PARAMETERS[job_kind]["model"], lazy=self.lazy
                 )
                 for item in response.get("items")
             ]
         except multiprocessing.TimeoutError:
-            raise TimeoutError(f"Timeout to list {job_kind}s in namespace: {namespace}")
+            raise TimeoutError(f"Timeout to list {job_kind}s in all namespaces")
         except Exception:
-            raise RuntimeError(f"Failed to list {job_kind}s in namespace: {namespace}")
+            raise RuntimeError(f"Failed to list {job_kind}s in all namespaces")
 
         return result
 
+    def _list_job_pages(
+        self,
+        namespace: str,
+        job_kind: str,
+        timeout: int,
+        label_selector: Optional[str],
+        field_selector: Optional[str],
+        limit: Optional[int],
+        lazy: Optional[bool] = None,
+    ) -> Iterator[constants.JOB_MODELS_TYPE]:
+        """List Training Jobs page by page and yield them once the page is received.
+        By default Jobs are deserialized lazily if it is set in `TrainingClient` object.
+        """
+
+        lazy = self.lazy if lazy is None else lazy
+        continue_token = None
+        while True:
+            try:
+                thread = self.custom_api.list_namespaced_custom_object(
+                    constants.GROUP,
+                    constants.VERSION,
+                    namespace,
+                    constants.JOB_PARAMETERS[job_kind]["plural"],
+                    label_selector=label_selector,
+                    field_selector=field_selector,
+                    limit=limit,
+                    _continue=continue_token,
+                    async_req=True,
+                )
+                response = thread.get(timeout)
+                items = response.get("items")
+                continue_token = response.get("metadata", {}).get("continue")
+            except multiprocessing.TimeoutError:
+                raise TimeoutError(
+                    f"Timeout to list {job_kind}s in namespace: {namespace}"
+                )
+            except Exception:
+                raise RuntimeError(
+                    f"Failed to list {job_kind}s in namespace: {namespace}"
+                )
+
+            for item in items:
+                try:
+                    job = deserializer.deserialize(
+                        item,
+                        constants.JOB_PARAMETERS[job_kind]["model"],
+                        lazy=lazy,
+                    )
+                except Exception:
+                    raise RuntimeError(
+                        f"Failed to list {job_kind}s in namespace: {namespace}"
+                    )
+                yield job
+
+            if not continue_token:
+                return
+
+    def get_job_summary(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+    ) -> types.JobSummary:
+        """Get the summary of the Training Job status: the latest condition, number of
+        active, succeeded, and failed replicas for every replica type, and durations
+        from the condition timestamps. Replica counts are read from the Job status,
+        so Job pods are not listed.
+
+        Args:
+            name: Name for the Job.
+            namespace: Namespace for the Job. By default namespace is taken from
+                `TrainingClient` object.
+            job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `TrainingClient` object.
+            timeout: Kubernetes API server timeout in seconds to execute the request.
+
+        Returns:
+            JobSummary: Summary of the Job status.
+
+        Raises:
+            ValueError: Job kind is invalid.
+            TimeoutError: Timeout to get Job.
+            RuntimeError: Failed to get Job.
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = job_kind or self.job_kind
+
+        if job_kind not in constants.JOB_PARAMETERS:
+            raise ValueError(
+                f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
+            )
+
+        job = None
+        if self.cache:
+            job = self.get_job_cache(namespace, job_kind, timeout).get(name)
+        # Job is deserialized lazily, since the summary doesn't read the Job spec.
+        if job is None:
+            job = self._get_job(name, namespace, job_kind, timeout, lazy=True)
+
+        return utils.get_job_summary(job, job_kind)
+
+    def summarize_jobs(
+        self,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+        label_selector: Optional[str] = None,
+        limit: int = constants.DEFAULT_PAGE_SIZE,
+    ) -> List[types.JobSummary]:
+        """Get the summaries of the Training Jobs with specific kind in namespace.
+        See `get_job_summary` for the summary content. It can be used to poll the
+        progress of many Jobs, since Jobs are deserialized lazily page by page and
+        Job pods are not listed.
+
+        Args:
+            namespace: Namespace to list the Jobs. By default namespace is taken from
+                `TrainingClient` object.
+            job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `TrainingClient` object.
+            timeout: Kubernetes API server timeout in seconds to execute the request.
+            label_selector: Optional, Kubernetes label selector to filter the Jobs
+                (e.g. `app=mnist,team!=research`).
+            limit: Maximum number of Jobs to get per request.
+
+        Returns:
+            list[JobSummary]: List of the Job summaries.
+
+        Raises:
+            ValueError: Job kind is invalid.
+            TimeoutError: Timeout to list Jobs
+            RuntimeError: Failed to list Jobs
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = job_kind or self.job_kind
+
+        if job_kind not in constants.JOB_PARAMETERS:
+            raise ValueError(
+                f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
+            )
+
+        if self.cache and label_selector is None:
+            jobs = self.get_job_cache(namespace, job_kind, timeout).list()
+        else:
+            jobs = self._list_job_pages(
+                namespace=namespace,
+                job_kind=job_kind,
+                timeout=timeout,
+                label_selector=label_selector,
+                field_selector=None,
+                limit=limit,
+                lazy=True,
+            )
+
+        return [utils.get_job_summary(job, job_kind) for job in jobs]
+
+    def get_job_cache(
+        self,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+    ) -> JobCache:
+        """Get the local cache of Training Jobs with specific kind in namespace.
+        The cache is started and synced on the first call. It can be used to check
+        the cache staleness with `resource_version` and `last_sync_time` attributes.
+
+        Args:
+            namespace: Namespace of the Jobs. By default namespace is taken from
+                `TrainingClient` object.
+            job_kind: Kind for the Jobs (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `TrainingClient` object.
+            timeout: How many seconds to wait until the Jobs are listed for the first time.
+
+        Returns:
+            JobCache: Local cache of the Jobs.
+
+        Raises:
+            ValueError: Job cache is not enabled or Job kind is invalid.
+            TimeoutError: Timeout to sync Job cache.
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = job_kind or self.job_kind
+
+        if not self.cache:
+            raise ValueError("Job cache must be enabled with `cache=True` argument")
+
+        if job_kind not in constants.JOB_PARAMETERS:
+            raise ValueError(
+                f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
+            )
+
+        with self.job_caches_lock:
+            job_cache = self.job_caches.get((namespace, job_kind))
+            if job_cache is None:
+                job_cache = JobCache(
+                    self.custom_api,
+                    self.api_client,
+                    namespace,
+                    job_kind,
+                    timeout,
+                    lazy=self.lazy,
+                )
+                job_cache.start()
+                self.job_caches[(namespace, job_kind)] = job_cache
+
+        if not job_cache.wait_for_sync(timeout):
+            raise TimeoutError(
+                f"Timeout to sync {job_kind}s cache in namespace: {namespace}"
+            )
+
+        return job_cache
+
     def get_job_conditions(
         self,
         name: Optional[str] = None,
@@ -895,6 +1445,7 @@ class TrainingClient(object):
         polling_interval: int = 15,
         callback: Optional[Callable] = None,
         timeout: int = constants.DEFAULT_TIMEOUT,
+        use_watch: bool = False,
     ) -> constants.JOB_MODELS_TYPE:
         """Wait until Training Job reaches any of the specified conditions.
         By default it waits for the Succeeded condition.
@@ -914,6 +1465,11 @@ class TrainingClient(object):
                 status is polled. This function takes a single argument which
                 is current Job object.
             timeout: Kubernetes API server timeout in seconds to execute the request.
+            use_watch: Whether to watch the Job instead of polling it every
+                `polling_interval` seconds. The watch returns as soon as the Job
+                condition changes and uses a single long-lived request. If the watch
+                expires (HTTP 410 Gone), it falls back to polling for the rest of
+                `wait_timeout`.
 
         Returns:
             object: Job object. For example: KubeflowOrgV1PyTorchJob
@@ -933,6 +1489,30 @@ class TrainingClient(object):
                 f"Expected conditions: {expected_conditions} must be subset of \
                     {constants.JOB_CONDITIONS}"
             )
+
+        if use_watch:
+            deadline = time.monotonic() + wait_timeout
+            try:
+                return self._watch_job_conditions(
+                    name=name,
+                    namespace=namespace,
+                    job_kind=job_kind,
+                    expected_conditions=expected_conditions,
+                    deadline=deadline,
+                    callback=callback,
+                    timeout=timeout,
+                )
+            except client.ApiException as e:
+                if e.status != HTTPStatus.GONE:
+                    raise RuntimeError(
+                        f"Failed to watch {job_kind}: {namespace}/{name}"
+                    )
+                logger.debug(
+                    f"Watch for {job_kind} {namespace}/{name} has expired, "
+                    "fall back to polling"
+                )
+            wait_timeout = max(deadline - time.monotonic(), 0)
+
         for _ in range(round(wait_timeout / polling_interval)):
             # We should get Job only once per cycle and check the statuses.
             job = self.get_job(
@@ -942,43 +1522,303 @@ class TrainingClient(object):
                 timeout=timeout,
             )
 
-            # Get Job conditions.
-            conditions = self.get_job_conditions(
-                job=job, timeout=timeout, job_kind=job_kind
+            # Return Job when it reaches expected condition.
+            if self._is_job_in_conditions(
+                job, namespace, job_kind, expected_conditions, callback
+            ):
+                return job
+
+            time.sleep(polling_interval)
+
+        raise TimeoutError(
+            f"Timeout waiting for {job_kind}: {namespace}/{name} to reach expected conditions: \
+                {expected_conditions}"
+        )
+
+    def wait_for_jobs(
+        self,
+        names: List[str],
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        expected_conditions: Set = {constants.JOB_CONDITION_SUCCEEDED},
+        wait_timeout: int = 600,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+    ) -> Iterator[Future]:
+        """Wait until multiple Training Jobs reach any of the specified conditions.
+        By default it waits for the Succeeded condition.
+
+        All Jobs are tracked with a single namespace-scoped watch on the Job kind, so
+        the number of requests to the Kubernetes API server doesn't grow with the
+        number of Jobs. Futures are yielded as soon as their Jobs complete.
+
+        Example:
+            .. code-block:: python
+                for future in client.wait_for_jobs(names):
+                    try:
+                        job = future.result()
+                    except RuntimeError as e:
+                        print(e)
+
+        Args:
+            names: Names of the Jobs.
+            namespace: Namespace for the Jobs. By default namespace is taken from
+                `TrainingClient` object.
+            job_kind: Kind for the Jobs (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `TrainingClient` object.
+            expected_conditions: Set of expected conditions. It must be subset of this:
+                `{"Created", "Running", "Restarting", "Succeeded", "Failed"}`
+            wait_timeout: How many seconds to wait until Jobs reach one of
+                the expected conditions.
+            timeout: Kubernetes API server timeout in seconds to execute the request.
+
+        Returns:
+            Iterator[Future]: Iterator over the Job futures in the order of completion.
+                Future returns the Job object, for example: KubeflowOrgV1PyTorchJob.
+                Future raises TimeoutError if Job doesn't reach the expected conditions
+                within `wait_timeout`, or RuntimeError if Job is Failed and Failed is not
+                in `expected_conditions` set, Job is deleted, or Jobs can't be watched.
+
+        Raises:
+            ValueError: Invalid input parameters.
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = job_kind or self.job_kind
+
+        if job_kind not in constants.JOB_PARAMETERS:
+            raise ValueError(
+                f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
             )
-            if len(conditions) > 0:
-                status_logger(
-                    name,
-                    conditions[-1].type,
-                    conditions[-1].last_transition_time,
-                )
 
-            # Execute callback function is it is set.
-            if callback:
-                callback(job)
+        if not expected_conditions.issubset(constants.JOB_CONDITIONS):
+            raise ValueError(
+                f"Expected conditions: {expected_conditions} must be subset of \
+                    {constants.JOB_CONDITIONS}"
+            )
+
+        futures = {name: Future() for name in names}
+        threading.Thread(
+            target=self._watch_jobs_conditions,
+            args=(
+                futures,
+                namespace,
+                job_kind,
+                expected_conditions,
+                time.monotonic() + wait_timeout,
+                timeout,
+            ),
+            daemon=True,
+        ).start()
+
+        return as_completed(futures.values())
 
-            # Raise an exception if Job is Failed and Failed is not the expected condition.
-            if (
-                constants.JOB_CONDITION_FAILED not in expected_conditions
-                and utils.has_condition(conditions, constants.JOB_CONDITION_FAILED)
+    def _watch_job_conditions(
+        self,
+        name: str,
+        namespace: str,
+        job_kind: str,
+        expected_conditions: Set,
+        deadline: float,
+        callback: Optional[Callable],
+        timeout: int,
+    ) -> constants.JOB_MODELS_TYPE:
+        """Watch the Training Job until it reaches any of the expected conditions.
+        The watch is resumed from the last seen resource version until the deadline.
+        It raises ApiException with status 410 if the resource version is expired.
+        """
+
+        # Get the Job first, it might already be in the expected conditions.
+        job = self.get_job(
+            name=name,
+            namespace=namespace,
+            job_kind=job_kind,
+            timeout=timeout,
+        )
+        if self._is_job_in_conditions(
+            job, namespace, job_kind, expected_conditions, callback
+        ):
+            return job
+
+        resource_version = job.metadata.resource_version
+        w = watch.Watch()
+        while time.monotonic() < deadline:
+            for event in w.stream(
+                self.custom_api.list_namespaced_custom_object,
+                group=constants.GROUP,
+                version=constants.VERSION,
+                namespace=namespace,
+                plural=constants.JOB_PARAMETERS[job_kind]["plural"],
+                field_selector=f"metadata.name={name}",
+                resource_version=resource_version,
+                timeout_seconds=max(int(deadline - time.monotonic()), 1),
             ):
-                raise RuntimeError(
-                    f"{job_kind} {namespace}/{name} is Failed. "
-                    f"{job_kind} conditions: {job.status.conditions}"
-                )
+                if event["type"] == "DELETED":
+                    raise RuntimeError(f"{job_kind} {namespace}/{name} is deleted")
 
-            # Return Job when it reaches expected condition.
-            for expected_condition in expected_conditions:
-                if utils.has_condition(conditions, expected_condition):
+                job = deserializer.deserialize(
+                    event["raw_object"],
+                    constants.JOB_PARAMETERS[job_kind]["model"],
+                    lazy=self.lazy,
+                )
+                if self._is_job_in_conditions(
+                    job, namespace, job_kind, expected_conditions, callback
+                ):
+                    w.stop()
                     return job
 
-            time.sleep(polling_interval)
+            # Resume the watch from the last seen resource version.
+            resource_version = w.resource_version or resource_version
 
         raise TimeoutError(
             f"Timeout waiting for {job_kind}: {namespace}/{name} to reach expected conditions: \
                 {expected_conditions}"
         )
 
+    def _watch_jobs_conditions(
+        self,
+        futures: Dict[str, Future],
+        namespace: str,
+        job_kind: str,
+        expected_conditions: Set,
+        deadline: float,
+        timeout: int,
+    ):
+        """Watch the Training Jobs in namespace and resolve the Job futures once Jobs
+        reach any of the expected conditions. Jobs are listed to get the initial state,
+        and they are listed again if the watch resource version is expired.
+        """
+
+        pending = set(futures)
+        model = constants.JOB_PARAMETERS[job_kind]["model"]
+        plural = constants.JOB_PARAMETERS[job_kind]["plural"]
+
+        def resolve(obj: Dict[str, Any]):
+            job = deserializer.deserialize(obj, model, lazy=self.lazy)
+            try:
+                if not self._is_job_in_conditions(
+                    job, namespace, job_kind, expected_conditions
+                ):
+                    return
+                futures[job.metadata.name].set_result(job)
+            except RuntimeError as e:
+                futures[job.metadata.name].set_exception(e)
+            pending.discard(job.metadata.name)
+
+        try:
+            w = watch.Watch()
+            resource_version = None
+            relist = True
+            while pending and time.monotonic() < deadline:
+                if relist:
+                    thread = self.custom_api.list_namespaced_custom_object(
+                        constants.GROUP,
+                        constants.VERSION,
+                        namespace,
+                        plural,
+                        async_req=True,
+                    )
+                    response = thread.get(timeout)
+                    for item in response.get("items"):
+                        if item["metadata"]["name"] in pending:
+                            resolve(item)
+                    resource_version = response.get("metadata", {}).get(
+                        "resourceVersion"
+                    )
+                    relist = False
+                    continue
+
+                try:
+                    for event in w.stream(
+                        self.custom_api.list_namespaced_custom_object,
+                        group=constants.GROUP,
+                        version=constants.VERSION,
+                        namespace=namespace,
+                        plural=plural,
+                        resource_version=resource_version,
+                        timeout_seconds=max(int(deadline - time.monotonic()), 1),
+                    ):
+                        # Skip other Jobs in namespace without deserialization.
+                        name = event["raw_object"]["metadata"]["name"]
+                        if name not in pending:
+                            continue
+
+                        if event["type"] == "DELETED":
+                            futures[name].set_exception(
+                                RuntimeError(
+                                    f"{job_kind} {namespace}/{name} is deleted"
+                                )
+                            )
+                            pending.discard(name)
+                        else:
+                            resolve(event["raw_object"])
+
+                        if not pending:
+                            w.stop()
+                            break
+
+                    # Resume the watch from the last seen resource version.
+                    resource_version = w.resource_version or resource_version
+                except client.ApiException as e:
+                    if e.status != HTTPStatus.GONE:
+                        raise
+                    relist = True
+        except Exception:
+            for name in pending:
+                futures[name].set_exception(
+                    RuntimeError(
+                        f"Failed to watch {job_kind}s in namespace: {namespace}"
+                    )
+                )
+            return
+
+        for name in pending:
+            futures[name].set_exception(
+                TimeoutError(
+                    f"Timeout waiting for {job_kind}: {namespace}/{name} to reach "
+                    f"expected conditions: {expected_conditions}"
+                )
+            )
+
+    def _is_job_in_conditions(
+        self,
+        job: constants.JOB_MODELS_TYPE,
+        namespace: str,
+        job_kind: str,
+        expected_conditions: Set,
+        callback: Optional[Callable] = None,
+    ) -> bool:
+        """Check if Training Job reaches any of the expected conditions.
+        It raises RuntimeError if Job is Failed and Failed is not the expected condition.
+        """
+
+        # Get Job conditions.
+        conditions = self.get_job_conditions(job=job, job_kind=job_kind)
+        if len(conditions) > 0:
+            status_logger(
+                job.metadata.name,
+                conditions[-1].type,
+                conditions[-1].last_transition_time,
+            )
+
+        # Execute callback function is it is set.
+        if callback:
+            callback(job)
+
+        # Raise an exception if Job is Failed and Failed is not the expected condition.
+        if (
+            constants.JOB_CONDITION_FAILED not in expected_conditions
+            and utils.has_condition(conditions, constants.JOB_CONDITION_FAILED)
+        ):
+            raise RuntimeError(
+                f"{job_kind} {namespace}/{job.metadata.name} is Failed. "
+                f"{job_kind} conditions: {job.status.conditions}"
+            )
+
+        for expected_condition in expected_conditions:
+            if utils.has_condition(conditions, expected_condition):
+                return True
+        return False
+
     def get_job_pods(
         self,
         name: str,
@@ -987,7 +1827,8 @@ class TrainingClient(object):
         replica_type: Optional[str] = None,
         replica_index: Optional[int] = None,
         timeout: int = constants.DEFAULT_TIMEOUT,
-    ) -> List[models.V1Pod]:
+        metadata_only: bool = False,
+    ) -> Union[List[models.V1Pod], List[models.V1PartialObjectMetadata]]:
         """Get pods for the Training Job.
 
         Args:
@@ -1011,9 +1852,13 @@ class TrainingClient(object):
 
             replica_index: Index for the Job replica.
             timeout: Kubernetes API server timeout in seconds to execute the request.
+            metadata_only: Whether to get only the pod metadata. The Kubernetes API
+                server doesn't send pod specs and statuses, so the response is much
+                smaller for Jobs with many pods.
 
         Returns:
-            list[V1Pod]: List of the Job pods.
+            list[V1Pod]: List of the Job pods. If `metadata_only` is set, it returns
+                list of V1PartialObjectMetadata objects.
 
         Raises:
             ValueError: Job replica type is invalid.
@@ -1023,39 +1868,15 @@ class TrainingClient(object):
 
         namespace = namespace or self.namespace
 
-        if (
-            replica_type is not None
-            and replica_type not in constants.TFJOB_REPLICA_TYPES
-            and replica_type not in constants.PYTORCHJOB_REPLICA_TYPES
-            and replica_type not in constants.XGBOOSTJOB_REPLICA_TYPES
-            and replica_type not in constants.MPIJOB_REPLICA_TYPES
-            and replica_type not in constants.PADDLEJOB_REPLICA_TYPES
-            and replica_type not in constants.JAXJOB_REPLICA_TYPES
-        ):
-            raise ValueError(
-                f"TFJob replica type must be one of {constants.TFJOB_REPLICA_TYPES}\n"
-                f"PyTorchJob replica type must be one of {constants.PYTORCHJOB_REPLICA_TYPES}\n"
-                f"XGBoostJob replica type must be one of {constants.XGBOOSTJOB_REPLICA_TYPES}\n"
-                f"MPIJob replica type must be one of {constants.MPIJOB_REPLICA_TYPES}\n"
-                f"PaddleJob replica type must be one of {constants.PADDLEJOB_REPLICA_TYPES}"
-                f"JAXJob replica type must be one of {constants.PADDLEJOB_REPLICA_TYPES}"
-            )
-
-        label_selector = f"{constants.JOB_NAME_LABEL}={name}"
-
-        # Add Job role label if that is required.
-        if is_master:
-            label_selector += f",{constants.JOB_ROLE_LABEL}={constants.JOB_ROLE_MASTER}"
-
-        # Add Replica type label if that is required.
-        if replica_type:
-            label_selector += (
-                f",{constants.REPLICA_TYPE_LABEL}={str.lower(replica_type)}"
-            )
+        label_selector = utils.get_job_pods_label_selector(
+            name=name,
+            is_master=is_master,
+            replica_type=replica_type,
+            replica_index=replica_index,
+        )
 
-        # Add Replica index label if that is required.
-        if replica_index is not None:
-            label_selector += f",{constants.REPLICA_INDEX_LABEL}={replica_index}"
+        if metadata_only:
+            return self._list_pod_metadata(name, namespace, label_selector, timeout)
 
         # Return list of Training Job pods.
         try:
@@ -1070,6 +1891,41 @@ class TrainingClient(object):
         except Exception:
             raise RuntimeError(f"Failed to list pods for Job: {namespace}/{name}")
 
+    def _list_pod_metadata(
+        self,
+        name: str,
+        namespace: str,
+        label_selector: str,
+        timeout: int,
+    ) -> List[models.V1PartialObjectMetadata]:
+        """List metadata of the Training Job pods with the PartialObjectMetadataList
+        response. Generated Kubernetes APIs don't allow to set the Accept header,
+        so the request is sent with the Kubernetes API client.
+        """
+
+        try:
+            thread = self.core_api.api_client.call_api(
+                "/api/v1/namespaces/{namespace}/pods",
+                "GET",
+                path_params={"namespace": namespace},
+                query_params=[("labelSelector", label_selector)],
+                header_params={"Accept": constants.PARTIAL_OBJECT_METADATA_LIST_ACCEPT},
+                auth_settings=["BearerToken"],
+                _return_http_data_only=True,
+                _preload_content=False,
+                async_req=True,
+            )
+            response = thread.get(timeout)
+            return deserializer.deserialize(
+                json.loads(response.data).get("items") or [],
+                "list[V1PartialObjectMetadata]",
+                lazy=self.lazy,
+            )
+        except multiprocessing.TimeoutError:
+            raise TimeoutError(f"Timeout to list pods for Job: {namespace}/{name}")
+        except Exception:
+            raise RuntimeError(f"Failed to list pods for Job: {namespace}/{name}")
+
     def get_job_pod_names(
         self,
         name: str,
@@ -1079,7 +1935,7 @@ class TrainingClient(object):
         replica_index: Optional[int] = None,
         timeout: int = constants.DEFAULT_TIMEOUT,
     ) -> List[str]:
-        """Get pod names for the Training Job.
+        """Get pod names for the Training Job. Only pod metadata is listed.
 
         Args:
             name: Name for the Job.
@@ -1121,6 +1977,7 @@ class TrainingClient(object):
             replica_type=replica_type,
             replica_index=replica_index,
             timeout=timeout,
+            metadata_only=True,
         )
         pod_names = []
         for pod in pods:
@@ -1138,6 +1995,9 @@ class TrainingClient(object):
         follow: bool = False,
         timeout: int = constants.DEFAULT_TIMEOUT,
         verbose: bool = False,
+        max_concurrency: int = constants.DEFAULT_MAX_CONCURRENCY,
+        limit_bytes: Optional[int] = None,
+        gzip: bool = False,
     ) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
         """Get the logs for every Training Job pod. By default it returns logs from
         the `master` pod. Logs are returned in this format: { "pod-name": "Log data" }.
@@ -1169,6 +2029,12 @@ class TrainingClient(object):
                 to execute the request.
             verbose: Whether to get Kubernetes events for Job and corresponding pods.
                 If you need to get events from all PyTorchJob's Pods, set `isMaster = False`.
+            max_concurrency: Maximum number of pods to read the logs concurrently when
+                `follow = False`.
+            limit_bytes: Optional, number of bytes to get from the logs of every pod.
+            gzip: Whether to request the gzip-compressed logs from the Kubernetes API
+                server when `follow = False`. The API server compresses only large
+                responses, and only if the `APIResponseCompression` feature is enabled.
 
         Returns:
             Dict[str, str]: A dictionary in which the keys are pod names and the
@@ -1208,97 +2074,382 @@ class TrainingClient(object):
         logs_dict = {}
         events_dict = {}
         if pods and follow:
-            log_streams = []
-            for pod in pods:
-                if (
-                    pod.status is not None
-                    and pod.status.phase != constants.POD_PHASE_PENDING
-                ):
-                    log_streams.append(
-                        watch.Watch().stream(
-                            self.core_api.read_namespaced_pod_log,
-                            name=pod.metadata.name,
-                            namespace=namespace,
-                            container=constants.JOB_PARAMETERS[job_kind]["container"],
-                        )
-                    )
-            finished = [False for _ in log_streams]
-
-            # Create thread and queue per stream, for non-blocking iteration
-            log_queue_pool = utils.get_log_queue_pool(log_streams)
-
-            # Iterate over every watching pods' log queue
-            while True:
-                for index, log_queue in enumerate(log_queue_pool):
-                    if all(finished):
-                        break
-                    if finished[index]:
-                        continue
-                    # grouping the every 50 log lines of the same pod
-                    for _ in range(50):
-                        try:
-                            logline = log_queue.get(timeout=1)
-                            if logline is None:
-                                finished[index] = True
-                                break
-
-                            # Print logs to the StdOut
-                            print(f"[Pod {pods[index].metadata.name}]: {logline}")
-                            # Add logs to the results dict.
-                            if pods[index].metadata.name not in logs_dict:
-                                logs_dict[pods[index].metadata.name] = logline
-                            else:
-                                logs_dict[pods[index].metadata.name] += logline
-                        except queue.Empty:
-                            break
-                if all(finished):
-                    break
+            loglines: Dict[str, List[str]] = {}
+            for pod_name, _, logline in self._stream_pod_logs(
+                pods,
+                namespace,
+                job_kind,
+                follow=True,
+                timestamps=False,
+                limit_bytes=limit_bytes,
+            ):
+                # Print logs to the StdOut
+                print(f"[Pod {pod_name}]: {logline}")
+                loglines.setdefault(pod_name, []).append(logline)
+            # Add logs to the results dict.
+            for pod_name, lines in loglines.items():
+                logs_dict[pod_name] = "".join(f"{line}\n" for line in lines)
         elif pods:
-            for pod in pods:
-                if (
-                    pod.status is not None
-                    and pod.status.phase != constants.POD_PHASE_PENDING
-                ):
-                    try:
-                        pod_logs = self.core_api.read_namespaced_pod_log(
-                            name=pod.metadata.name,
-                            namespace=namespace,
-                            container=constants.JOB_PARAMETERS[job_kind]["container"],
-                        )
-                        logs_dict[pod.metadata.name] = pod_logs
-                    except Exception:
-                        raise RuntimeError(
-                            f"Failed to read logs for pod {namespace}/{pod.metadata.name}"
+            pod_names = [
+                pod.metadata.name
+                for pod in pods
+                if pod.status is not None
+                and pod.status.phase != constants.POD_PHASE_PENDING
+            ]
+            core_api = self._get_gzip_core_api() if gzip else self.core_api
+            # Logs are read concurrently, so the total time is close to the time to
+            # read logs of the slowest pod.
+            if pod_names:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_concurrency, len(pod_names))
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            self._read_pod_log,
+                            core_api,
+                            pod_name,
+                            namespace,
+                            job_kind,
+                            limit_bytes,
                         )
+                        for pod_name in pod_names
+                    ]
+                    # Logs are added in the order of pods.
+                    for pod_name, future in zip(pod_names, futures):
+                        logs_dict[pod_name] = future.result()
         # If verbose is set, return Kubernetes events for Job and pods.
         if verbose:
             job = self.get_job(name=name, namespace=namespace)
-            events = self.core_api.list_namespaced_event(namespace=namespace)
+            objects = {(job_kind, name): job.metadata.creation_timestamp}
+            for pod in pods or []:
+                objects[(constants.POD_KIND, pod.metadata.name)] = (
+                    pod.metadata.creation_timestamp
+                )
 
             # Get events for the Job and Job's pods.
-            for event in events.items:
-                utils.add_event_to_dict(
-                    events_dict=events_dict,
-                    event=event,
-                    object_kind=job_kind,
-                    object_name=name,
-                    object_creation_timestamp=job.metadata.creation_timestamp,
-                )
-                if pods:
-                    for pod in pods:
-                        utils.add_event_to_dict(
-                            events_dict=events_dict,
-                            event=event,
-                            object_kind=constants.POD_KIND,
-                            object_name=pod.metadata.name,
-                            object_creation_timestamp=pod.metadata.creation_timestamp,
-                        )
+            utils.add_events_to_dict(
+                events_dict=events_dict,
+                events=self._list_object_events(
+                    list(objects), namespace, max_concurrency
+                ),
+                objects=objects,
+            )
 
         return logs_dict, events_dict
 
+    def _list_object_events(
+        self,
+        objects: List[Tuple[str, str]],
+        namespace: str,
+        max_concurrency: int,
+    ) -> List[models.CoreV1Event]:
+        """List Kubernetes events of the objects. Events are listed concurrently with
+        the field selector for every object, so events of other objects in namespace
+        are not sent by the Kubernetes API server.
+        """
+
+        def list_events(kind: str, name: str) -> List[models.CoreV1Event]:
+            return self.core_api.list_namespaced_event(
+                namespace=namespace,
+                field_selector=f"involvedObject.kind={kind},involvedObject.name={name}",
+            ).items
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(objects))
+        ) as executor:
+            futures = [executor.submit(list_events, *obj) for obj in objects]
+            return [event for future in futures for event in future.result()]
+
+    def _read_pod_log(
+        self,
+        core_api: client.CoreV1Api,
+        pod_name: str,
+        namespace: str,
+        job_kind: str,
+        limit_bytes: Optional[int],
+    ) -> str:
+        """Read the logs of the pod container."""
+
+        try:
+            return core_api.read_namespaced_pod_log(
+                name=pod_name,
+                namespace=namespace,
+                container=constants.JOB_PARAMETERS[job_kind]["container"],
+                limit_bytes=limit_bytes,
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to read logs for pod {namespace}/{pod_name}"
+            ) from e
+
+    def _get_gzip_core_api(self) -> client.CoreV1Api:
+        """Get the Kubernetes Core API which requests gzip-compressed responses.
+        Responses are decompressed by urllib3 when they are read.
+        """
+
+        if self._gzip_core_api is None:
+            k8s_client = PooledApiClient(
+                self._k8s_clients[0].configuration,
+                header_name="Accept-Encoding",
+                header_value="gzip",
+                **self._pool_kwargs,
+            )
+            self._k8s_clients.append(k8s_client)
+            self._gzip_core_api = client.CoreV1Api(k8s_client)
+        return self._gzip_core_api
+
+    def stream_job_logs(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        is_master: bool = True,
+        replica_type: Optional[str] = None,
+        replica_index: Optional[int] = None,
+        follow: bool = False,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+        since_seconds: Optional[int] = None,
+        tail_lines: Optional[int] = None,
+        limit_bytes: Optional[int] = None,
+        timestamps: bool = True,
+    ) -> Iterator[Tuple[str, Optional[datetime], str]]:
+        """Stream the logs of the Training Job pods line by line. Logs are not kept
+        in memory, so this API can be used for large logs. By default it streams
+        logs from the `master` pod.
+
+        Args:
+            name: Name for the Job.
+            namespace: Namespace for the Job. By default namespace is taken from
+                `TrainingClient` object.
+            job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `TrainingClient` object.
+            is_master: Whether to get logs for the pod with the label
+                `training.kubeflow.org/job-role: master`.
+            replica_type: Optional, type of the Job replica. See `get_job_logs` for
+                the supported replica types.
+            replica_index: Optional, index for the Job replica.
+            follow: Whether to follow the log streams of the pods. Log lines of all
+                pods are yielded as they arrive. Otherwise, logs are yielded pod by pod.
+            timeout: Optional, Kubernetes API server timeout in seconds
+                to execute the request.
+            since_seconds: Optional, relative time in seconds before the current time
+                from which to get logs.
+            tail_lines: Optional, number of lines from the end of the logs to get
+                for every pod.
+            limit_bytes: Optional, number of bytes to get from the logs of every pod.
+            timestamps: Whether to get the timestamp of every log line.
+
+        Returns:
+            Iterator[Tuple[str, datetime, str]]: Iterator over pod name, timestamp, and
+                log line without newline. Timestamp is None if `timestamps` is False.
+
+        Raises:
+            ValueError: Job replica type is invalid.
+            TimeoutError: Timeout to get Job pods.
+            RuntimeError: Failed to get Job pods or to read logs.
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = job_kind or self.job_kind
+
+        pods = self.get_job_pods(
+            name=name,
+            namespace=namespace,
+            is_master=is_master,
+            replica_type=replica_type,
+            replica_index=replica_index,
+            timeout=timeout,
+        )
+
+        return self._stream_pod_logs(
+            pods,
+            namespace,
+            job_kind,
+            follow=follow,
+            timestamps=timestamps,
+            since_seconds=since_seconds,
+            tail_lines=tail_lines,
+            limit_bytes=limit_bytes,
+        )
+
+    def _stream_pod_logs(
+        self,
+        pods: List[models.V1Pod],
+        namespace: str,
+        job_kind: str,
+        follow: bool,
+        timestamps: bool,
+        **log_kwargs: Any,
+    ) -> Iterator[Tuple[str, Optional[datetime], str]]:
+        """Stream logs of the pods which are not pending."""
+
+        # Optional arguments are passed to the Kubernetes API only if they are set.
+        log_kwargs = {k: v for k, v in log_kwargs.items() if v is not None}
+        if timestamps:
+            log_kwargs["timestamps"] = True
+
+        pod_names = [
+            pod.metadata.name
+            for pod in pods
+            if pod.status is not None
+            and pod.status.phase != constants.POD_PHASE_PENDING
+        ]
+        # Follow all pods at once, otherwise read logs pod by pod.
+        pod_groups = [pod_names] if follow else [[pod_name] for pod_name in pod_names]
+
+        for pod_group in pod_groups:
+            with LogMultiplexer(
+                self.core_api,
+                namespace=namespace,
+                container=constants.JOB_PARAMETERS[job_kind]["container"],
+                follow=follow,
+                **log_kwargs,
+            ) as log_multiplexer:
+                for pod_name in pod_group:
+                    log_multiplexer.add(pod_name)
+                for pod_name, logline in log_multiplexer:
+                    timestamp = None
+                    if timestamps:
+                        timestamp, logline = utils.split_log_timestamp(logline)
+                    yield pod_name, timestamp, logline
+
+    def get_job_events(
+        self,
+        name: str,
+        namespace: Optional[str] = None,
+        job_kind: Optional[str] = None,
+        timeout: int = constants.DEFAULT_TIMEOUT,
+    ) -> Iterator[models.CoreV1Event]:
+        """Watch the Kubernetes events of the Training Job and its pods. Existing
+        events are returned first, and new events are returned as they happen until
+        the timeout. It can be used to debug the running Job, for example:
+
+        ```python
+        for event in TrainingClient().get_job_events(name="train-mnist"):
+            print(event.involved_object.name, event.reason, event.message)
+        ```
+
+        Events of the Job and every pod are watched with the field selector, so events
+        of other objects in namespace are not sent by the Kubernetes API server. Every
+        watch uses a separate thread and connection.
+
+        Args:
+            name: Name for the Job.
+            namespace: Namespace for the Job. By default namespace is taken from
+                `TrainingClient` object.
+            job_kind: Kind for the Job (e.g. `TFJob` or `PyTorchJob`). By default Job kind
+                is taken from `TrainingClient` object.
+            timeout: How many seconds to watch the events.
+
+        Returns:
+            Iterator[CoreV1Event]: Iterator over the Job and pod events.
+
+        Raises:
+            ValueError: Job kind is invalid.
+            RuntimeError: Failed to watch Job pods or events.
+        """
+
+        namespace = namespace or self.namespace
+        job_kind = job_kind or self.job_kind
+
+        if job_kind not in constants.JOB_PARAMETERS:
+            raise ValueError(
+                f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
+            )
+
+        return self._watch_job_events(
+            name=name,
+            namespace=namespace,
+            job_kind=job_kind,
+            deadline=time.monotonic() + timeout,
+        )
+
+    def _watch_job_events(
+        self,
+        name: str,
+        namespace: str,
+        job_kind: str,
+        deadline: float,
+    ) -> Iterator[models.CoreV1Event]:
+        """Watch events of the Job and its pods in the separate threads, and yield them
+        once they are received. Pods of the Job are watched with the label selector,
+        so events of the new pods are watched once the pods are created.
+        """
+
+        results: queue.Queue = queue.Queue()
+        stopped = threading.Event()
+        watched_pod_names: Set[str] = set()
+
+        def watch_objects(func: Callable, on_event: Callable, **kwargs):
+            w = watch.Watch()
+            resource_version = None
+            try:
+                while not stopped.is_set() and time.monotonic() < deadline:
+                    for event in w.stream(
+                        func,
+                        namespace=namespace,
+                        resource_version=resource_version,
+                        timeout_seconds=max(int(deadline - time.monotonic()), 1),
+                        **kwargs,
+                    ):
+                        if stopped.is_set():
+                            return
+                        on_event(event)
+
+                    # Resume the watch from the last seen resource version.
+                    resource_version = w.resource_version or resource_version
+            except Exception as e:
+                results.put(e)
+            finally:
+                w.stop()
+
+        def put_event(event: Dict[str, Any]):
+            if event["type"] != "DELETED":
+                results.put(event["object"])
+
+        def watch_events(kind: str, object_name: str):
+            threading.Thread(
+                target=watch_objects,
+                args=(self.core_api.list_namespaced_event, put_event),
+                kwargs={
+                    "field_selector": f"involvedObject.kind={kind},"
+                    f"involvedObject.name={object_name}"
+                },
+                daemon=True,
+            ).start()
+
+        def watch_pod_events(event: Dict[str, Any]):
+            pod_name = event["object"].metadata.name
+            if pod_name not in watched_pod_names:
+                watched_pod_names.add(pod_name)
+                watch_events(constants.POD_KIND, pod_name)
+
+        watch_events(job_kind, name)
+        threading.Thread(
+            target=watch_objects,
+            args=(self.core_api.list_namespaced_pod, watch_pod_events),
+            kwargs={"label_selector": utils.get_job_pods_label_selector(name=name)},
+            daemon=True,
+        ).start()
+
+        try:
+            while time.monotonic() < deadline:
+                try:
+                    result = results.get(timeout=deadline - time.monotonic())
+                except (queue.Empty, ValueError):
+                    return
+                if isinstance(result, Exception):
+                    raise RuntimeError(
+                        f"Failed to watch events for {job_kind}: {namespace}/{name}"
+                    ) from result
+                yield result
+        finally:
+            # Watches are finished once the next event is received or they time out.
+            stopped.set()
+
     def update_job(
         self,
-        job: constants.JOB_MODELS_TYPE,
+        job: Union[constants.JOB_MODELS_TYPE, Dict[str, Any], bytes],
         name: str,
         namespace: Optional[str] = None,
         job_kind: Optional[str] = None,
@@ -1307,7 +2458,9 @@ class TrainingClient(object):
 
         Args:
             job: Job object. For example, object with type
-                KubeflowOrgV1TFJob or KubeflowOrgV1PyTorchJob.
+                KubeflowOrgV1TFJob or KubeflowOrgV1PyTorchJob. Job can also be set as
+                serialized dict or JSON bytes, which are sent to the Kubernetes API
+                server without serialization.
             name: Name for the Job.
             namespace: Namespace for the Job. By default namespace is taken from
                 `TrainingClient` object.
@@ -1326,6 +2479,8 @@ class TrainingClient(object):
                 f"Job kind must be one of these: {constants.JOB_PARAMETERS.keys()}"
             )
 
+        job = self._get_serialized_job(job)
+
         try:
             self.custom_api.patch_namespaced_custom_object(
                 constants.GROUP,
@@ -1342,6 +2497,14 @@ class TrainingClient(object):
 
         logger.debug(f"{job_kind} {namespace}/{name} has been updated")
 
+    def _get_serialized_job(
+        self, job: Union[constants.JOB_MODELS_TYPE, Dict[str, Any], bytes, None]
+    ) -> Union[constants.JOB_MODELS_TYPE, serializer.SerializedObject, None]:
+        """Mark the Job dict or JSON bytes as serialized, so the Kubernetes API
+        client sends them as is. Other objects are returned without changes.
+        """
+        return serializer.as_serialized(job)
+
     def delete_job(
         self,
         name: str,
@@ -1,6 +1,10 @@
+import json
 import multiprocessing
-import queue
-from datetime import datetime, timedelta
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 import pytest
@@ -10,13 +14,17 @@ from kubeflow.training import (
     KubeflowOrgV1PyTorchJob,
     KubeflowOrgV1PyTorchJobSpec,
     KubeflowOrgV1ReplicaSpec,
+    KubeflowOrgV1ReplicaStatus,
     KubeflowOrgV1RunPolicy,
     TrainingClient,
     constants,
 )
 from kubeflow.training.models import V1DeleteOptions
+from kubeflow.training.types import types
+from kubernetes import watch
 from kubernetes.client import (
     ApiClient,
+    ApiException,
     V1Container,
     V1ObjectMeta,
     V1PodSpec,
@@ -47,9 +55,17 @@ FAIL_EVENTS = "fail_events"
 MULTI_PODS = "multi_pods"
 PENDING_POD = "pending_pod"
 NO_STATUS_POD = "no_status_pod"
-QUEUE_TIMEOUT = "queue_timeout"
-QUEUE_EMPTY = "queue_empty"
+FAIL_FOLLOW_LOGS = "fail_follow_logs"
+LOG_TIMESTAMP = "2024-01-01T00:00:00.123456789Z"
+WATCH = "watch"
+WATCH_EXPIRED = "watch_expired"
+WATCH_ERROR = "watch_error"
+WATCH_DELETED = "watch_deleted"
+PAGED_JOBS = "paged_jobs"
+ALREADY_EXISTS = "already_exists"
 EVENT_CREATION_TIMESTAMP = datetime(2024, 1, 5, 22, 58, 20)
+JOB_SUMMARY = "job_summary"
+JOB_CREATION_TIMESTAMP = datetime(2024, 1, 5, 22, 0, 0, tzinfo=timezone.utc)
 
 
 def conditional_error_handler(*args, **kwargs):
@@ -57,6 +73,8 @@ def conditional_error_handler(*args, **kwargs):
         raise multiprocessing.TimeoutError()
     elif args[2] == RUNTIME:
         raise RuntimeError()
+    elif args[2] == ALREADY_EXISTS:
+        raise ApiException(status=409, reason="AlreadyExists")
 
 
 def serialize_k8s_object(obj):
@@ -70,8 +88,19 @@ def get_namespaced_custom_object_response(*args, **kwargs):
     elif args[2] == RUNTIME:
         raise RuntimeError()
 
+    # Jobs in watch namespaces are not completed yet.
+    if args[2] in (WATCH, WATCH_EXPIRED, WATCH_ERROR, WATCH_DELETED):
+        condition_type = constants.JOB_CONDITION_RUNNING
+    else:
+        condition_type = constants.JOB_CONDITION_SUCCEEDED
+
     # Create a serialized Job
-    serialized_job = serialize_k8s_object(generate_job_with_status(create_job()))
+    if args[2] == JOB_SUMMARY:
+        serialized_job = serialize_k8s_object(generate_completed_job())
+    else:
+        serialized_job = serialize_k8s_object(
+            generate_job_with_status(create_job(), condition_type=condition_type)
+        )
 
     # Mock the thread and set it's return value to the serialized Job
     mock_thread = Mock()
@@ -87,6 +116,33 @@ def list_namespaced_custom_object_response(*args, **kwargs):
         raise RuntimeError()
     elif args[2] == "empty-namespace":
         mock_response = {"items": []}
+    elif args[2] in (WATCH, WATCH_ERROR, WATCH_DELETED):
+        mock_response = {
+            "items": [
+                serialize_k8s_object(
+                    generate_job_with_status(
+                        create_job(), condition_type=constants.JOB_CONDITION_RUNNING
+                    )
+                )
+            ]
+        }
+    elif args[2] == PAGED_JOBS:
+        # Return one Job per page with the continue token for the next page.
+        mock_response = {
+            "metadata": {"continue": None if kwargs.get("_continue") else "token"},
+            "items": [serialize_k8s_object(generate_job_with_status(create_job()))],
+        }
+    elif args[2] == JOB_SUMMARY:
+        mock_response = {
+            "items": [
+                serialize_k8s_object(generate_completed_job()),
+                serialize_k8s_object(
+                    generate_job_with_status(
+                        create_job(), condition_type=constants.JOB_CONDITION_RUNNING
+                    )
+                ),
+            ]
+        }
     elif args[2] == "multi-jobs":
         mock_response = {
             "items": [
@@ -104,6 +160,21 @@ def list_namespaced_custom_object_response(*args, **kwargs):
     return mock_thread
 
 
+def list_cluster_custom_object_response(*args, **kwargs):
+    if args[2] == constants.MPIJOB_PLURAL:
+        raise RuntimeError()
+    elif args[2] == constants.PYTORCHJOB_PLURAL:
+        mock_response = {
+            "items": [serialize_k8s_object(generate_job_with_status(create_job()))]
+        }
+    else:
+        mock_response = {"items": []}
+
+    mock_thread = Mock()
+    mock_thread.get.return_value = mock_response
+    return mock_thread
+
+
 def list_namespaced_pod_response(*args, **kwargs):
     class MockResponse:
         def get(self, timeout):
@@ -136,6 +207,20 @@ def list_namespaced_pod_response(*args, **kwargs):
     return MockResponse()
 
 
+def mock_call_api(*args, **kwargs):
+    """Mock for listing pod metadata with the Kubernetes API client"""
+    namespace = kwargs["path_params"]["namespace"]
+    if namespace == TIMEOUT:
+        raise multiprocessing.TimeoutError()
+    if namespace == RUNTIME:
+        raise Exception()
+
+    items = [] if namespace == NO_PODS else [{"metadata": {"name": DUMMY_POD_NAME}}]
+    mock_thread = Mock()
+    mock_thread.get.return_value = Mock(data=json.dumps({"items": items}).encode())
+    return mock_thread
+
+
 def create_job(
     command=None,
     args=None,
@@ -225,6 +310,34 @@ def generate_job_with_status(
     return job
 
 
+def generate_completed_job() -> constants.JOB_MODELS_TYPE:
+    """Generate the Job which is succeeded 10 minutes after creation"""
+    completion_time = JOB_CREATION_TIMESTAMP + timedelta(minutes=10)
+    job = create_job()
+    job.metadata.creation_timestamp = JOB_CREATION_TIMESTAMP
+    job.status = KubeflowOrgV1JobStatus(
+        conditions=[
+            KubeflowOrgV1JobCondition(
+                type=condition_type,
+                status=status,
+                last_transition_time=last_transition_time,
+            )
+            for condition_type, status, last_transition_time in [
+                (CREATED, constants.CONDITION_STATUS_TRUE, JOB_CREATION_TIMESTAMP),
+                (RUNNING, "False", completion_time),
+                (SUCCEEDED, constants.CONDITION_STATUS_TRUE, completion_time),
+            ]
+        ],
+        replica_statuses={
+            "Master": KubeflowOrgV1ReplicaStatus(succeeded=1),
+            "Worker": KubeflowOrgV1ReplicaStatus(succeeded=1),
+        },
+        start_time=JOB_CREATION_TIMESTAMP,
+        completion_time=completion_time,
+    )
+    return job
+
+
 class DummyJobClass:
     def __init__(self, kind) -> None:
         self.kind = kind
@@ -288,64 +401,127 @@ def mock_read_namespaced_pod_log(*args, **kwargs):
     return "test log content"
 
 
-def mock_watch(self, *args, **kwargs):
-    namespace = kwargs.get("namespace")
-    if namespace == FAIL_LOGS:
-        raise Exception("Failed to read logs")
-    if namespace == QUEUE_TIMEOUT:
-        log_lines = [TIMEOUT]
-    elif namespace == QUEUE_EMPTY:
-        log_lines = [QUEUE_EMPTY]
-    else:
-        log_lines = ["line 1 of pod logs", "line 2 of pod logs", "line 3 of pod logs"]
-    return iter(log_lines)
-
-
-def mock_get_log_queue_pool(log_streams):
-    mock_logs = []
-    for stream in log_streams:
-        # Convert iterator to list to preserve values
-        log_lines = list(stream)
-        mock_queue = Mock()
-        # Use a list to maintain state between calls
-        remaining_logs = log_lines.copy()  # Make a copy to avoid modifying original
-
-        def get_next(timeout, logs=remaining_logs):
-            if logs:
-                log = logs.pop(0)
-                if log == TIMEOUT:
-                    raise TimeoutError
-                if log == QUEUE_EMPTY:
-                    raise queue.Empty
-                return log
-            return None
-
-        mock_queue.get = Mock(side_effect=get_next)
-        mock_queue.put = Mock()
-        mock_logs.append(mock_queue)
-    return mock_logs
+def mock_watch_job(namespace):
+    """Mock for watching the Job with field selector"""
+    if namespace == WATCH_EXPIRED:
+        raise ApiException(status=410, reason="Expired: too old resource version")
+    if namespace == WATCH_ERROR:
+        raise ApiException(status=500, reason="Internal Server Error")
+    if namespace == WATCH_DELETED:
+        yield {"type": "DELETED", "raw_object": serialize_k8s_object(create_job())}
+        return
+
+    # Event for other Job in namespace.
+    other_job = create_job()
+    other_job.metadata.name = "other-job"
+    yield {"type": "ADDED", "raw_object": serialize_k8s_object(other_job)}
+
+    for condition_type in (
+        constants.JOB_CONDITION_RUNNING,
+        constants.JOB_CONDITION_SUCCEEDED,
+    ):
+        job = generate_job_with_status(create_job(), condition_type=condition_type)
+        yield {"type": "MODIFIED", "raw_object": serialize_k8s_object(job)}
 
 
-def mock_list_namespaced_event(*args, **kwargs):
-    """Mock for listing namespace events"""
+def mock_watch(func, *args, **kwargs):
+    if "plural" in kwargs:
+        return mock_watch_job(kwargs.get("namespace"))
+    if "label_selector" in kwargs:
+        return mock_watch_pods(kwargs.get("namespace"))
+    return mock_watch_events(kwargs.get("namespace"), kwargs["field_selector"])
+
+
+class MockLogMultiplexer:
+    """Mock LogMultiplexer that returns log lines of all pods in turn"""
+
+    def __init__(self, core_api, namespace, container, follow=True, **log_kwargs):
+        self.namespace = namespace
+        self.timestamps = log_kwargs.get("timestamps", False)
+        self.pod_names = []
+
+    def __enter__(self):
+        return self
 
-    class MockEvent:
-        def __init__(self, kind, name):
-            self.involved_object = Mock(kind=kind)
-            self.involved_object.name = name
-            self.metadata = Mock(creation_timestamp=EVENT_CREATION_TIMESTAMP)
-            self.message = f"{kind} Event 1"
+    def __exit__(self, *args):
+        pass
+
+    def add(self, pod_name):
+        if self.namespace == FAIL_LOGS:
+            raise RuntimeError("Failed to read logs")
+        self.pod_names.append(pod_name)
+
+    def __iter__(self):
+        for line in ["line 1 of pod logs", "line 2 of pod logs", "line 3 of pod logs"]:
+            if self.namespace == FAIL_FOLLOW_LOGS:
+                raise RuntimeError("Failed to read logs")
+            for pod_name in self.pod_names:
+                yield pod_name, f"{LOG_TIMESTAMP} {line}" if self.timestamps else line
+
+
+class MockEvent:
+    def __init__(self, kind, name):
+        self.involved_object = Mock(kind=kind)
+        self.involved_object.name = name
+        self.metadata = Mock(creation_timestamp=EVENT_CREATION_TIMESTAMP)
+        self.message = f"{kind} Event 1"
+
+
+def mock_list_namespaced_event(*args, **kwargs):
+    """Mock for listing namespace events with involvedObject field selector"""
 
     class MockEventList:
-        def __init__(self):
-            self.items = [
-                MockEvent(constants.POD_KIND, DUMMY_POD_NAME),
-                MockEvent(constants.PYTORCHJOB_KIND, TEST_NAME),
-            ]
+        def __init__(self, items):
+            self.items = items
 
     if kwargs.get("namespace") == FAIL_EVENTS:
         raise Exception("Failed to read events")
-    return MockEventList()
+
+    events = [
+        MockEvent(constants.POD_KIND, DUMMY_POD_NAME),
+        MockEvent(constants.PYTORCHJOB_KIND, TEST_NAME),
+    ]
+    selector = dict(f.split("=") for f in kwargs["field_selector"].split(","))
+    return MockEventList(
+        [
+            e
+            for e in events
+            if e.involved_object.kind == selector["involvedObject.kind"]
+            and e.involved_object.name == selector["involvedObject.name"]
+        ]
+    )
+
+
+def mock_watch_events(namespace, field_selector):
+    """Mock for watching events in namespace with involvedObject field selector"""
+    if namespace == WATCH_ERROR:
+        raise ApiException(status=500, reason="Internal Server Error")
+
+    selector = dict(f.split("=") for f in field_selector.split(","))
+    for kind, name in [
+        (constants.PYTORCHJOB_KIND, TEST_NAME),
+        (constants.PYTORCHJOB_KIND, "other-job"),
+        (constants.POD_KIND, f"{TEST_NAME}-worker-0"),
+        (constants.POD_KIND, "other-pod"),
+        (constants.TFJOB_KIND, TEST_NAME),
+    ]:
+        if (
+            kind == selector["involvedObject.kind"]
+            and name == selector["involvedObject.name"]
+        ):
+            yield {"type": "ADDED", "object": MockEvent(kind, name)}
+            yield {"type": "DELETED", "object": MockEvent(kind, name)}
+    # Kubernetes API server keeps the watch open until the next event.
+    time.sleep(0.1)
+
+
+def mock_watch_pods(namespace):
+    """Mock for watching the Job pods with label selector"""
+    pod = Mock()
+    pod.metadata.name = f"{TEST_NAME}-worker-0"
+    for event_type in ["ADDED", "MODIFIED"]:
+        yield {"type": event_type, "object": pod}
+    time.sleep(0.1)
 
 
 test_data_create_job = [
@@ -355,6 +531,27 @@ test_data_create_job = [
         SUCCESS,
         create_job(),
     ),
+    (
+        "valid flow with serialized job",
+        {"job": serialize_k8s_object(create_job()), "namespace": TEST_NAME},
+        SUCCESS,
+        serialize_k8s_object(create_job()),
+    ),
+    (
+        "valid flow with job as JSON bytes",
+        {
+            "job": json.dumps(serialize_k8s_object(create_job())).encode(),
+            "namespace": TEST_NAME,
+        },
+        SUCCESS,
+        serialize_k8s_object(create_job()),
+    ),
+    (
+        "invalid flow with job as invalid JSON bytes",
+        {"job": b"{", "namespace": TEST_NAME},
+        ValueError,
+        None,
+    ),
     (
         "valid flow to create multi-node job with torchrun",
         {
@@ -604,6 +801,120 @@ test_data_wait_for_job_conditions = [
         },
         generate_job_with_status(create_job()),
     ),
+    (
+        "valid case with watch and job already succeeded",
+        {
+            "name": TEST_NAME,
+            "namespace": "test-namespace",
+            "use_watch": True,
+        },
+        generate_job_with_status(create_job()),
+    ),
+    (
+        "valid case with watch",
+        {
+            "name": TEST_NAME,
+            "namespace": WATCH,
+            "use_watch": True,
+        },
+        generate_job_with_status(create_job()),
+    ),
+    (
+        "valid case with watch and running condition",
+        {
+            "name": TEST_NAME,
+            "namespace": WATCH,
+            "expected_conditions": {constants.JOB_CONDITION_RUNNING},
+            "use_watch": True,
+        },
+        generate_job_with_status(
+            create_job(), condition_type=constants.JOB_CONDITION_RUNNING
+        ),
+    ),
+    (
+        "watch failed",
+        {
+            "name": TEST_NAME,
+            "namespace": WATCH_ERROR,
+            "use_watch": True,
+        },
+        RuntimeError,
+    ),
+    (
+        "job deleted while watching",
+        {
+            "name": TEST_NAME,
+            "namespace": WATCH_DELETED,
+            "use_watch": True,
+        },
+        RuntimeError,
+    ),
+    (
+        "timeout waiting for succeeded condition with watch",
+        {
+            "name": TEST_NAME,
+            "namespace": WATCH,
+            "wait_timeout": 0,
+            "use_watch": True,
+        },
+        TimeoutError,
+    ),
+]
+
+test_data_wait_for_jobs = [
+    (
+        "valid case with jobs already succeeded",
+        {"names": [TEST_NAME], "namespace": TEST_NAME},
+        [generate_job_with_status(create_job())],
+    ),
+    (
+        "valid case with watch",
+        {"names": [TEST_NAME], "namespace": WATCH},
+        [generate_job_with_status(create_job())],
+    ),
+    (
+        "valid case with watch and running condition",
+        {
+            "names": [TEST_NAME],
+            "namespace": WATCH,
+            "expected_conditions": {constants.JOB_CONDITION_RUNNING},
+        },
+        [
+            generate_job_with_status(
+                create_job(), condition_type=constants.JOB_CONDITION_RUNNING
+            )
+        ],
+    ),
+    (
+        "job doesn't exist",
+        {"names": [TEST_NAME, "not-found"], "namespace": WATCH, "wait_timeout": 1},
+        [generate_job_with_status(create_job()), TimeoutError],
+    ),
+    (
+        "job deleted while watching",
+        {"names": [TEST_NAME], "namespace": WATCH_DELETED},
+        [RuntimeError],
+    ),
+    (
+        "watch failed",
+        {"names": [TEST_NAME], "namespace": WATCH_ERROR},
+        [RuntimeError],
+    ),
+    (
+        "list failed",
+        {"names": [TEST_NAME], "namespace": RUNTIME},
+        [RuntimeError],
+    ),
+    (
+        "invalid expected condition",
+        {"names": [TEST_NAME], "expected_conditions": {"invalid"}},
+        ValueError,
+    ),
+    (
+        "invalid job kind",
+        {"names": [TEST_NAME], "job_kind": INVALID},
+        ValueError,
+    ),
 ]
 
 
@@ -624,9 +935,70 @@ test_data_get_job_pod_names = [
         },
         [],
     ),
+    (
+        "invalid flow with timeout error",
+        {
+            "name": TEST_NAME,
+            "namespace": TIMEOUT,
+        },
+        TimeoutError,
+    ),
+    (
+        "invalid flow with runtime error",
+        {
+            "name": TEST_NAME,
+            "namespace": RUNTIME,
+        },
+        RuntimeError,
+    ),
 ]
 
 
+test_data_create_jobs = [
+    (
+        "valid flow with job objects and serialized jobs",
+        {
+            "jobs": [
+                create_job(),
+                serialize_k8s_object(create_job()),
+                json.dumps(serialize_k8s_object(create_job())).encode(),
+            ],
+            "namespace": TEST_NAME,
+        },
+        [(constants.JOB_CREATION_CREATED, 201)] * 3,
+    ),
+    (
+        "valid flow with rate limit",
+        {"jobs": [create_job()] * 3, "namespace": TEST_NAME, "qps": 100, "burst": 1},
+        [(constants.JOB_CREATION_CREATED, 201)] * 3,
+    ),
+    (
+        "valid flow with jobs that already exist",
+        {"jobs": [create_job()] * 2, "namespace": ALREADY_EXISTS},
+        [(constants.JOB_CREATION_ALREADY_EXISTS, 409)] * 2,
+    ),
+    (
+        "valid flow with partial failure",
+        {"jobs": [create_job(), b"{", create_job()], "namespace": TEST_NAME},
+        [
+            (constants.JOB_CREATION_CREATED, 201),
+            (constants.JOB_CREATION_FAILED, None),
+            (constants.JOB_CREATION_CREATED, 201),
+        ],
+    ),
+    (
+        "valid flow with timeout error",
+        {"jobs": [create_job()], "namespace": TIMEOUT},
+        [(constants.JOB_CREATION_FAILED, None)],
+    ),
+    ("valid flow with empty jobs", {"jobs": []}, []),
+    (
+        "invalid flow with incorrect QPS",
+        {"jobs": [create_job()], "qps": 0},
+        ValueError,
+    ),
+]
+
 test_data_update_job = [
     (
         "valid flow",
@@ -636,6 +1008,14 @@ test_data_update_job = [
         },
         "No output",
     ),
+    (
+        "valid flow with serialized job",
+        {
+            "name": TEST_NAME,
+            "job": serialize_k8s_object(create_job()),
+        },
+        "No output",
+    ),
     (
         "invalid job_kind",
         {
@@ -743,6 +1123,28 @@ test_data_list_jobs = [
             generate_job_with_status(create_job()),
         ],
     ),
+    (
+        "valid flow with multiple pages",
+        {
+            "namespace": PAGED_JOBS,
+            "limit": 1,
+        },
+        SUCCESS,
+        [
+            generate_job_with_status(create_job()),
+            generate_job_with_status(create_job()),
+        ],
+    ),
+    (
+        "valid flow with label and field selectors",
+        {
+            "namespace": TEST_NAME,
+            "label_selector": "app=mnist",
+            "field_selector": f"metadata.name={TEST_NAME}",
+        },
+        SUCCESS,
+        [generate_job_with_status(create_job())],
+    ),
     (
         "invalid flow with default namespace and a Job that doesn't exist",
         {"job_kind": constants.TFJOB_KIND},
@@ -1219,44 +1621,55 @@ test_data_get_job_logs = [
         {},
         SUCCESS,
     ),
-    # Streaming cases
     (
-        "valid flow with follow logs",
+        "valid flow with multiple pods read concurrently",
         {
             "name": TEST_NAME,
-            "follow": True,
+            "namespace": MULTI_PODS,
+            "max_concurrency": 2,
         },
+        {f"pod-{i}": "test log content" for i in range(3)},
+        {},
+        SUCCESS,
+    ),
+    (
+        "valid flow with gzip and limit bytes",
         {
-            DUMMY_POD_NAME: (
-                "line 1 of pod logs" "line 2 of pod logs" "line 3 of pod logs"
-            )
+            "name": TEST_NAME,
+            "gzip": True,
+            "limit_bytes": 1024,
         },
+        {DUMMY_POD_NAME: "test log content"},
         {},
         SUCCESS,
     ),
+    # Streaming cases
     (
-        "valid flow with follow logs and multiple pods",
+        "valid flow with follow logs",
         {
             "name": TEST_NAME,
-            "namespace": MULTI_PODS,
             "follow": True,
         },
         {
-            "pod-0": ("line 1 of pod logs" "line 2 of pod logs" "line 3 of pod logs"),
-            "pod-1": ("line 1 of pod logs" "line 2 of pod logs" "line 3 of pod logs"),
-            "pod-2": ("line 1 of pod logs" "line 2 of pod logs" "line 3 of pod logs"),
+            DUMMY_POD_NAME: (
+                "line 1 of pod logs\nline 2 of pod logs\nline 3 of pod logs\n"
+            )
         },
         {},
         SUCCESS,
     ),
     (
-        "follow logs with queue empty",
+        "valid flow with follow logs and multiple pods",
         {
             "name": TEST_NAME,
-            "namespace": QUEUE_EMPTY,
+            "namespace": MULTI_PODS,
             "follow": True,
         },
-        {},
+        {
+            "pod-0": "line 1 of pod logs\nline 2 of pod logs\nline 3 of pod logs\n",
+            "pod-1": "line 1 of pod logs\nline 2 of pod logs\nline 3 of pod logs\n",
+            "pod-2": "line 1 of pod logs\nline 2 of pod logs\nline 3 of pod logs\n",
+        },
         {},
         SUCCESS,
     ),
@@ -1293,7 +1706,7 @@ test_data_get_job_logs = [
         RuntimeError,
     ),
     (
-        "exception when reading logs with follow",
+        "runtime error when following logs",
         {
             "name": TEST_NAME,
             "namespace": FAIL_LOGS,
@@ -1301,7 +1714,18 @@ test_data_get_job_logs = [
         },
         None,
         None,
-        Exception,
+        RuntimeError,
+    ),
+    (
+        "runtime error while reading followed logs",
+        {
+            "name": TEST_NAME,
+            "namespace": FAIL_FOLLOW_LOGS,
+            "follow": True,
+        },
+        None,
+        None,
+        RuntimeError,
     ),
     (
         "runtime error when reading logs",
@@ -1346,15 +1770,50 @@ test_data_get_job_logs = [
         None,
         RuntimeError,
     ),
+]
+
+LOG_LINES = ["line 1 of pod logs", "line 2 of pod logs", "line 3 of pod logs"]
+LOG_DATETIME = datetime(2024, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc)
+
+test_data_stream_job_logs = [
     (
-        "follow logs with queue timeout",
-        {
-            "name": TEST_NAME,
-            "namespace": QUEUE_TIMEOUT,
-            "follow": True,
-        },
-        {},  # Empty logs due to timeout
-        {},
+        "valid flow with default parameters",
+        {"name": TEST_NAME},
+        [(DUMMY_POD_NAME, LOG_DATETIME, line) for line in LOG_LINES],
+    ),
+    (
+        "valid flow without timestamps",
+        {"name": TEST_NAME, "timestamps": False},
+        [(DUMMY_POD_NAME, None, line) for line in LOG_LINES],
+    ),
+    (
+        "valid flow with multiple pods read pod by pod",
+        {"name": TEST_NAME, "namespace": MULTI_PODS, "tail_lines": 10},
+        [(f"pod-{i}", LOG_DATETIME, line) for i in range(3) for line in LOG_LINES],
+    ),
+    (
+        "valid flow with follow logs and multiple pods",
+        {"name": TEST_NAME, "namespace": MULTI_PODS, "follow": True},
+        [(f"pod-{i}", LOG_DATETIME, line) for line in LOG_LINES for i in range(3)],
+    ),
+    (
+        "pod with pending status",
+        {"name": TEST_NAME, "namespace": PENDING_POD},
+        [],
+    ),
+    (
+        "runtime error when reading logs",
+        {"name": TEST_NAME, "namespace": FAIL_LOGS},
+        RuntimeError,
+    ),
+    (
+        "runtime error while reading followed logs",
+        {"name": TEST_NAME, "namespace": FAIL_FOLLOW_LOGS, "follow": True},
+        RuntimeError,
+    ),
+    (
+        "timeout error when getting pods",
+        {"name": TEST_NAME, "namespace": f"pod {TIMEOUT}"},
         TimeoutError,
     ),
 ]
@@ -1367,6 +1826,8 @@ def training_client(request):
         if hasattr(request, "param")
         else False
     )
+    cache = request.param.get("cache", False) if hasattr(request, "param") else False
+    lazy = request.param.get("lazy", False) if hasattr(request, "param") else False
     with patch(
         "kubernetes.client.CustomObjectsApi",
         return_value=Mock(
@@ -1379,6 +1840,9 @@ def training_client(request):
             list_namespaced_custom_object=Mock(
                 side_effect=list_namespaced_custom_object_response
             ),
+            list_cluster_custom_object=Mock(
+                side_effect=list_cluster_custom_object_response
+            ),
         ),
     ), patch(
         "kubernetes.client.CoreV1Api",
@@ -1386,6 +1850,7 @@ def training_client(request):
             list_namespaced_pod=Mock(side_effect=list_namespaced_pod_response),
             read_namespaced_pod_log=Mock(side_effect=mock_read_namespaced_pod_log),
             list_namespaced_event=Mock(side_effect=mock_list_namespaced_event),
+            api_client=Mock(call_api=Mock(side_effect=mock_call_api)),
         ),
     ), patch(
         "kubernetes.config.load_kube_config", return_value=Mock()
@@ -1395,10 +1860,12 @@ def training_client(request):
             stream=Mock(side_effect=mock_watch),
         ),
     ), patch(
-        "kubeflow.training.utils.utils.get_log_queue_pool",
-        side_effect=mock_get_log_queue_pool,
+        "kubeflow.training.api.training_client.LogMultiplexer",
+        side_effect=MockLogMultiplexer,
     ):
-        client = TrainingClient(job_kind=constants.PYTORCHJOB_KIND)
+        client = TrainingClient(
+            job_kind=constants.PYTORCHJOB_KIND, cache=cache, lazy=lazy
+        )
         if mock_get_job_and_job_pods:
             client.get_job_pods = Mock(side_effect=mock_get_job_pods)
             client.get_job = Mock(side_effect=mock_get_job)
@@ -1465,8 +1932,39 @@ def test_get_job_pod_names(training_client, test_name, kwargs, expected_output):
     test get_job_pod_names function of training client
     """
     print("Executing test:", test_name)
-    out = training_client.get_job_pod_names(**kwargs)
-    assert out == expected_output
+    try:
+        out = training_client.get_job_pod_names(**kwargs)
+        assert out == expected_output
+        # Only pod metadata is listed.
+        training_client.core_api.list_namespaced_pod.assert_not_called()
+        call_kwargs = training_client.core_api.api_client.call_api.call_args.kwargs
+        assert call_kwargs["header_params"] == {
+            "Accept": constants.PARTIAL_OBJECT_METADATA_LIST_ACCEPT
+        }
+        assert call_kwargs["query_params"] == [
+            ("labelSelector", f"{constants.JOB_NAME_LABEL}={TEST_NAME}")
+        ]
+    except Exception as e:
+        assert type(e) is expected_output
+    print("test execution complete")
+
+
+@pytest.mark.parametrize("test_name,kwargs,expected_output", test_data_create_jobs)
+def test_create_jobs(training_client, test_name, kwargs, expected_output):
+    """
+    test create_jobs function of training client
+    """
+    print("Executing test:", test_name)
+    try:
+        results = training_client.create_jobs(**kwargs)
+        assert [(r.status, r.status_code) for r in results] == expected_output
+        for result in results:
+            assert result.name in (TEST_NAME, None)
+            assert (result.error is None) == (
+                result.status == constants.JOB_CREATION_CREATED
+            )
+    except Exception as e:
+        assert type(e) is expected_output
     print("test execution complete")
 
 
@@ -1509,6 +2007,102 @@ def test_wait_for_job_conditions(training_client, test_name, kwargs, expected_ou
     print("test execution complete")
 
 
+@pytest.mark.parametrize("test_name,kwargs,expected_output", test_data_wait_for_jobs)
+def test_wait_for_jobs(training_client, test_name, kwargs, expected_output):
+    """
+    test wait_for_jobs function of training client
+    """
+    print("Executing test:", test_name)
+    try:
+        out = []
+        for future in training_client.wait_for_jobs(**kwargs):
+            try:
+                out.append(future.result())
+            except Exception as e:
+                out.append(type(e))
+        assert out == expected_output
+    except ValueError as e:
+        assert type(e) is expected_output
+    print("test execution complete")
+
+
+def test_wait_for_job_conditions_watch_expired(training_client):
+    """
+    test wait_for_job_conditions falls back to polling when the watch is expired
+    """
+    running_thread = Mock()
+    running_thread.get.return_value = serialize_k8s_object(
+        generate_job_with_status(
+            create_job(), condition_type=constants.JOB_CONDITION_RUNNING
+        )
+    )
+    succeeded_thread = Mock()
+    succeeded_thread.get.return_value = serialize_k8s_object(
+        generate_job_with_status(create_job())
+    )
+    training_client.custom_api.get_namespaced_custom_object = Mock(
+        side_effect=[running_thread, succeeded_thread]
+    )
+
+    out = training_client.wait_for_job_conditions(
+        name=TEST_NAME,
+        namespace=WATCH_EXPIRED,
+        polling_interval=1,
+        use_watch=True,
+    )
+    assert out == generate_job_with_status(create_job())
+    assert training_client.custom_api.get_namespaced_custom_object.call_count == 2
+
+
+@pytest.mark.parametrize("training_client", [{"cache": True}], indirect=True)
+def test_job_cache(training_client):
+    """
+    test get_job_cache function and cached reads of training client
+    """
+    watch_closed = threading.Event()
+
+    def mock_watch_jobs(*args, **kwargs):
+        yield from mock_watch_job(WATCH)
+        watch_closed.wait()
+
+    with patch(
+        "kubernetes.watch.Watch",
+        return_value=Mock(stream=Mock(side_effect=mock_watch_jobs)),
+    ):
+        job_cache = training_client.get_job_cache(namespace=WATCH)
+        assert job_cache.has_synced()
+        assert job_cache.last_sync_time is not None
+
+        # Wait until the cache receives all watch events.
+        for _ in range(50):
+            if len(job_cache.list()) == 2 and training_client.is_job_succeeded(
+                TEST_NAME, namespace=WATCH
+            ):
+                break
+            time.sleep(0.1)
+
+        assert training_client.is_job_succeeded(TEST_NAME, namespace=WATCH)
+        assert len(training_client.list_jobs(namespace=WATCH)) == 2
+        assert training_client.get_job_cache(namespace=WATCH) is job_cache
+        training_client.custom_api.get_namespaced_custom_object.assert_not_called()
+        training_client.custom_api.list_namespaced_custom_object.assert_called_once()
+
+        # Job that is not in the cache is taken from the Kubernetes API server.
+        training_client.get_job("new-job", namespace=WATCH)
+        training_client.custom_api.get_namespaced_custom_object.assert_called_once()
+
+        job_cache.stop()
+        watch_closed.set()
+
+
+def test_job_cache_disabled(training_client):
+    """
+    test get_job_cache function of training client without cache
+    """
+    with pytest.raises(ValueError):
+        training_client.get_job_cache()
+
+
 @pytest.mark.parametrize("test_name,kwargs,expected_output", test_data_delete_job)
 def test_delete_job(training_client, test_name, kwargs, expected_output):
     """
@@ -1540,6 +2134,20 @@ def test_get_job(training_client, test_name, kwargs, expected_output):
     print("test execution complete")
 
 
+@pytest.mark.parametrize("training_client", [{"lazy": True}], indirect=True)
+def test_get_job_lazy(training_client):
+    """
+    test get_job and list_jobs functions of training client with lazy Jobs
+    """
+    job = training_client.get_job(TEST_NAME, namespace=TEST_NAME)
+    assert isinstance(job, KubeflowOrgV1PyTorchJob)
+    assert job == generate_job_with_status(create_job())
+    assert training_client.is_job_succeeded(TEST_NAME, namespace=TEST_NAME)
+
+    jobs = training_client.list_jobs(namespace="multi-jobs")
+    assert jobs == [generate_job_with_status(create_job())] * 2
+
+
 @pytest.mark.parametrize(
     "test_name,kwargs,expected_output", test_data_get_job_conditions
 )
@@ -1683,6 +2291,121 @@ def test_list_jobs(
     print("test execution complete")
 
 
+test_data_list_all_jobs = [
+    (
+        "valid flow with all namespaces",
+        {"job_kinds": [constants.PYTORCHJOB_KIND, constants.TFJOB_KIND]},
+        1,
+        {},
+    ),
+    (
+        "valid flow with multiple namespaces",
+        {
+            "namespaces": [TEST_NAME, "multi-jobs", "empty-namespace"],
+            "job_kinds": [constants.PYTORCHJOB_KIND],
+        },
+        3,
+        {},
+    ),
+    (
+        "failed to list one of the kinds",
+        {"job_kinds": [constants.PYTORCHJOB_KIND, constants.MPIJOB_KIND]},
+        1,
+        {constants.MPIJOB_KIND: RuntimeError},
+    ),
+    (
+        "failed to list one of the namespaces",
+        {
+            "namespaces": [TEST_NAME, TIMEOUT],
+            "job_kinds": [constants.PYTORCHJOB_KIND],
+            "max_concurrency": 1,
+        },
+        1,
+        {constants.PYTORCHJOB_KIND: TimeoutError},
+    ),
+    (
+        "valid flow with all kinds and namespaces",
+        {},
+        1,
+        {constants.MPIJOB_KIND: RuntimeError},
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "test_name,kwargs,expected_jobs,expected_errors", test_data_list_all_jobs
+)
+def test_list_all_jobs(
+    training_client, test_name, kwargs, expected_jobs, expected_errors
+):
+    """
+    test list_all_jobs function of training client
+    """
+    print("Executing test:", test_name)
+    out = training_client.list_all_jobs(**kwargs)
+    assert len(out.jobs) == expected_jobs
+    assert {k: type(e) for k, e in out.errors.items()} == expected_errors
+    assert set(out.durations) == set(
+        kwargs.get("job_kinds", constants.JOB_PARAMETERS.keys())
+    )
+
+    with pytest.raises(ValueError):
+        training_client.list_all_jobs(job_kinds=[INVALID])
+    print("test execution complete")
+
+
+def test_list_all_jobs_durations(training_client, monkeypatch):
+    """
+    test list_all_jobs durations are durations of the slowest namespace
+    """
+    clock = [0.0]
+    monkeypatch.setattr(time, "perf_counter", lambda: clock[0])
+
+    def list_jobs(namespace, job_kind, timeout):
+        clock[0] += {"fast": 1, "slow": 3}[namespace]
+        return []
+
+    training_client.list_jobs = Mock(side_effect=list_jobs)
+    out = training_client.list_all_jobs(
+        namespaces=["fast", "slow"],
+        job_kinds=[constants.PYTORCHJOB_KIND],
+        max_concurrency=1,
+    )
+    assert out.durations == {constants.PYTORCHJOB_KIND: 3}
+
+
+def test_iter_jobs(training_client):
+    """
+    test iter_jobs function of training client
+    """
+    jobs = training_client.iter_jobs(
+        namespace=PAGED_JOBS, label_selector="app=mnist", limit=1
+    )
+
+    # Jobs are listed only when iterator is consumed.
+    training_client.custom_api.list_namespaced_custom_object.assert_not_called()
+    assert next(jobs).to_dict() == generate_job_with_status(create_job()).to_dict()
+    training_client.custom_api.list_namespaced_custom_object.assert_called_once()
+
+    assert len(list(jobs)) == 1
+    training_client.custom_api.list_namespaced_custom_object.assert_called_with(
+        constants.GROUP,
+        constants.VERSION,
+        PAGED_JOBS,
+        constants.PYTORCHJOB_PLURAL,
+        label_selector="app=mnist",
+        field_selector=None,
+        limit=1,
+        _continue="token",
+        async_req=True,
+    )
+
+    with pytest.raises(ValueError):
+        training_client.iter_jobs(job_kind=INVALID)
+    with pytest.raises(RuntimeError):
+        list(training_client.iter_jobs(namespace=RUNTIME))
+
+
 @pytest.mark.parametrize(
     "training_client", [{"mock_get_job_and_job_pods": True}], indirect=True
 )
@@ -1724,16 +2447,234 @@ def test_get_job_logs(
             timeout=kwargs.get("timeout", constants.DEFAULT_TIMEOUT),
         )
 
+        if not kwargs.get("follow", False):
+            for pod_name in expected_logs:
+                training_client.core_api.read_namespaced_pod_log.assert_any_call(
+                    name=pod_name,
+                    namespace=kwargs.get("namespace", constants.DEFAULT_NAMESPACE),
+                    container=constants.PYTORCHJOB_CONTAINER,
+                    limit_bytes=kwargs.get("limit_bytes"),
+                )
+
         if kwargs.get("verbose", False):
             training_client.get_job.assert_called_with(
                 name=kwargs["name"],
                 namespace=kwargs.get("namespace", constants.DEFAULT_NAMESPACE),
             )
-            training_client.core_api.list_namespaced_event.assert_called_with(
-                namespace=kwargs.get("namespace", constants.DEFAULT_NAMESPACE)
-            )
+            # Events are listed with field selector for the Job and every pod.
+            for kind, name in [
+                (constants.PYTORCHJOB_KIND, kwargs["name"]),
+                (constants.POD_KIND, DUMMY_POD_NAME),
+            ]:
+                training_client.core_api.list_namespaced_event.assert_any_call(
+                    namespace=kwargs.get("namespace", constants.DEFAULT_NAMESPACE),
+                    field_selector=f"involvedObject.kind={kind},involvedObject.name={name}",
+                )
 
     except Exception as e:
         assert type(e) is expected_output
 
     print("test execution complete")
+
+
+@pytest.mark.parametrize(
+    "training_client", [{"mock_get_job_and_job_pods": True}], indirect=True
+)
+@pytest.mark.parametrize("test_name,kwargs,expected_output", test_data_stream_job_logs)
+def test_stream_job_logs(training_client, test_name, kwargs, expected_output):
+    """
+    test stream_job_logs function of training client
+    """
+    print("Executing test:", test_name)
+
+    try:
+        loglines = list(training_client.stream_job_logs(**kwargs))
+        assert loglines == expected_output
+    except Exception as e:
+        assert type(e) is expected_output
+
+    print("test execution complete")
+
+
+test_data_get_job_events = [
+    (
+        "valid flow with job and pod events",
+        {"name": TEST_NAME, "timeout": 1},
+        {
+            (constants.PYTORCHJOB_KIND, TEST_NAME),
+            (constants.POD_KIND, f"{TEST_NAME}-worker-0"),
+        },
+    ),
+    (
+        "invalid job kind",
+        {"name": TEST_NAME, "job_kind": "invalid", "timeout": 1},
+        ValueError,
+    ),
+    (
+        "runtime error when watching events",
+        {"name": TEST_NAME, "namespace": WATCH_ERROR, "timeout": 1},
+        RuntimeError,
+    ),
+]
+
+
+@pytest.mark.parametrize("test_name,kwargs,expected_output", test_data_get_job_events)
+def test_get_job_events(training_client, test_name, kwargs, expected_output):
+    """
+    test get_job_events function of training client
+    """
+    print("Executing test:", test_name)
+
+    try:
+        events = training_client.get_job_events(**kwargs)
+        # Job kind is validated before the events are iterated.
+        assert expected_output is not ValueError
+        events = list(events)
+        assert {
+            (e.involved_object.kind, e.involved_object.name) for e in events
+        } == expected_output
+        # Watch is resumed after the first stream of events is finished.
+        assert len(events) > len(expected_output)
+
+        # Events are watched with field selector for the Job and every pod.
+        field_selectors = [
+            c.kwargs.get("field_selector")
+            for c in watch.Watch().stream.call_args_list
+            if c.args[0] == training_client.core_api.list_namespaced_event
+        ]
+        assert set(field_selectors) == {
+            f"involvedObject.kind={kind},involvedObject.name={name}"
+            for kind, name in expected_output
+        }
+    except Exception as e:
+        assert type(e) is expected_output
+
+    print("test execution complete")
+
+
+COMPLETED_JOB_SUMMARY = types.JobSummary(
+    name=TEST_NAME,
+    namespace=TEST_NAME,
+    kind=constants.PYTORCHJOB_KIND,
+    status=SUCCEEDED,
+    replicas={
+        "Master": types.ReplicaSummary(replicas=1, succeeded=1),
+        "Worker": types.ReplicaSummary(replicas=1, succeeded=1),
+    },
+    creation_timestamp=JOB_CREATION_TIMESTAMP,
+    start_time=JOB_CREATION_TIMESTAMP,
+    completion_time=JOB_CREATION_TIMESTAMP + timedelta(minutes=10),
+    duration=600,
+    condition_durations={CREATED: 0, SUCCEEDED: 600},
+)
+RUNNING_JOB_SUMMARY = types.JobSummary(
+    name=TEST_NAME,
+    namespace=TEST_NAME,
+    kind=constants.PYTORCHJOB_KIND,
+    status=RUNNING,
+    replicas={
+        "Master": types.ReplicaSummary(replicas=1),
+        "Worker": types.ReplicaSummary(replicas=1),
+    },
+)
+
+test_data_get_job_summary = [
+    (
+        "valid flow with completed job",
+        {"name": TEST_NAME, "namespace": JOB_SUMMARY},
+        COMPLETED_JOB_SUMMARY,
+    ),
+    (
+        "invalid flow with default namespace and a Job that doesn't exist",
+        {"name": TEST_NAME, "namespace": RUNTIME},
+        RuntimeError,
+    ),
+    (
+        "invalid flow with timeout error",
+        {"name": TEST_NAME, "namespace": TIMEOUT},
+        TimeoutError,
+    ),
+    (
+        "invalid flow with incorrect job kind",
+        {"name": TEST_NAME, "job_kind": "invalid"},
+        ValueError,
+    ),
+]
+
+
+@pytest.mark.parametrize("test_name,kwargs,expected_output", test_data_get_job_summary)
+def test_get_job_summary(training_client, test_name, kwargs, expected_output):
+    """
+    test get_job_summary function of training client
+    """
+    print("Executing test:", test_name)
+
+    try:
+        summary = training_client.get_job_summary(**kwargs)
+        assert summary == expected_output
+    except Exception as e:
+        assert type(e) is expected_output
+
+    print("test execution complete")
+
+
+test_data_summarize_jobs = [
+    (
+        "valid flow with completed and running jobs",
+        {"namespace": JOB_SUMMARY},
+        [COMPLETED_JOB_SUMMARY, RUNNING_JOB_SUMMARY],
+    ),
+    (
+        "invalid flow with timeout error",
+        {"namespace": TIMEOUT},
+        TimeoutError,
+    ),
+]
+
+
+@pytest.mark.parametrize("test_name,kwargs,expected_output", test_data_summarize_jobs)
+def test_summarize_jobs(training_client, test_name, kwargs, expected_output):
+    """
+    test summarize_jobs function of training client
+    """
+    print("Executing test:", test_name)
+
+    try:
+        summaries = training_client.summarize_jobs(**kwargs)
+        assert summaries == expected_output
+    except Exception as e:
+        assert type(e) is expected_output
+
+    print("test execution complete")
+
+
+def test_import_is_lazy():
+    """
+    test import of the SDK doesn't resolve the namespace or load every model
+    """
+    code = """
+import sys
+from unittest.mock import patch
+
+with patch("kubernetes.config.list_kube_config_contexts") as contexts:
+    import kubeflow.training
+    assert not contexts.called
+
+models = [m for m in sys.modules if m.startswith("kubeflow.training.models.")]
+assert len(models) < len(kubeflow.training.models._MODEL_MODULES) / 2, models
+assert kubeflow.training.KubeflowOrgV1ReplicaSpec.__name__ == "KubeflowOrgV1ReplicaSpec"
+assert kubeflow.training.models.V1ObjectMeta.__module__.startswith("kubeflow")
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_training_client_default_namespace():
+    """
+    test namespace is resolved when training client is created
+    """
+    with patch(
+        "kubeflow.training.utils.utils.get_default_target_namespace",
+        return_value="resolved",
+    ), patch("kubernetes.config.load_kube_config"):
+        assert TrainingClient().namespace == "resolved"
+        assert TrainingClient(namespace="test").namespace == "test"
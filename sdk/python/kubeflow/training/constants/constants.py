@@ -21,6 +21,21 @@ from kubeflow.training import models
 # How long to wait in seconds for requests to the Kubernetes API Server.
 DEFAULT_TIMEOUT = 120
 
+# The default number of Jobs to get per list request.
+DEFAULT_PAGE_SIZE = 500
+
+# The default number of concurrent requests to the Kubernetes API Server.
+DEFAULT_MAX_CONCURRENCY = 16
+
+# The default number of connections and threads for requests to the Kubernetes API Server.
+DEFAULT_CONNECTION_POOL_SIZE = DEFAULT_MAX_CONCURRENCY
+
+# The default backoff factor in seconds to retry requests to the Kubernetes API Server.
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
+
+# HTTP status codes of the Kubernetes API Server responses which are retried.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 # The default PIP index URL to download Python packages.
 DEFAULT_PIP_INDEX_URL = "https://pypi.org/simple"
 
@@ -38,6 +53,12 @@ API_VERSION = f"{GROUP}/{VERSION}"
 # Kind for pod.
 POD_KIND = "Pod"
 
+# Accept header to list only object metadata. Kubernetes API server returns the full
+# list if partial object metadata is not supported.
+PARTIAL_OBJECT_METADATA_LIST_ACCEPT = (
+    "application/json;as=PartialObjectMetadataList;v=v1;g=meta.k8s.io,application/json"
+)
+
 # Pending status for pod phase.
 POD_PHASE_PENDING = "Pending"
 
@@ -55,6 +76,12 @@ JOB_CONDITIONS = {
     JOB_CONDITION_SUCCEEDED,
     JOB_CONDITION_FAILED,
 }
+
+# Results of the Training Job creation.
+JOB_CREATION_CREATED = "Created"
+JOB_CREATION_ALREADY_EXISTS = "AlreadyExists"
+JOB_CREATION_FAILED = "Failed"
+
 # True means that Training Job is in this condition.
 CONDITION_STATUS_TRUE = "True"
 
@@ -16,78 +16,102 @@ from __future__ import absolute_import
 # Import Kubernetes models.
 from kubernetes.client import *
 
-# import models into model package
-from kubeflow.training.models.kubeflow_org_v1_elastic_policy import KubeflowOrgV1ElasticPolicy
-from kubeflow.training.models.kubeflow_org_v1_jax_job import KubeflowOrgV1JAXJob
-from kubeflow.training.models.kubeflow_org_v1_jax_job_list import KubeflowOrgV1JAXJobList
-from kubeflow.training.models.kubeflow_org_v1_jax_job_spec import KubeflowOrgV1JAXJobSpec
-from kubeflow.training.models.kubeflow_org_v1_job_condition import KubeflowOrgV1JobCondition
-from kubeflow.training.models.kubeflow_org_v1_job_status import KubeflowOrgV1JobStatus
-from kubeflow.training.models.kubeflow_org_v1_mpi_job import KubeflowOrgV1MPIJob
-from kubeflow.training.models.kubeflow_org_v1_mpi_job_list import KubeflowOrgV1MPIJobList
-from kubeflow.training.models.kubeflow_org_v1_mpi_job_spec import KubeflowOrgV1MPIJobSpec
-from kubeflow.training.models.kubeflow_org_v1_paddle_elastic_policy import KubeflowOrgV1PaddleElasticPolicy
-from kubeflow.training.models.kubeflow_org_v1_paddle_job import KubeflowOrgV1PaddleJob
-from kubeflow.training.models.kubeflow_org_v1_paddle_job_list import KubeflowOrgV1PaddleJobList
-from kubeflow.training.models.kubeflow_org_v1_paddle_job_spec import KubeflowOrgV1PaddleJobSpec
-from kubeflow.training.models.kubeflow_org_v1_py_torch_job import KubeflowOrgV1PyTorchJob
-from kubeflow.training.models.kubeflow_org_v1_py_torch_job_list import KubeflowOrgV1PyTorchJobList
-from kubeflow.training.models.kubeflow_org_v1_py_torch_job_spec import KubeflowOrgV1PyTorchJobSpec
-from kubeflow.training.models.kubeflow_org_v1_rdzv_conf import KubeflowOrgV1RDZVConf
-from kubeflow.training.models.kubeflow_org_v1_replica_spec import KubeflowOrgV1ReplicaSpec
-from kubeflow.training.models.kubeflow_org_v1_replica_status import KubeflowOrgV1ReplicaStatus
-from kubeflow.training.models.kubeflow_org_v1_run_policy import KubeflowOrgV1RunPolicy
-from kubeflow.training.models.kubeflow_org_v1_scheduling_policy import KubeflowOrgV1SchedulingPolicy
-from kubeflow.training.models.kubeflow_org_v1_tf_job import KubeflowOrgV1TFJob
-from kubeflow.training.models.kubeflow_org_v1_tf_job_list import KubeflowOrgV1TFJobList
-from kubeflow.training.models.kubeflow_org_v1_tf_job_spec import KubeflowOrgV1TFJobSpec
-from kubeflow.training.models.kubeflow_org_v1_xg_boost_job import KubeflowOrgV1XGBoostJob
-from kubeflow.training.models.kubeflow_org_v1_xg_boost_job_list import KubeflowOrgV1XGBoostJobList
-from kubeflow.training.models.kubeflow_org_v1_xg_boost_job_spec import KubeflowOrgV1XGBoostJobSpec
-from kubeflow.training.models.runtime_type_meta import RuntimeTypeMeta
-from kubeflow.training.models.runtime_unknown import RuntimeUnknown
-from kubeflow.training.models.v1_api_group import V1APIGroup
-from kubeflow.training.models.v1_api_group_list import V1APIGroupList
-from kubeflow.training.models.v1_api_resource import V1APIResource
-from kubeflow.training.models.v1_api_resource_list import V1APIResourceList
-from kubeflow.training.models.v1_api_versions import V1APIVersions
-from kubeflow.training.models.v1_apply_options import V1ApplyOptions
-from kubeflow.training.models.v1_condition import V1Condition
-from kubeflow.training.models.v1_create_options import V1CreateOptions
-from kubeflow.training.models.v1_delete_options import V1DeleteOptions
-from kubeflow.training.models.v1_field_selector_requirement import V1FieldSelectorRequirement
-from kubeflow.training.models.v1_get_options import V1GetOptions
-from kubeflow.training.models.v1_group_kind import V1GroupKind
-from kubeflow.training.models.v1_group_resource import V1GroupResource
-from kubeflow.training.models.v1_group_version import V1GroupVersion
-from kubeflow.training.models.v1_group_version_for_discovery import V1GroupVersionForDiscovery
-from kubeflow.training.models.v1_group_version_kind import V1GroupVersionKind
-from kubeflow.training.models.v1_group_version_resource import V1GroupVersionResource
-from kubeflow.training.models.v1_internal_event import V1InternalEvent
-from kubeflow.training.models.v1_label_selector import V1LabelSelector
-from kubeflow.training.models.v1_label_selector_requirement import V1LabelSelectorRequirement
-from kubeflow.training.models.v1_list import V1List
-from kubeflow.training.models.v1_list_meta import V1ListMeta
-from kubeflow.training.models.v1_list_options import V1ListOptions
-from kubeflow.training.models.v1_managed_fields_entry import V1ManagedFieldsEntry
-from kubeflow.training.models.v1_object_meta import V1ObjectMeta
-from kubeflow.training.models.v1_owner_reference import V1OwnerReference
-from kubeflow.training.models.v1_partial_object_metadata import V1PartialObjectMetadata
-from kubeflow.training.models.v1_partial_object_metadata_list import V1PartialObjectMetadataList
-from kubeflow.training.models.v1_patch_options import V1PatchOptions
-from kubeflow.training.models.v1_preconditions import V1Preconditions
-from kubeflow.training.models.v1_root_paths import V1RootPaths
-from kubeflow.training.models.v1_server_address_by_client_cidr import V1ServerAddressByClientCIDR
-from kubeflow.training.models.v1_status import V1Status
-from kubeflow.training.models.v1_status_cause import V1StatusCause
-from kubeflow.training.models.v1_status_details import V1StatusDetails
-from kubeflow.training.models.v1_table import V1Table
-from kubeflow.training.models.v1_table_column_definition import V1TableColumnDefinition
-from kubeflow.training.models.v1_table_options import V1TableOptions
-from kubeflow.training.models.v1_table_row import V1TableRow
-from kubeflow.training.models.v1_table_row_condition import V1TableRowCondition
-from kubeflow.training.models.v1_timestamp import V1Timestamp
-from kubeflow.training.models.v1_type_meta import V1TypeMeta
-from kubeflow.training.models.v1_update_options import V1UpdateOptions
-from kubeflow.training.models.v1_watch_event import V1WatchEvent
-from kubeflow.training.models.version_info import VersionInfo
+
+from importlib import import_module as _import_module
+
+# Models are imported on the first access, so the package import doesn't load
+# every model module.
+_MODEL_MODULES = {
+    'KubeflowOrgV1ElasticPolicy': 'kubeflow.training.models.kubeflow_org_v1_elastic_policy',
+    'KubeflowOrgV1JAXJob': 'kubeflow.training.models.kubeflow_org_v1_jax_job',
+    'KubeflowOrgV1JAXJobList': 'kubeflow.training.models.kubeflow_org_v1_jax_job_list',
+    'KubeflowOrgV1JAXJobSpec': 'kubeflow.training.models.kubeflow_org_v1_jax_job_spec',
+    'KubeflowOrgV1JobCondition': 'kubeflow.training.models.kubeflow_org_v1_job_condition',
+    'KubeflowOrgV1JobStatus': 'kubeflow.training.models.kubeflow_org_v1_job_status',
+    'KubeflowOrgV1MPIJob': 'kubeflow.training.models.kubeflow_org_v1_mpi_job',
+    'KubeflowOrgV1MPIJobList': 'kubeflow.training.models.kubeflow_org_v1_mpi_job_list',
+    'KubeflowOrgV1MPIJobSpec': 'kubeflow.training.models.kubeflow_org_v1_mpi_job_spec',
+    'KubeflowOrgV1PaddleElasticPolicy': 'kubeflow.training.models.kubeflow_org_v1_paddle_elastic_policy',
+    'KubeflowOrgV1PaddleJob': 'kubeflow.training.models.kubeflow_org_v1_paddle_job',
+    'KubeflowOrgV1PaddleJobList': 'kubeflow.training.models.kubeflow_org_v1_paddle_job_list',
+    'KubeflowOrgV1PaddleJobSpec': 'kubeflow.training.models.kubeflow_org_v1_paddle_job_spec',
+    'KubeflowOrgV1PyTorchJob': 'kubeflow.training.models.kubeflow_org_v1_py_torch_job',
+    'KubeflowOrgV1PyTorchJobList': 'kubeflow.training.models.kubeflow_org_v1_py_torch_job_list',
+    'KubeflowOrgV1PyTorchJobSpec': 'kubeflow.training.models.kubeflow_org_v1_py_torch_job_spec',
+    'KubeflowOrgV1RDZVConf': 'kubeflow.training.models.kubeflow_org_v1_rdzv_conf',
+    'KubeflowOrgV1ReplicaSpec': 'kubeflow.training.models.kubeflow_org_v1_replica_spec',
+    'KubeflowOrgV1ReplicaStatus': 'kubeflow.training.models.kubeflow_org_v1_replica_status',
+    'KubeflowOrgV1RunPolicy': 'kubeflow.training.models.kubeflow_org_v1_run_policy',
+    'KubeflowOrgV1SchedulingPolicy': 'kubeflow.training.models.kubeflow_org_v1_scheduling_policy',
+    'KubeflowOrgV1TFJob': 'kubeflow.training.models.kubeflow_org_v1_tf_job',
+    'KubeflowOrgV1TFJobList': 'kubeflow.training.models.kubeflow_org_v1_tf_job_list',
+    'KubeflowOrgV1TFJobSpec': 'kubeflow.training.models.kubeflow_org_v1_tf_job_spec',
+    'KubeflowOrgV1XGBoostJob': 'kubeflow.training.models.kubeflow_org_v1_xg_boost_job',
+    'KubeflowOrgV1XGBoostJobList': 'kubeflow.training.models.kubeflow_org_v1_xg_boost_job_list',
+    'KubeflowOrgV1XGBoostJobSpec': 'kubeflow.training.models.kubeflow_org_v1_xg_boost_job_spec',
+    'RuntimeTypeMeta': 'kubeflow.training.models.runtime_type_meta',
+    'RuntimeUnknown': 'kubeflow.training.models.runtime_unknown',
+    'V1APIGroup': 'kubeflow.training.models.v1_api_group',
+    'V1APIGroupList': 'kubeflow.training.models.v1_api_group_list',
+    'V1APIResource': 'kubeflow.training.models.v1_api_resource',
+    'V1APIResourceList': 'kubeflow.training.models.v1_api_resource_list',
+    'V1APIVersions': 'kubeflow.training.models.v1_api_versions',
+    'V1ApplyOptions': 'kubeflow.training.models.v1_apply_options',
+    'V1Condition': 'kubeflow.training.models.v1_condition',
+    'V1CreateOptions': 'kubeflow.training.models.v1_create_options',
+    'V1DeleteOptions': 'kubeflow.training.models.v1_delete_options',
+    'V1FieldSelectorRequirement': 'kubeflow.training.models.v1_field_selector_requirement',
+    'V1GetOptions': 'kubeflow.training.models.v1_get_options',
+    'V1GroupKind': 'kubeflow.training.models.v1_group_kind',
+    'V1GroupResource': 'kubeflow.training.models.v1_group_resource',
+    'V1GroupVersion': 'kubeflow.training.models.v1_group_version',
+    'V1GroupVersionForDiscovery': 'kubeflow.training.models.v1_group_version_for_discovery',
+    'V1GroupVersionKind': 'kubeflow.training.models.v1_group_version_kind',
+    'V1GroupVersionResource': 'kubeflow.training.models.v1_group_version_resource',
+    'V1InternalEvent': 'kubeflow.training.models.v1_internal_event',
+    'V1LabelSelector': 'kubeflow.training.models.v1_label_selector',
+    'V1LabelSelectorRequirement': 'kubeflow.training.models.v1_label_selector_requirement',
+    'V1List': 'kubeflow.training.models.v1_list',
+    'V1ListMeta': 'kubeflow.training.models.v1_list_meta',
+    'V1ListOptions': 'kubeflow.training.models.v1_list_options',
+    'V1ManagedFieldsEntry': 'kubeflow.training.models.v1_managed_fields_entry',
+    'V1ObjectMeta': 'kubeflow.training.models.v1_object_meta',
+    'V1OwnerReference': 'kubeflow.training.models.v1_owner_reference',
+    'V1PartialObjectMetadata': 'kubeflow.training.models.v1_partial_object_metadata',
+    'V1PartialObjectMetadataList': 'kubeflow.training.models.v1_partial_object_metadata_list',
+    'V1PatchOptions': 'kubeflow.training.models.v1_patch_options',
+    'V1Preconditions': 'kubeflow.training.models.v1_preconditions',
+    'V1RootPaths': 'kubeflow.training.models.v1_root_paths',
+    'V1ServerAddressByClientCIDR': 'kubeflow.training.models.v1_server_address_by_client_cidr',
+    'V1Status': 'kubeflow.training.models.v1_status',
+    'V1StatusCause': 'kubeflow.training.models.v1_status_cause',
+    'V1StatusDetails': 'kubeflow.training.models.v1_status_details',
+    'V1Table': 'kubeflow.training.models.v1_table',
+    'V1TableColumnDefinition': 'kubeflow.training.models.v1_table_column_definition',
+    'V1TableOptions': 'kubeflow.training.models.v1_table_options',
+    'V1TableRow': 'kubeflow.training.models.v1_table_row',
+    'V1TableRowCondition': 'kubeflow.training.models.v1_table_row_condition',
+    'V1Timestamp': 'kubeflow.training.models.v1_timestamp',
+    'V1TypeMeta': 'kubeflow.training.models.v1_type_meta',
+    'V1UpdateOptions': 'kubeflow.training.models.v1_update_options',
+    'V1WatchEvent': 'kubeflow.training.models.v1_watch_event',
+    'VersionInfo': 'kubeflow.training.models.version_info',
+}
+
+# Training models replace the Kubernetes models with the same name.
+for _name in _MODEL_MODULES:
+    globals().pop(_name, None)
+
+__all__ = [name for name in globals() if not name.startswith('_')] + list(_MODEL_MODULES)
+
+
+def __getattr__(name):
+    if name not in _MODEL_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model = getattr(_import_module(_MODEL_MODULES[name]), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODEL_MODULES))
@@ -60,6 +60,22 @@ class KubeflowOrgV1ElasticPolicy(object):
         'standalone': 'standalone'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_max_replicas',
+        '_max_restarts',
+        '_metrics',
+        '_min_replicas',
+        '_n_proc_per_node',
+        '_rdzv_backend',
+        '_rdzv_conf',
+        '_rdzv_host',
+        '_rdzv_id',
+        '_rdzv_port',
+        '_standalone',
+        'discriminator',
+    )
+
     def __init__(self, max_replicas=None, max_restarts=None, metrics=None, min_replicas=None, n_proc_per_node=None, rdzv_backend=None, rdzv_conf=None, rdzv_host=None, rdzv_id=None, rdzv_port=None, standalone=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1ElasticPolicy - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -48,6 +48,16 @@ class KubeflowOrgV1JAXJob(object):
         'status': 'status'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_spec',
+        '_status',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, spec=None, status=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1JAXJob - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
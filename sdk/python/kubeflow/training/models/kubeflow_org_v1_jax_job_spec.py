@@ -42,6 +42,13 @@ class KubeflowOrgV1JAXJobSpec(object):
         'run_policy': 'runPolicy'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_jax_replica_specs',
+        '_run_policy',
+        'discriminator',
+    )
+
     def __init__(self, jax_replica_specs=None, run_policy=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1JAXJobSpec - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
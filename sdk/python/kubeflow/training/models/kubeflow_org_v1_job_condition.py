@@ -50,6 +50,17 @@ class KubeflowOrgV1JobCondition(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_last_transition_time',
+        '_last_update_time',
+        '_message',
+        '_reason',
+        '_status',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, last_transition_time=None, last_update_time=None, message=None, reason=None, status='', type='', local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1JobCondition - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
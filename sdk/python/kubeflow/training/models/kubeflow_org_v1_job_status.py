@@ -48,6 +48,16 @@ class KubeflowOrgV1JobStatus(object):
         'start_time': 'startTime'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_completion_time',
+        '_conditions',
+        '_last_reconcile_time',
+        '_replica_statuses',
+        '_start_time',
+        'discriminator',
+    )
+
     def __init__(self, completion_time=None, conditions=None, last_reconcile_time=None, replica_statuses=None, start_time=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1JobStatus - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
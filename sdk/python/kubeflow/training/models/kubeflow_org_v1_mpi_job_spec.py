@@ -48,6 +48,16 @@ class KubeflowOrgV1MPIJobSpec(object):
         'slots_per_worker': 'slotsPerWorker'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_clean_pod_policy',
+        '_main_container',
+        '_mpi_replica_specs',
+        '_run_policy',
+        '_slots_per_worker',
+        'discriminator',
+    )
+
     def __init__(self, clean_pod_policy=None, main_container=None, mpi_replica_specs=None, run_policy=None, slots_per_worker=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1MPIJobSpec - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
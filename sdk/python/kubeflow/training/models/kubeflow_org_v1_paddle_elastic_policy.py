@@ -46,6 +46,15 @@ class KubeflowOrgV1PaddleElasticPolicy(object):
         'min_replicas': 'minReplicas'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_max_replicas',
+        '_max_restarts',
+        '_metrics',
+        '_min_replicas',
+        'discriminator',
+    )
+
     def __init__(self, max_replicas=None, max_restarts=None, metrics=None, min_replicas=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1PaddleElasticPolicy - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
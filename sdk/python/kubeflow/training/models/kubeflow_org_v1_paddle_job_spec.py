@@ -44,6 +44,14 @@ class KubeflowOrgV1PaddleJobSpec(object):
         'run_policy': 'runPolicy'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_elastic_policy',
+        '_paddle_replica_specs',
+        '_run_policy',
+        'discriminator',
+    )
+
     def __init__(self, elastic_policy=None, paddle_replica_specs=None, run_policy=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1PaddleJobSpec - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
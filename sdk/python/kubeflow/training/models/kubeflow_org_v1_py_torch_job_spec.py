@@ -46,6 +46,15 @@ class KubeflowOrgV1PyTorchJobSpec(object):
         'run_policy': 'runPolicy'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_elastic_policy',
+        '_nproc_per_node',
+        '_pytorch_replica_specs',
+        '_run_policy',
+        'discriminator',
+    )
+
     def __init__(self, elastic_policy=None, nproc_per_node=None, pytorch_replica_specs=None, run_policy=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1PyTorchJobSpec - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
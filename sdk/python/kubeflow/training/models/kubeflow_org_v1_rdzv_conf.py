@@ -42,6 +42,13 @@ class KubeflowOrgV1RDZVConf(object):
         'value': 'value'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_key',
+        '_value',
+        'discriminator',
+    )
+
     def __init__(self, key=None, value=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1RDZVConf - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -44,6 +44,14 @@ class KubeflowOrgV1ReplicaSpec(object):
         'template': 'template'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_replicas',
+        '_restart_policy',
+        '_template',
+        'discriminator',
+    )
+
     def __init__(self, replicas=None, restart_policy=None, template=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1ReplicaSpec - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -48,6 +48,16 @@ class KubeflowOrgV1ReplicaStatus(object):
         'succeeded': 'succeeded'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_active',
+        '_failed',
+        '_label_selector',
+        '_selector',
+        '_succeeded',
+        'discriminator',
+    )
+
     def __init__(self, active=None, failed=None, label_selector=None, selector=None, succeeded=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1ReplicaStatus - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
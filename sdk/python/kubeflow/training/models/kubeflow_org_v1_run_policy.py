@@ -52,6 +52,18 @@ class KubeflowOrgV1RunPolicy(object):
         'ttl_seconds_after_finished': 'ttlSecondsAfterFinished'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_active_deadline_seconds',
+        '_backoff_limit',
+        '_clean_pod_policy',
+        '_managed_by',
+        '_scheduling_policy',
+        '_suspend',
+        '_ttl_seconds_after_finished',
+        'discriminator',
+    )
+
     def __init__(self, active_deadline_seconds=None, backoff_limit=None, clean_pod_policy=None, managed_by=None, scheduling_policy=None, suspend=None, ttl_seconds_after_finished=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1RunPolicy - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
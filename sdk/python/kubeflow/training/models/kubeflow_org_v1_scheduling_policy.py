@@ -48,6 +48,16 @@ class KubeflowOrgV1SchedulingPolicy(object):
         'schedule_timeout_seconds': 'scheduleTimeoutSeconds'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_min_available',
+        '_min_resources',
+        '_priority_class',
+        '_queue',
+        '_schedule_timeout_seconds',
+        'discriminator',
+    )
+
     def __init__(self, min_available=None, min_resources=None, priority_class=None, queue=None, schedule_timeout_seconds=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1SchedulingPolicy - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
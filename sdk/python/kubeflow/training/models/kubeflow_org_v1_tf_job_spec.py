@@ -46,6 +46,15 @@ class KubeflowOrgV1TFJobSpec(object):
         'tf_replica_specs': 'tfReplicaSpecs'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_enable_dynamic_worker',
+        '_run_policy',
+        '_success_policy',
+        '_tf_replica_specs',
+        'discriminator',
+    )
+
     def __init__(self, enable_dynamic_worker=None, run_policy=None, success_policy=None, tf_replica_specs=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1TFJobSpec - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
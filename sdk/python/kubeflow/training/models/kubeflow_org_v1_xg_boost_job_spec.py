@@ -42,6 +42,13 @@ class KubeflowOrgV1XGBoostJobSpec(object):
         'xgb_replica_specs': 'xgbReplicaSpecs'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_run_policy',
+        '_xgb_replica_specs',
+        'discriminator',
+    )
+
     def __init__(self, run_policy=None, xgb_replica_specs=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV1XGBoostJobSpec - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -46,6 +46,15 @@ class RuntimeUnknown(object):
         'kind': 'kind'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_content_encoding',
+        '_content_type',
+        '_api_version',
+        '_kind',
+        'discriminator',
+    )
+
     def __init__(self, content_encoding='', content_type='', api_version=None, kind=None, local_vars_configuration=None):  # noqa: E501
         """RuntimeUnknown - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -44,6 +44,14 @@ class V1APIGroupList(object):
         'kind': 'kind'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_groups',
+        '_kind',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, groups=None, kind=None, local_vars_configuration=None):  # noqa: E501
         """V1APIGroupList - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
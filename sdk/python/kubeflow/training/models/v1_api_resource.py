@@ -58,6 +58,21 @@ class V1APIResource(object):
         'version': 'version'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_categories',
+        '_group',
+        '_kind',
+        '_name',
+        '_namespaced',
+        '_short_names',
+        '_singular_name',
+        '_storage_version_hash',
+        '_verbs',
+        '_version',
+        'discriminator',
+    )
+
     def __init__(self, categories=None, group=None, kind='', name='', namespaced=False, short_names=None, singular_name='', storage_version_hash=None, verbs=None, version=None, local_vars_configuration=None):  # noqa: E501
         """V1APIResource - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
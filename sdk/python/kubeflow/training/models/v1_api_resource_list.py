@@ -46,6 +46,15 @@ class V1APIResourceList(object):
         'resources': 'resources'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_group_version',
+        '_kind',
+        '_resources',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, group_version='', kind=None, resources=None, local_vars_configuration=None):  # noqa: E501
         """V1APIResourceList - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
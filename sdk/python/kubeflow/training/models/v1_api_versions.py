@@ -46,6 +46,15 @@ class V1APIVersions(object):
         'versions': 'versions'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_kind',
+        '_server_address_by_client_cid_rs',
+        '_versions',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, server_address_by_client_cid_rs=None, versions=None, local_vars_configuration=None):  # noqa: E501
         """V1APIVersions - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
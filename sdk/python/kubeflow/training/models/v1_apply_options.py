@@ -48,6 +48,16 @@ class V1ApplyOptions(object):
         'kind': 'kind'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_dry_run',
+        '_field_manager',
+        '_force',
+        '_kind',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, dry_run=None, field_manager='', force=False, kind=None, local_vars_configuration=None):  # noqa: E501
         """V1ApplyOptions - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
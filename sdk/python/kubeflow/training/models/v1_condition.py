@@ -50,6 +50,17 @@ class V1Condition(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_last_transition_time',
+        '_message',
+        '_observed_generation',
+        '_reason',
+        '_status',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, last_transition_time=None, message='', observed_generation=None, reason='', status='', type='', local_vars_configuration=None):  # noqa: E501
         """V1Condition - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -52,6 +52,18 @@ class V1DeleteOptions(object):
         'propagation_policy': 'propagationPolicy'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_dry_run',
+        '_grace_period_seconds',
+        '_kind',
+        '_orphan_dependents',
+        '_preconditions',
+        '_propagation_policy',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, dry_run=None, grace_period_seconds=None, kind=None, orphan_dependents=None, preconditions=None, propagation_policy=None, local_vars_configuration=None):  # noqa: E501
         """V1DeleteOptions - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -44,6 +44,14 @@ class V1GetOptions(object):
         'resource_version': 'resourceVersion'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_kind',
+        '_resource_version',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, resource_version=None, local_vars_configuration=None):  # noqa: E501
         """V1GetOptions - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class V1GroupKind(object):
         'kind': 'kind'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_group',
+        '_kind',
+        'discriminator',
+    )
+
     def __init__(self, group='', kind='', local_vars_configuration=None):  # noqa: E501
         """V1GroupKind - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class V1GroupResource(object):
         'resource': 'resource'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_group',
+        '_resource',
+        'discriminator',
+    )
+
     def __init__(self, group='', resource='', local_vars_configuration=None):  # noqa: E501
         """V1GroupResource - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class V1GroupVersion(object):
         'version': 'version'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_group',
+        '_version',
+        'discriminator',
+    )
+
     def __init__(self, group='', version='', local_vars_configuration=None):  # noqa: E501
         """V1GroupVersion - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class V1GroupVersionForDiscovery(object):
         'version': 'version'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_group_version',
+        '_version',
+        'discriminator',
+    )
+
     def __init__(self, group_version='', version='', local_vars_configuration=None):  # noqa: E501
         """V1GroupVersionForDiscovery - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
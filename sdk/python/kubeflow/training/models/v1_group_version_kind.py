@@ -44,6 +44,14 @@ class V1GroupVersionKind(object):
         'version': 'version'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_group',
+        '_kind',
+        '_version',
+        'discriminator',
+    )
+
     def __init__(self, group='', kind='', version='', local_vars_configuration=None):  # noqa: E501
         """V1GroupVersionKind - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class V1LabelSelector(object):
         'match_labels': 'matchLabels'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_match_expressions',
+        '_match_labels',
+        'discriminator',
+    )
+
     def __init__(self, match_expressions=None, match_labels=None, local_vars_configuration=None):  # noqa: E501
         """V1LabelSelector - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -44,6 +44,14 @@ class V1LabelSelectorRequirement(object):
         'values': 'values'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_key',
+        '_operator',
+        '_values',
+        'discriminator',
+    )
+
     def __init__(self, key='', operator='', values=None, local_vars_configuration=None):  # noqa: E501
         """V1LabelSelectorRequirement - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -46,6 +46,15 @@ class V1ListMeta(object):
         'self_link': 'selfLink'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '__continue',
+        '_remaining_item_count',
+        '_resource_version',
+        '_self_link',
+        'discriminator',
+    )
+
     def __init__(self, _continue=None, remaining_item_count=None, resource_version=None, self_link=None, local_vars_configuration=None):  # noqa: E501
         """V1ListMeta - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
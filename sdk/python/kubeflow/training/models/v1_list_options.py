@@ -62,6 +62,23 @@ class V1ListOptions(object):
         'watch': 'watch'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_allow_watch_bookmarks',
+        '_api_version',
+        '__continue',
+        '_field_selector',
+        '_kind',
+        '_label_selector',
+        '_limit',
+        '_resource_version',
+        '_resource_version_match',
+        '_send_initial_events',
+        '_timeout_seconds',
+        '_watch',
+        'discriminator',
+    )
+
     def __init__(self, allow_watch_bookmarks=None, api_version=None, _continue=None, field_selector=None, kind=None, label_selector=None, limit=None, resource_version=None, resource_version_match=None, send_initial_events=None, timeout_seconds=None, watch=None, local_vars_configuration=None):  # noqa: E501
         """V1ListOptions - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -52,6 +52,18 @@ class V1ManagedFieldsEntry(object):
         'time': 'time'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_fields_type',
+        '_fields_v1',
+        '_manager',
+        '_operation',
+        '_subresource',
+        '_time',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, fields_type=None, fields_v1=None, manager=None, operation=None, subresource=None, time=None, local_vars_configuration=None):  # noqa: E501
         """V1ManagedFieldsEntry - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -68,6 +68,26 @@ class V1ObjectMeta(object):
         'uid': 'uid'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_annotations',
+        '_creation_timestamp',
+        '_deletion_grace_period_seconds',
+        '_deletion_timestamp',
+        '_finalizers',
+        '_generate_name',
+        '_generation',
+        '_labels',
+        '_managed_fields',
+        '_name',
+        '_namespace',
+        '_owner_references',
+        '_resource_version',
+        '_self_link',
+        '_uid',
+        'discriminator',
+    )
+
     def __init__(self, annotations=None, creation_timestamp=None, deletion_grace_period_seconds=None, deletion_timestamp=None, finalizers=None, generate_name=None, generation=None, labels=None, managed_fields=None, name=None, namespace=None, owner_references=None, resource_version=None, self_link=None, uid=None, local_vars_configuration=None):  # noqa: E501
         """V1ObjectMeta - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -50,6 +50,17 @@ class V1OwnerReference(object):
         'uid': 'uid'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_block_owner_deletion',
+        '_controller',
+        '_kind',
+        '_name',
+        '_uid',
+        'discriminator',
+    )
+
     def __init__(self, api_version='', block_owner_deletion=None, controller=None, kind='', name='', uid='', local_vars_configuration=None):  # noqa: E501
         """V1OwnerReference - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -44,6 +44,14 @@ class V1PartialObjectMetadata(object):
         'metadata': 'metadata'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_kind',
+        '_metadata',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, local_vars_configuration=None):  # noqa: E501
         """V1PartialObjectMetadata - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class V1Preconditions(object):
         'uid': 'uid'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_resource_version',
+        '_uid',
+        'discriminator',
+    )
+
     def __init__(self, resource_version=None, uid=None, local_vars_configuration=None):  # noqa: E501
         """V1Preconditions - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -40,6 +40,12 @@ class V1RootPaths(object):
         'paths': 'paths'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_paths',
+        'discriminator',
+    )
+
     def __init__(self, paths=None, local_vars_configuration=None):  # noqa: E501
         """V1RootPaths - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class V1ServerAddressByClientCIDR(object):
         'server_address': 'serverAddress'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_client_cidr',
+        '_server_address',
+        'discriminator',
+    )
+
     def __init__(self, client_cidr='', server_address='', local_vars_configuration=None):  # noqa: E501
         """V1ServerAddressByClientCIDR - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
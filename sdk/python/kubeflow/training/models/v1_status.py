@@ -54,6 +54,19 @@ class V1Status(object):
         'status': 'status'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_code',
+        '_details',
+        '_kind',
+        '_message',
+        '_metadata',
+        '_reason',
+        '_status',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, code=None, details=None, kind=None, message=None, metadata=None, reason=None, status=None, local_vars_configuration=None):  # noqa: E501
         """V1Status - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -44,6 +44,14 @@ class V1StatusCause(object):
         'reason': 'reason'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_field',
+        '_message',
+        '_reason',
+        'discriminator',
+    )
+
     def __init__(self, field=None, message=None, reason=None, local_vars_configuration=None):  # noqa: E501
         """V1StatusCause - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -50,6 +50,17 @@ class V1StatusDetails(object):
         'uid': 'uid'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_causes',
+        '_group',
+        '_kind',
+        '_name',
+        '_retry_after_seconds',
+        '_uid',
+        'discriminator',
+    )
+
     def __init__(self, causes=None, group=None, kind=None, name=None, retry_after_seconds=None, uid=None, local_vars_configuration=None):  # noqa: E501
         """V1StatusDetails - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -48,6 +48,16 @@ class V1Table(object):
         'rows': 'rows'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_column_definitions',
+        '_kind',
+        '_metadata',
+        '_rows',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, column_definitions=None, kind=None, metadata=None, rows=None, local_vars_configuration=None):  # noqa: E501
         """V1Table - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -48,6 +48,16 @@ class V1TableColumnDefinition(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_description',
+        '_format',
+        '_name',
+        '_priority',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, description='', format='', name='', priority=0, type='', local_vars_configuration=None):  # noqa: E501
         """V1TableColumnDefinition - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
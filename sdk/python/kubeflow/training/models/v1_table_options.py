@@ -44,6 +44,14 @@ class V1TableOptions(object):
         'kind': 'kind'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_include_object',
+        '_kind',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, include_object=None, kind=None, local_vars_configuration=None):  # noqa: E501
         """V1TableOptions - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -44,6 +44,14 @@ class V1TableRow(object):
         'object': 'object'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_cells',
+        '_conditions',
+        '_object',
+        'discriminator',
+    )
+
     def __init__(self, cells=None, conditions=None, object=None, local_vars_configuration=None):  # noqa: E501
         """V1TableRow - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
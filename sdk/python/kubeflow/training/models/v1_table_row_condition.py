@@ -46,6 +46,15 @@ class V1TableRowCondition(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_message',
+        '_reason',
+        '_status',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, message=None, reason=None, status='', type='', local_vars_configuration=None):  # noqa: E501
         """V1TableRowCondition - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class V1Timestamp(object):
         'seconds': 'seconds'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_nanos',
+        '_seconds',
+        'discriminator',
+    )
+
     def __init__(self, nanos=0, seconds=0, local_vars_configuration=None):  # noqa: E501
         """V1Timestamp - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
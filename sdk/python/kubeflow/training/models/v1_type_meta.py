@@ -42,6 +42,13 @@ class V1TypeMeta(object):
         'kind': 'kind'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_kind',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, local_vars_configuration=None):  # noqa: E501
         """V1TypeMeta - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
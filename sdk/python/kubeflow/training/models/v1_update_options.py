@@ -48,6 +48,16 @@ class V1UpdateOptions(object):
         'kind': 'kind'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_dry_run',
+        '_field_manager',
+        '_field_validation',
+        '_kind',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, dry_run=None, field_manager=None, field_validation=None, kind=None, local_vars_configuration=None):  # noqa: E501
         """V1UpdateOptions - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
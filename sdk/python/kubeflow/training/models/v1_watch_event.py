@@ -42,6 +42,13 @@ class V1WatchEvent(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_object',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, object=None, type='', local_vars_configuration=None):  # noqa: E501
         """V1WatchEvent - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
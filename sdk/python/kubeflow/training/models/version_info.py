@@ -56,6 +56,20 @@ class VersionInfo(object):
         'platform': 'platform'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_build_date',
+        '_compiler',
+        '_git_commit',
+        '_git_tree_state',
+        '_git_version',
+        '_go_version',
+        '_major',
+        '_minor',
+        '_platform',
+        'discriminator',
+    )
+
     def __init__(self, build_date='', compiler='', git_commit='', git_tree_state='', git_version='', go_version='', major='', minor='', platform='', local_vars_configuration=None):  # noqa: E501
         """VersionInfo - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
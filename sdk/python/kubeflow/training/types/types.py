@@ -0,0 +1,128 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from kubeflow.training.constants import constants
+
+
+@dataclass
+class JobList:
+    """Training Jobs listed across multiple kinds and namespaces.
+
+    Attributes:
+        jobs: List of Job objects. For example: KubeflowOrgV1PyTorchJob objects.
+        durations: Time in seconds of the slowest request to list Jobs for every kind.
+            Jobs are listed with one request per namespace, and requests for all
+            kinds and namespaces run concurrently.
+        errors: Exceptions for every kind that failed to be listed.
+    """
+
+    jobs: List[constants.JOB_MODELS_TYPE] = field(default_factory=list)
+    durations: Dict[str, float] = field(default_factory=dict)
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+
+@dataclass
+class CreateJobResult:
+    """Result of the Training Job creation in the batch.
+
+    Attributes:
+        name: Name of the Job.
+        namespace: Namespace of the Job.
+        status: Result of the creation: `Created`, `AlreadyExists`, or `Failed`.
+        status_code: HTTP status code of the Kubernetes API server response if the
+            request was sent.
+        error: Exception if the Job failed to be created.
+    """
+
+    name: Optional[str]
+    namespace: str
+    status: str
+    status_code: Optional[int] = None
+    error: Optional[Exception] = None
+
+
+@dataclass
+class ReplicaSummary:
+    """Progress of the Training Job replicas with specific type.
+
+    Attributes:
+        replicas: Desired number of replicas from the Job spec.
+        active: Number of running replicas.
+        succeeded: Number of succeeded replicas.
+        failed: Number of failed replicas.
+    """
+
+    replicas: Optional[int] = None
+    active: int = 0
+    succeeded: int = 0
+    failed: int = 0
+
+
+@dataclass
+class JobSummary:
+    """Summary of the Training Job status.
+
+    Attributes:
+        name: Name of the Job.
+        namespace: Namespace of the Job.
+        kind: Kind of the Job (e.g. `TFJob` or `PyTorchJob`).
+        status: Type of the latest Job condition with status `True`
+            (e.g. `Running` or `Succeeded`).
+        replicas: Progress of the Job replicas for every replica type.
+        creation_timestamp: Time when the Job was created.
+        start_time: Time when the Job was started.
+        completion_time: Time when the Job was completed.
+        duration: Time in seconds from the Job start until the Job completion, or until
+            now if the Job is not completed.
+        condition_durations: Time in seconds from the Job creation until the Job
+            reached every condition with status `True`. For example, the `Running`
+            duration is the time that the Job waited for the replicas to start.
+    """
+
+    name: str
+    namespace: str
+    kind: str
+    status: Optional[str] = None
+    replicas: Dict[str, ReplicaSummary] = field(default_factory=dict)
+    creation_timestamp: Optional[datetime] = None
+    start_time: Optional[datetime] = None
+    completion_time: Optional[datetime] = None
+    duration: Optional[float] = None
+    condition_durations: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class ConnectionPoolStats:
+    """Utilisation of the connection pool to the Kubernetes API server host.
+
+    Attributes:
+        host: Host of the Kubernetes API server.
+        maxsize: Maximum number of connections which are kept in the pool.
+        in_use: Number of connections which are used by the requests.
+        idle: Number of open connections which can be reused.
+        connections: Number of connections which were created. If it keeps growing
+            faster than the number of requests, connections are not reused.
+        requests: Number of requests which were sent.
+    """
+
+    host: str
+    maxsize: int
+    in_use: int
+    idle: int
+    connections: int
+    requests: int
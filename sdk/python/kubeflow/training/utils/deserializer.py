@@ -0,0 +1,365 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import sys
+import threading
+import types
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from dateutil.parser import parse
+from dateutil.tz import tzutc
+from kubeflow.training import models
+from kubeflow.training.exceptions import ApiException
+
+# Decoder converts the JSON data into the object of the specific type.
+Decoder = Callable[[Any], Any]
+
+# Kubernetes serializes timestamps in the RFC 3339 format with UTC time zone,
+# which is parsed without dateutil. Other formats fall back to dateutil.
+UTC_DATETIME_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?Z"
+)
+UTC = tzutc()
+
+PRIMITIVE_TYPES = {
+    "int": int,
+    "long": int,
+    "float": float,
+    "str": str,
+    "bool": bool,
+}
+
+
+class Deserializer:
+    """Deserializer of the JSON data into the Training SDK and Kubernetes models.
+
+    It produces the same objects as `ApiClient.deserialize`, but the type strings
+    (e.g. `list[V1Container]` or `dict(str, KubeflowOrgV1ReplicaSpec)`) are parsed
+    and resolved into decoders only once per type. Decoders of the models contain
+    the list of attributes with their JSON keys and decoders, so deserialization of
+    every object doesn't use regex or `getattr` lookups of the model classes.
+    """
+
+    def __init__(self):
+        self._decoders: Dict[str, Decoder] = {}
+        self._lock = threading.RLock()
+        # Model configuration is shared between objects, since creating it for
+        # every object is expensive.
+        self._configurations: Dict[str, Any] = {}
+        self._lazy_decoders: Dict[str, Decoder] = {}
+
+    def deserialize(self, data: Any, klass: str, lazy: bool = False) -> Any:
+        """Deserialize JSON data (e.g. dict or list) into the object.
+
+        Args:
+            data: JSON data to deserialize.
+            klass: Type of the object, for example: `KubeflowOrgV1PyTorchJob`.
+            lazy: Whether to return the models as `LazyModel` views of the JSON data.
+
+        Returns:
+            object: Deserialized object.
+        """
+        if lazy:
+            return self.get_lazy_decoder(klass)(data)
+        return self.get_decoder(klass)(data)
+
+    def get_decoder(self, klass: str) -> Decoder:
+        """Get the compiled decoder for the type."""
+        decoder = self._decoders.get(klass)
+        if decoder is None:
+            with self._lock:
+                decoder = self._decoders.get(klass)
+                if decoder is None:
+                    decoder = self._compile(klass)
+                    self._decoders[klass] = decoder
+        return decoder
+
+    def get_lazy_decoder(self, klass: str) -> Decoder:
+        """Get the decoder for the type that returns the models as `LazyModel` views."""
+        decoder = self._lazy_decoders.get(klass)
+        if decoder is None:
+            with self._lock:
+                decoder = self._lazy_decoders.get(klass)
+                if decoder is None:
+                    decoder = self._compile_lazy(klass)
+                    self._lazy_decoders[klass] = decoder
+        return decoder
+
+    def _compile_lazy(self, klass: str) -> Decoder:
+        if klass.startswith("list["):
+            sub_decoder = self.get_lazy_decoder(
+                re.match(r"list\[(.*)\]", klass).group(1)
+            )
+
+            def decoder(data):
+                if data is None:
+                    return None
+                return [sub_decoder(sub_data) for sub_data in data]
+
+            return decoder
+
+        if klass.startswith("dict("):
+            sub_decoder = self.get_lazy_decoder(
+                re.match(r"dict\(([^,]*), (.*)\)", klass).group(2)
+            )
+
+            def decoder(data):
+                if data is None:
+                    return None
+                return {k: sub_decoder(v) for k, v in data.items()}
+
+            return decoder
+
+        model = getattr(models, klass, None)
+        # Models with discriminator or without attributes are deserialized eagerly.
+        if (
+            not isinstance(model, type)
+            or not model.openapi_types
+            or getattr(model, "discriminator_value_class_map", None)
+        ):
+            return self.get_decoder(klass)
+
+        def decoder(data):
+            if not isinstance(data, dict):
+                return self.get_decoder(klass)(data)
+            return LazyModel(data, model, self)
+
+        return decoder
+
+    def _compile(self, klass: str) -> Decoder:
+        if klass.startswith("list["):
+            sub_decoder = self.get_decoder(re.match(r"list\[(.*)\]", klass).group(1))
+
+            def decoder(data):
+                if data is None:
+                    return None
+                return [sub_decoder(sub_data) for sub_data in data]
+
+            return decoder
+
+        if klass.startswith("dict("):
+            sub_decoder = self.get_decoder(
+                re.match(r"dict\(([^,]*), (.*)\)", klass).group(2)
+            )
+
+            def decoder(data):
+                if data is None:
+                    return None
+                return {k: sub_decoder(v) for k, v in data.items()}
+
+            return decoder
+
+        if klass in PRIMITIVE_TYPES:
+            return _primitive_decoder(PRIMITIVE_TYPES[klass])
+        if klass == "object":
+            return _decode_object
+        if klass == "date":
+            return _decode_date
+        if klass == "datetime":
+            return _decode_datetime
+        return self._compile_model(klass)
+
+    def _compile_model(self, klass: str) -> Decoder:
+        model = getattr(models, klass)
+        has_discriminator = bool(
+            hasattr(model, "get_real_child_model")
+            and model.discriminator_value_class_map
+        )
+
+        # Models without attributes are returned as is.
+        if not model.openapi_types and not has_discriminator:
+            return _decode_object
+
+        configuration = self._get_configuration(model)
+
+        # Attribute decoders are resolved on the first use, since the nested models
+        # might be recursive or not available until they are present in the data.
+        attributes: List[List[Any]] = [
+            [attr, model.attribute_map[attr], attr_type, None]
+            for attr, attr_type in (model.openapi_types or {}).items()
+        ]
+
+        def decoder(data):
+            if data is None:
+                return None
+            kwargs = {}
+            if isinstance(data, (list, dict)):
+                for attribute in attributes:
+                    attr, key, attr_type, attr_decoder = attribute
+                    if key in data:
+                        if attr_decoder is None:
+                            attr_decoder = attribute[3] = self.get_decoder(attr_type)
+                        kwargs[attr] = attr_decoder(data[key])
+            instance = model(local_vars_configuration=configuration, **kwargs)
+
+            if has_discriminator:
+                klass_name = instance.get_real_child_model(data)
+                if klass_name:
+                    instance = self.deserialize(data, klass_name)
+            return instance
+
+        return decoder
+
+    def _get_configuration(self, model: type) -> Any:
+        # Training SDK and Kubernetes models use their own configuration class,
+        # which is imported into the model module.
+        configuration_class = sys.modules[model.__module__].Configuration
+        key = f"{configuration_class.__module__}.{configuration_class.__name__}"
+        if key not in self._configurations:
+            self._configurations[key] = configuration_class()
+        return self._configurations[key]
+
+
+class LazyModel:
+    """View of the model backed by the raw JSON dict.
+
+    It has the same public attributes and methods as the model, but attributes are
+    deserialized only on the first access. Nested models are returned as lazy views
+    as well, so reading `metadata.name` or `status.conditions` of the Job doesn't
+    build the objects for the Job spec. `isinstance` checks against the model class
+    work for the view. Attributes can be set, but the values are not validated.
+    """
+
+    __slots__ = ("_data", "_model", "_deserializer", "_values")
+
+    def __init__(self, data: Dict[str, Any], model: type, deserializer: Deserializer):
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_deserializer", deserializer)
+        object.__setattr__(self, "_values", {})
+
+    @property
+    def __class__(self):
+        return self._model
+
+    def __getattr__(self, name: str) -> Any:
+        # Private attributes are not part of the model API.
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        values = self._values
+        if name in values:
+            return values[name]
+
+        model = self._model
+        attr_type = model.openapi_types.get(name)
+        if attr_type is None:
+            # Methods of the model only use the public API, so they work for the view.
+            value = getattr(model, name)
+            if isinstance(value, types.FunctionType):
+                return types.MethodType(value, self)
+            return value
+
+        value = self._deserializer.get_lazy_decoder(attr_type)(
+            self._data.get(model.attribute_map[name])
+        )
+        values[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        if name in self.__slots__:
+            object.__setattr__(self, name, value)
+        elif name in self._model.openapi_types:
+            self._values[name] = value
+        else:
+            raise AttributeError(
+                f"{self._model.__name__} object has no attribute {name}"
+            )
+
+    def __eq__(self, other: Any) -> bool:
+        return self._model.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        return self._model.__ne__(self, other)
+
+    def __repr__(self) -> str:
+        return self._model.__repr__(self)
+
+    def __reduce__(self):
+        # Copies of the view share the default deserializer.
+        return _load_lazy_model, (self._data, self._model, self._values)
+
+    __hash__ = None
+
+
+def _load_lazy_model(
+    data: Dict[str, Any], model: type, values: Dict[str, Any]
+) -> LazyModel:
+    lazy_model = LazyModel(data, model, default_deserializer)
+    lazy_model._values.update(values)
+    return lazy_model
+
+
+def _primitive_decoder(klass: type) -> Decoder:
+    def decoder(data):
+        if data is None:
+            return None
+        try:
+            return klass(data)
+        except UnicodeEncodeError:
+            return str(data)
+        except TypeError:
+            return data
+
+    return decoder
+
+
+def _decode_object(data):
+    return data
+
+
+def _decode_date(data):
+    if data is None:
+        return None
+    try:
+        return parse(data).date()
+    except ValueError:
+        raise ApiException(
+            status=0, reason="Failed to parse `{0}` as date object".format(data)
+        )
+
+
+def _decode_datetime(data):
+    if data is None:
+        return None
+    match = UTC_DATETIME_PATTERN.fullmatch(data) if isinstance(data, str) else None
+    if match:
+        year, month, day, hour, minute, second, fraction = match.groups()
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            tzinfo=UTC,
+        )
+    try:
+        return parse(data)
+    except ValueError:
+        raise ApiException(
+            status=0, reason="Failed to parse `{0}` as datetime object".format(data)
+        )
+
+
+# Default deserializer shares compiled decoders across the Training SDK.
+default_deserializer = Deserializer()
+
+
+def deserialize(data: Any, klass: str, lazy: bool = False) -> Any:
+    """Deserialize JSON data into the object with the default deserializer."""
+    return default_deserializer.deserialize(data, klass, lazy)
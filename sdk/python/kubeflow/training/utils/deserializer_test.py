@@ -0,0 +1,121 @@
+import copy
+
+import pytest
+from kubeflow.training import ApiClient, KubeflowOrgV1PyTorchJob
+from kubeflow.training.utils import deserializer, utils
+
+TEST_NAME = "test"
+
+test_data_deserialize = [
+    (
+        "valid flow with PyTorchJob",
+        {
+            "apiVersion": "kubeflow.org/v1",
+            "kind": "PyTorchJob",
+            "metadata": {
+                "name": TEST_NAME,
+                "namespace": "default",
+                "labels": {"app": TEST_NAME},
+                "creationTimestamp": "2024-01-05T22:58:20Z",
+            },
+            "spec": {
+                "pytorchReplicaSpecs": {
+                    "Master": {
+                        "replicas": 1,
+                        "template": {
+                            "spec": {
+                                "containers": [
+                                    {"name": "pytorch", "args": ["--epochs", "1"]}
+                                ]
+                            }
+                        },
+                    }
+                },
+                "runPolicy": {"cleanPodPolicy": "None"},
+            },
+            "status": {
+                "conditions": [
+                    {
+                        "type": "Running",
+                        "status": "True",
+                        "lastTransitionTime": "2024-01-05T22:58:30.123Z",
+                    }
+                ],
+                "replicaStatuses": {"Master": {"active": 1}},
+            },
+        },
+        "KubeflowOrgV1PyTorchJob",
+    ),
+    (
+        "valid flow with list of conditions",
+        [
+            {"type": "Created", "status": "True"},
+            {"type": "Succeeded", "status": "True", "reason": "Completed"},
+        ],
+        "list[KubeflowOrgV1JobCondition]",
+    ),
+    (
+        "valid flow with dict of replica statuses",
+        {"Worker": {"active": 2, "labelSelector": {"matchLabels": {"a": "b"}}}},
+        "dict(str, KubeflowOrgV1ReplicaStatus)",
+    ),
+    (
+        "valid flow with datetime in non UTC time zone",
+        "2024-01-05T22:58:20+01:00",
+        "datetime",
+    ),
+    ("valid flow with primitive type", "10", "int"),
+    ("valid flow with None", None, "KubeflowOrgV1PyTorchJob"),
+]
+
+
+@pytest.mark.parametrize("test_name,data,klass", test_data_deserialize)
+def test_deserialize(test_name, data, klass):
+    """
+    test deserialize function produces the same objects as ApiClient
+    """
+    print("Executing test:", test_name)
+
+    expected = ApiClient().deserialize(utils.FakeResponse(data), klass)
+    assert deserializer.deserialize(data, klass) == expected
+    # Compiled decoder is reused for the second object.
+    assert deserializer.deserialize(data, klass) == expected
+
+    print("test execution complete")
+
+
+@pytest.mark.parametrize("test_name,data,klass", test_data_deserialize)
+def test_deserialize_lazy(test_name, data, klass):
+    """
+    test deserialize function with lazy models produces the same objects as ApiClient
+    """
+    print("Executing test:", test_name)
+
+    expected = ApiClient().deserialize(utils.FakeResponse(data), klass)
+    actual = deserializer.deserialize(data, klass, lazy=True)
+    assert actual == expected
+
+    print("test execution complete")
+
+
+def test_lazy_model():
+    """
+    test attributes of the lazy model are deserialized on the first access
+    """
+    data = test_data_deserialize[0][1]
+    job = deserializer.deserialize(data, "KubeflowOrgV1PyTorchJob", lazy=True)
+
+    assert isinstance(job, KubeflowOrgV1PyTorchJob)
+    assert job._values == {}
+    assert job.metadata.name == TEST_NAME
+    assert list(job._values) == ["metadata"]
+    assert job.status.conditions[0].last_transition_time.microsecond == 123000
+
+    # Attributes are set on the view without modification of the JSON data.
+    job.metadata.name = "new-name"
+    assert job.metadata.name == "new-name"
+    assert data["metadata"]["name"] == TEST_NAME
+    assert copy.deepcopy(job) == job
+
+    with pytest.raises(AttributeError):
+        job.unknown = "value"
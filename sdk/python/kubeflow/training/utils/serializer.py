@@ -0,0 +1,121 @@
+# Copyright 2024 The Kubeflow Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+from datetime import date, datetime
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Tuple
+
+from kubernetes import client
+
+# Plan contains the attribute getters and JSON keys of the model.
+Plan = List[Tuple[Callable[[Any], Any], str]]
+
+PRIMITIVE_TYPES = (float, bool, bytes, str, int)
+
+
+class SerializedObject(dict):
+    """JSON data of the object which is already serialized. It is sent as is."""
+
+
+class Serializer:
+    """Serializer of the Training SDK and Kubernetes models into the JSON data.
+
+    It produces the same data as `ApiClient.sanitize_for_serialization`, but the
+    list of model attributes with their JSON keys is built only once per class,
+    so serialization of every object doesn't iterate over `openapi_types` and
+    `attribute_map` of the model.
+    """
+
+    def __init__(self):
+        self._plans: Dict[type, Plan] = {}
+        self._lock = threading.Lock()
+
+    def serialize(self, obj: Any) -> Any:
+        """Serialize the object into JSON data (e.g. dict or list).
+
+        Args:
+            obj: Object to serialize, for example: KubeflowOrgV1PyTorchJob.
+
+        Returns:
+            object: Serialized data, which can be sent in the request body.
+        """
+        plan = self._plans.get(obj.__class__)
+        if plan is None:
+            if obj is None or isinstance(obj, PRIMITIVE_TYPES):
+                return obj
+            if isinstance(obj, SerializedObject):
+                return obj
+            if isinstance(obj, list):
+                return [self.serialize(sub_obj) for sub_obj in obj]
+            if isinstance(obj, tuple):
+                return tuple(self.serialize(sub_obj) for sub_obj in obj)
+            if isinstance(obj, (datetime, date)):
+                return obj.isoformat()
+            if isinstance(obj, dict):
+                return {key: self.serialize(value) for key, value in obj.items()}
+            plan = self.get_plan(obj.__class__)
+
+        result = {}
+        for getter, key in plan:
+            value = getter(obj)
+            if value is not None:
+                result[key] = self.serialize(value)
+        return result
+
+    def get_plan(self, model: type) -> Plan:
+        """Get the serialization plan for the model class."""
+        plan = self._plans.get(model)
+        if plan is None:
+            with self._lock:
+                plan = [
+                    (attrgetter(attr), model.attribute_map[attr])
+                    for attr in model.openapi_types
+                ]
+                self._plans[model] = plan
+        return plan
+
+
+# Default serializer shares serialization plans across the Training SDK.
+default_serializer = Serializer()
+
+
+class KubernetesApiClient(client.ApiClient):
+    """Kubernetes API client which serializes the request data with the Serializer."""
+
+    def sanitize_for_serialization(self, obj: Any) -> Any:
+        return default_serializer.serialize(obj)
+
+
+def as_serialized(obj: Any) -> Any:
+    """Mark the dict or JSON bytes as serialized, so they are sent as is.
+    Other objects are returned without changes.
+
+    Raises:
+        ValueError: JSON is invalid.
+    """
+    if isinstance(obj, (bytes, str)):
+        try:
+            obj = json.loads(obj)
+        except ValueError:
+            raise ValueError("Serialized Job must be valid JSON")
+    if isinstance(obj, dict) and not isinstance(obj, SerializedObject):
+        return SerializedObject(obj)
+    return obj
+
+
+def serialize(obj: Any) -> Any:
+    """Serialize the object into JSON data with the default serializer."""
+    return default_serializer.serialize(obj)
@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+
+import pytest
+from kubeflow.training import (
+    KubeflowOrgV1JobCondition,
+    KubeflowOrgV1PyTorchJob,
+    KubeflowOrgV1PyTorchJobSpec,
+    KubeflowOrgV1ReplicaSpec,
+    KubeflowOrgV1RunPolicy,
+)
+from kubeflow.training.utils import deserializer, serializer
+from kubernetes.client import (
+    ApiClient,
+    V1Container,
+    V1ObjectMeta,
+    V1PodSpec,
+    V1PodTemplateSpec,
+)
+
+TEST_NAME = "test"
+
+test_data_serialize = [
+    (
+        "valid flow with PyTorchJob",
+        KubeflowOrgV1PyTorchJob(
+            api_version="kubeflow.org/v1",
+            kind="PyTorchJob",
+            metadata=V1ObjectMeta(name=TEST_NAME, labels={"app": TEST_NAME}),
+            spec=KubeflowOrgV1PyTorchJobSpec(
+                run_policy=KubeflowOrgV1RunPolicy(clean_pod_policy=None),
+                pytorch_replica_specs={
+                    "Master": KubeflowOrgV1ReplicaSpec(
+                        replicas=1,
+                        template=V1PodTemplateSpec(
+                            spec=V1PodSpec(
+                                containers=[
+                                    V1Container(name="pytorch", args=["--epochs", 1])
+                                ]
+                            )
+                        ),
+                    )
+                },
+            ),
+        ),
+    ),
+    (
+        "valid flow with list of conditions",
+        [
+            KubeflowOrgV1JobCondition(
+                type="Running",
+                status="True",
+                last_transition_time=datetime(2024, 1, 5, tzinfo=timezone.utc),
+            ),
+        ],
+    ),
+    ("valid flow with tuple", (1, "test", None)),
+    ("valid flow with None", None),
+    (
+        "valid flow with lazy PyTorchJob",
+        deserializer.deserialize(
+            {"kind": "PyTorchJob", "metadata": {"name": TEST_NAME}},
+            "KubeflowOrgV1PyTorchJob",
+            lazy=True,
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize("test_name,obj", test_data_serialize)
+def test_serialize(test_name, obj):
+    """
+    test serialize function produces the same data as ApiClient
+    """
+    print("Executing test:", test_name)
+
+    expected = ApiClient().sanitize_for_serialization(obj)
+    assert serializer.serialize(obj) == expected
+    # Serialization plan is reused for the second object.
+    assert serializer.serialize(obj) == expected
+
+    print("test execution complete")
+
+
+def test_serialized_object():
+    """
+    test serialized object is sent by Kubernetes API client as is
+    """
+    obj = serializer.SerializedObject({"metadata": {"name": TEST_NAME}})
+    api_client = serializer.KubernetesApiClient()
+    assert api_client.sanitize_for_serialization(obj) is obj
@@ -16,18 +16,25 @@ import inspect
 import json
 import logging
 import os
-import queue
+import re
 import textwrap
 import threading
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from kubeflow.training import models
 from kubeflow.training.constants import constants
+from kubeflow.training.types import types
 from kubernetes import config
 
 logger = logging.getLogger(__name__)
 
+# Timestamp of the pod log line in the RFC 3339 format with nanoseconds.
+LOG_TIMESTAMP_PATTERN = re.compile(
+    r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?Z"
+)
+
 
 class StatusLogger:
     """Logger to print Training Job statuses."""
@@ -54,6 +61,35 @@ class FakeResponse:
         self.data = json.dumps(obj)
 
 
+class RateLimiter:
+    """Token bucket rate limiter for requests to the Kubernetes API server.
+    It allows `burst` requests at once and `qps` requests per second on average.
+    """
+
+    def __init__(self, qps: float, burst: int = 1):
+        if qps <= 0:
+            raise ValueError(f"QPS must be greater than 0, but QPS is {qps}")
+        self.qps = qps
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.last_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Wait until the request can be sent."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.last_time) * self.qps
+            )
+            self.last_time = now
+            # Reserve the token, so concurrent callers wait for the next tokens.
+            self.tokens -= 1
+            delay = -self.tokens / self.qps if self.tokens < 0 else 0
+        if delay > 0:
+            time.sleep(delay)
+
+
 class SetEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, set):
@@ -78,25 +114,6 @@ def get_default_target_namespace():
         return f.readline()
 
 
-def wrap_log_stream(q, stream):
-    while True:
-        try:
-            logline = next(stream)
-            q.put(logline)
-        except StopIteration:
-            q.put(None)
-            return
-
-
-def get_log_queue_pool(streams):
-    pool = []
-    for stream in streams:
-        q = queue.Queue(maxsize=100)
-        pool.append(q)
-        threading.Thread(target=wrap_log_stream, args=(q, stream)).start()
-    return pool
-
-
 def has_condition(conditions: List[models.V1JobCondition], condition_type: str) -> bool:
     """
     Verify if the condition list has the required condition.
@@ -390,6 +407,138 @@ def get_pvc_spec(
     return pvc_spec
 
 
+def get_job_pods_label_selector(
+    name: str,
+    is_master: bool = False,
+    replica_type: Optional[str] = None,
+    replica_index: Optional[int] = None,
+) -> str:
+    """Get the Kubernetes label selector for the Training Job pods.
+    See `TrainingClient.get_job_pods` for the arguments.
+
+    Raises:
+        ValueError: Job replica type is invalid.
+    """
+
+    if (
+        replica_type is not None
+        and replica_type not in constants.TFJOB_REPLICA_TYPES
+        and replica_type not in constants.PYTORCHJOB_REPLICA_TYPES
+        and replica_type not in constants.XGBOOSTJOB_REPLICA_TYPES
+        and replica_type not in constants.MPIJOB_REPLICA_TYPES
+        and replica_type not in constants.PADDLEJOB_REPLICA_TYPES
+        and replica_type not in constants.JAXJOB_REPLICA_TYPES
+    ):
+        raise ValueError(
+            f"TFJob replica type must be one of {constants.TFJOB_REPLICA_TYPES}\n"
+            f"PyTorchJob replica type must be one of {constants.PYTORCHJOB_REPLICA_TYPES}\n"
+            f"XGBoostJob replica type must be one of {constants.XGBOOSTJOB_REPLICA_TYPES}\n"
+            f"MPIJob replica type must be one of {constants.MPIJOB_REPLICA_TYPES}\n"
+            f"PaddleJob replica type must be one of {constants.PADDLEJOB_REPLICA_TYPES}"
+            f"JAXJob replica type must be one of {constants.PADDLEJOB_REPLICA_TYPES}"
+        )
+
+    label_selector = f"{constants.JOB_NAME_LABEL}={name}"
+
+    # Add Job role label if that is required.
+    if is_master:
+        label_selector += f",{constants.JOB_ROLE_LABEL}={constants.JOB_ROLE_MASTER}"
+
+    # Add Replica type label if that is required.
+    if replica_type:
+        label_selector += f",{constants.REPLICA_TYPE_LABEL}={str.lower(replica_type)}"
+
+    # Add Replica index label if that is required.
+    if replica_index is not None:
+        label_selector += f",{constants.REPLICA_INDEX_LABEL}={replica_index}"
+    return label_selector
+
+
+def get_job_summary(
+    job: constants.JOB_MODELS_TYPE,
+    job_kind: str,
+    now: Optional[datetime] = None,
+) -> types.JobSummary:
+    """Get the summary of the Training Job status. It reads only the Job metadata,
+    status, and replica counts of the Job spec, so for lazy Jobs other parts of the
+    Job spec are not deserialized.
+
+    Args:
+        job: Job object. For example: KubeflowOrgV1PyTorchJob.
+        job_kind: Kind of the Job (e.g. `TFJob` or `PyTorchJob`).
+        now: Time to measure the duration of the Job which is not completed.
+            By default it is the current time.
+
+    Returns:
+        JobSummary: Summary of the Job status.
+    """
+    now = now or datetime.now(timezone.utc)
+    summary = types.JobSummary(
+        name=job.metadata.name,
+        namespace=job.metadata.namespace,
+        kind=job_kind,
+        creation_timestamp=job.metadata.creation_timestamp,
+    )
+
+    # Every Job kind has its own attribute for the replica specs,
+    # e.g. `pytorch_replica_specs` or `tf_replica_specs`.
+    if job.spec is not None:
+        for attr in job.spec.openapi_types:
+            if attr.endswith("_replica_specs"):
+                for replica_type, spec in (getattr(job.spec, attr) or {}).items():
+                    summary.replicas[replica_type] = types.ReplicaSummary(
+                        replicas=spec.replicas
+                    )
+
+    status = job.status
+    if status is None:
+        return summary
+
+    for replica_type, replica_status in (status.replica_statuses or {}).items():
+        replica_summary = summary.replicas.setdefault(
+            replica_type, types.ReplicaSummary()
+        )
+        replica_summary.active = replica_status.active or 0
+        replica_summary.succeeded = replica_status.succeeded or 0
+        replica_summary.failed = replica_status.failed or 0
+
+    # Conditions without timestamps are kept in the original order before others.
+    conditions = sorted(
+        (
+            c
+            for c in status.conditions or []
+            if c.status == constants.CONDITION_STATUS_TRUE
+        ),
+        key=lambda c: (c.last_transition_time is not None, c.last_transition_time),
+    )
+    creation_timestamp = job.metadata.creation_timestamp
+    for condition in conditions:
+        if (
+            creation_timestamp is not None
+            and condition.last_transition_time is not None
+        ):
+            summary.condition_durations[condition.type] = max(
+                (condition.last_transition_time - creation_timestamp).total_seconds(),
+                0,
+            )
+    if conditions:
+        summary.status = conditions[-1].type
+
+    summary.start_time = status.start_time
+    summary.completion_time = status.completion_time
+    start_time = status.start_time or creation_timestamp
+    end_time = status.completion_time
+    if end_time is None and summary.status in (
+        constants.JOB_CONDITION_SUCCEEDED,
+        constants.JOB_CONDITION_FAILED,
+    ):
+        end_time = conditions[-1].last_transition_time
+    if start_time is not None:
+        summary.duration = max(((end_time or now) - start_time).total_seconds(), 0)
+
+    return summary
+
+
 def add_event_to_dict(
     events_dict: Dict[str, List[str]],
     event: models.CoreV1Event,
@@ -414,3 +563,54 @@ def add_event_to_dict(
             events_dict[event_key] = [event_msg]
         else:
             events_dict[event_key] += [event_msg]
+
+
+def add_events_to_dict(
+    events_dict: Dict[str, List[str]],
+    events: List[models.CoreV1Event],
+    objects: Dict[Tuple[str, str], datetime],
+):
+    """Add Kubernetes events to the dict in the same format as `add_event_to_dict`.
+    Events are matched to the objects with the index, so every event is checked
+    only once regardless of the number of objects.
+
+    Args:
+        events_dict: Dict to add the events.
+        events: List of Kubernetes events.
+        objects: Dict in which the keys are object kind and name, and the values
+            are object creation timestamps. Events created before the object
+            are skipped.
+    """
+    for event in events:
+        object_kind, object_name = (
+            event.involved_object.kind,
+            event.involved_object.name,
+        )
+        object_creation_timestamp = objects.get((object_kind, object_name))
+        if object_creation_timestamp is not None:
+            add_event_to_dict(
+                events_dict,
+                event,
+                object_kind,
+                object_name,
+                object_creation_timestamp,
+            )
+
+
+def split_log_timestamp(logline: str) -> Tuple[Optional[datetime], str]:
+    """Split the pod log line which is read with `timestamps=True` into the
+    timestamp and the log line. If the line doesn't have the timestamp, the
+    timestamp is None.
+    """
+    timestamp, _, line = logline.partition(" ")
+    match = LOG_TIMESTAMP_PATTERN.fullmatch(timestamp)
+    if match is None:
+        return None, logline
+
+    seconds, fraction = match.groups()
+    result = datetime.strptime(seconds, "%Y-%m-%dT%H:%M:%S").replace(
+        tzinfo=timezone.utc
+    )
+    if fraction:
+        result = result.replace(microsecond=int(fraction[:6].ljust(6, "0")))
+    return result, line
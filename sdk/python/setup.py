@@ -65,5 +65,6 @@ setuptools.setup(
     extras_require={
         "test": TESTS_REQUIRES,
         "huggingface": ["transformers==4.38.0", "peft==0.3.0"],
+        "async": ["aiohttp>=3.8"],
     },
 )
@@ -46,6 +46,15 @@ class KubeflowOrgV2alpha1ClusterTrainingRuntime(object):
         'spec': 'spec'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_spec',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, spec=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1ClusterTrainingRuntime - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -46,6 +46,15 @@ class KubeflowOrgV2alpha1ClusterTrainingRuntimeList(object):
         'metadata': 'metadata'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_version',
+        '_items',
+        '_kind',
+        '_metadata',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, items=None, kind=None, metadata=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1ClusterTrainingRuntimeList - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -50,6 +50,17 @@ class KubeflowOrgV2alpha1ContainerOverride(object):
         'volume_mounts': 'volumeMounts'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_args',
+        '_command',
+        '_env',
+        '_env_from',
+        '_name',
+        '_volume_mounts',
+        'discriminator',
+    )
+
     def __init__(self, args=None, command=None, env=None, env_from=None, name='', volume_mounts=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1ContainerOverride - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -40,6 +40,12 @@ class KubeflowOrgV2alpha1CoschedulingPodGroupPolicySource(object):
         'schedule_timeout_seconds': 'scheduleTimeoutSeconds'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_schedule_timeout_seconds',
+        'discriminator',
+    )
+
     def __init__(self, schedule_timeout_seconds=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1CoschedulingPodGroupPolicySource - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
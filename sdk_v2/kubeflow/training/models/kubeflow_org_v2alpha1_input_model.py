@@ -44,6 +44,14 @@ class KubeflowOrgV2alpha1InputModel(object):
         'storage_uri': 'storageUri'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_env',
+        '_secret_ref',
+        '_storage_uri',
+        'discriminator',
+    )
+
     def __init__(self, env=None, secret_ref=None, storage_uri=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1InputModel - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class KubeflowOrgV2alpha1JobSetTemplateSpec(object):
         'spec': 'spec'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_metadata',
+        '_spec',
+        'discriminator',
+    )
+
     def __init__(self, metadata=None, spec=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1JobSetTemplateSpec - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
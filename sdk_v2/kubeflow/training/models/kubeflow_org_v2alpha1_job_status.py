@@ -50,6 +50,17 @@ class KubeflowOrgV2alpha1JobStatus(object):
         'suspended': 'suspended'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_active',
+        '_failed',
+        '_name',
+        '_ready',
+        '_succeeded',
+        '_suspended',
+        'discriminator',
+    )
+
     def __init__(self, active=0, failed=0, name='', ready=0, succeeded=0, suspended=0, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1JobStatus - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -44,6 +44,14 @@ class KubeflowOrgV2alpha1MLPolicy(object):
         'torch': 'torch'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_mpi',
+        '_num_nodes',
+        '_torch',
+        'discriminator',
+    )
+
     def __init__(self, mpi=None, num_nodes=None, torch=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1MLPolicy - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
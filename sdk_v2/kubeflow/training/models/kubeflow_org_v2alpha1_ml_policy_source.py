@@ -42,6 +42,13 @@ class KubeflowOrgV2alpha1MLPolicySource(object):
         'torch': 'torch'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_mpi',
+        '_torch',
+        'discriminator',
+    )
+
     def __init__(self, mpi=None, torch=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1MLPolicySource - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class KubeflowOrgV2alpha1ModelConfig(object):
         'output': 'output'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_input',
+        '_output',
+        'discriminator',
+    )
+
     def __init__(self, input=None, output=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1ModelConfig - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -46,6 +46,15 @@ class KubeflowOrgV2alpha1MPIMLPolicySource(object):
         'ssh_auth_mount_path': 'sshAuthMountPath'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_mpi_implementation',
+        '_num_proc_per_node',
+        '_run_launcher_as_node',
+        '_ssh_auth_mount_path',
+        'discriminator',
+    )
+
     def __init__(self, mpi_implementation=None, num_proc_per_node=None, run_launcher_as_node=None, ssh_auth_mount_path=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1MPIMLPolicySource - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -40,6 +40,12 @@ class KubeflowOrgV2alpha1PodGroupPolicySource(object):
         'coscheduling': 'coscheduling'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_coscheduling',
+        'discriminator',
+    )
+
     def __init__(self, coscheduling=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1PodGroupPolicySource - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
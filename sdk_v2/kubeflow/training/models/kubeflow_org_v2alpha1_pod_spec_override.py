@@ -52,6 +52,18 @@ class KubeflowOrgV2alpha1PodSpecOverride(object):
         'volumes': 'volumes'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_containers',
+        '_init_containers',
+        '_node_selector',
+        '_service_account_name',
+        '_target_jobs',
+        '_tolerations',
+        '_volumes',
+        'discriminator',
+    )
+
     def __init__(self, containers=None, init_containers=None, node_selector=None, service_account_name=None, target_jobs=None, tolerations=None, volumes=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1PodSpecOverride - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
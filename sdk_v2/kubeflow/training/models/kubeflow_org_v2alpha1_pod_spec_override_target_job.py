@@ -40,6 +40,12 @@ class KubeflowOrgV2alpha1PodSpecOverrideTargetJob(object):
         'name': 'name'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_name',
+        'discriminator',
+    )
+
     def __init__(self, name='', local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1PodSpecOverrideTargetJob - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -44,6 +44,14 @@ class KubeflowOrgV2alpha1RuntimeRef(object):
         'name': 'name'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_api_group',
+        '_kind',
+        '_name',
+        'discriminator',
+    )
+
     def __init__(self, api_group=None, kind=None, name='', local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1RuntimeRef - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -46,6 +46,15 @@ class KubeflowOrgV2alpha1TorchElasticPolicy(object):
         'min_nodes': 'minNodes'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_max_nodes',
+        '_max_restarts',
+        '_metrics',
+        '_min_nodes',
+        'discriminator',
+    )
+
     def __init__(self, max_nodes=None, max_restarts=None, metrics=None, min_nodes=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1TorchElasticPolicy - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class KubeflowOrgV2alpha1TorchMLPolicySource(object):
         'num_proc_per_node': 'numProcPerNode'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_elastic_policy',
+        '_num_proc_per_node',
+        'discriminator',
+    )
+
     def __init__(self, elastic_policy=None, num_proc_per_node=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1TorchMLPolicySource - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
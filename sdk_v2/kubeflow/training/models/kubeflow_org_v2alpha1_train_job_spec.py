@@ -56,6 +56,20 @@ class KubeflowOrgV2alpha1TrainJobSpec(object):
         'trainer': 'trainer'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_annotations',
+        '_dataset_config',
+        '_labels',
+        '_managed_by',
+        '_model_config',
+        '_pod_spec_overrides',
+        '_runtime_ref',
+        '_suspend',
+        '_trainer',
+        'discriminator',
+    )
+
     def __init__(self, annotations=None, dataset_config=None, labels=None, managed_by=None, model_config=None, pod_spec_overrides=None, runtime_ref=None, suspend=None, trainer=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1TrainJobSpec - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -42,6 +42,13 @@ class KubeflowOrgV2alpha1TrainJobStatus(object):
         'jobs_status': 'jobsStatus'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_conditions',
+        '_jobs_status',
+        'discriminator',
+    )
+
     def __init__(self, conditions=None, jobs_status=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1TrainJobStatus - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -52,6 +52,18 @@ class KubeflowOrgV2alpha1Trainer(object):
         'resources_per_node': 'resourcesPerNode'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_args',
+        '_command',
+        '_env',
+        '_image',
+        '_num_nodes',
+        '_num_proc_per_node',
+        '_resources_per_node',
+        'discriminator',
+    )
+
     def __init__(self, args=None, command=None, env=None, image=None, num_nodes=None, num_proc_per_node=None, resources_per_node=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1Trainer - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None:
@@ -44,6 +44,14 @@ class KubeflowOrgV2alpha1TrainingRuntimeSpec(object):
         'template': 'template'
     }
 
+    __slots__ = (
+        'local_vars_configuration',
+        '_ml_policy',
+        '_pod_group_policy',
+        '_template',
+        'discriminator',
+    )
+
     def __init__(self, ml_policy=None, pod_group_policy=None, template=None, local_vars_configuration=None):  # noqa: E501
         """KubeflowOrgV2alpha1TrainingRuntimeSpec - a model defined in OpenAPI"""  # noqa: E501
         if local_vars_configuration is None: